@@ -0,0 +1 @@
+# Example scripts for OpenAGI Lux automation
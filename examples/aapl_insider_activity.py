@@ -13,39 +13,66 @@ Based on official OpenAGI Lux examples.
 Usage:
     python aapl_insider_activity.py
     python aapl_insider_activity.py --symbol MSFT
+    python aapl_insider_activity.py --symbols AAPL MSFT GOOGL --batch
+    python aapl_insider_activity.py --symbols AAPL MSFT GOOGL --output insider.jsonl
     python aapl_insider_activity.py --verbose
 """
 
 import asyncio
 import argparse
-from dataclasses import dataclass
-from typing import List, Optional
-from datetime import datetime
+import functools
+import importlib.util
+import json
+import logging
+import re
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, List, Optional, Tuple
+from datetime import datetime, timezone
 import sys
 import os
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Only add the project root to sys.path when run as a plain script;
+# `python -m examples.<name>` from the project root already resolves src.
+if importlib.util.find_spec("src") is None:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.cache import ResultCache
+from src.rate_limit import AsyncRateLimiter
+
+try:
+    import orjson  # Optional: faster result encoding
+except ImportError:
+    orjson = None
 
 try:
     from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+    from oagi import ImageConfig
 except ImportError:
     print("Error: oagi package not installed. Run: pip install oagi")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
+# Screenshots are downscaled and JPEG-encoded: much cheaper to encode and
+# upload than full-resolution PNG, which cuts per-step latency.
+SCREENSHOT_CONFIG = ImageConfig(max_width=1280, max_height=720, quality=75, format="jpeg")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InsiderTransaction:
     """Represents a single insider transaction."""
     insider_name: str
     title: str
-    transaction_type: str  # Buy, Sell, Exercise
+    transaction_type: str  # As shown by NASDAQ, e.g. Buy, Automatic Sell
     shares: int
     price: float
     date: str
     value: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class InsiderActivityResult:
     """Result of insider activity extraction."""
     symbol: str
@@ -56,9 +83,178 @@ class InsiderActivityResult:
     error_message: str = ""
 
 
+# Instruction templates, filled per call with str.format
+INSIDER_INSTRUCTION = """
+    1. Navigate to https://www.nasdaq.com
+    2. Click on the search box or search icon
+    3. Type '{symbol}' in the search field
+    4. Click on the stock result for {symbol}
+    5. Wait for the stock page to load
+    6. Find and click on 'Insider Activity' tab or link
+    7. Wait for insider activity data to load
+    8. For each recent transaction in the table, extract:
+       - Insider name
+       - Title/Position
+       - Transaction type (Buy/Sell/Exercise)
+       - Number of shares
+       - Share price
+       - Transaction date
+    9. Save the extracted data to {output_path}, one transaction per line as:
+       Name | Title | Type | Shares | Price | Date
+    """
+
+BATCH_INSIDER_INSTRUCTION = """
+    1. Navigate to https://www.nasdaq.com
+    2. For each of the following symbols, in order: {symbol_list}
+       a. Click on the search box or search icon
+       b. Type the symbol in the search field
+       c. Click on the stock result for the symbol
+       d. Find and click on 'Insider Activity' tab or link
+       e. Wait for insider activity data to load
+       f. For each recent transaction in the table, extract:
+          - Insider name
+          - Title/Position
+          - Transaction type (Buy/Sell/Exercise)
+          - Number of shares
+          - Share price
+          - Transaction date
+       g. Record the extracted data under a '=== SYMBOL ===' header line
+       h. Click the NASDAQ logo to return to the home page
+    3. Save the extracted data for all symbols to {output_path}, keeping
+       each symbol's '=== SYMBOL ===' header line, one transaction per line
+       as: Name | Title | Type | Shares | Price | Date
+    """
+
+# One saved row per transaction: Name | Title | Type | Shares | Price | Date.
+# The type is kept as NASDAQ shows it (e.g. "Option Exercise", "Automatic
+# Sell"); header rows are skipped because their shares column is not a number.
+# Compiled once; the pattern has no nested quantifiers, so matching stays
+# linear in the input size.
+TRANSACTION_ROW = re.compile(
+    r"^[ \t]*(?P<name>[^|\n]+?)[ \t]*\|[ \t]*(?P<title>[^|\n]*?)[ \t]*\|"
+    r"[ \t]*(?P<type>[^|\n]+?)[ \t]*\|[ \t]*(?P<shares>[\d,]+)[ \t]*\|"
+    r"[ \t]*\$?(?P<price>[\d,]*\.?\d+)[ \t]*\|[ \t]*(?P<date>[^|\n]+?)[ \t]*$",
+    re.MULTILINE
+)
+
+# '=== SYMBOL ===' line starting each symbol's rows in batch output
+SYMBOL_HEADER = re.compile(r"^[ \t]*===[ \t]*(?P<symbol>[^=\s]+)[ \t]*===[ \t]*$", re.MULTILINE)
+
+
+def parse_transactions(text: str) -> List[InsiderTransaction]:
+    """
+    Parse insider transactions from text saved by the agent.
+
+    Lines that do not match the expected row format (headers, blank
+    lines, symbol separators) are skipped.
+
+    Args:
+        text: Saved text with one transaction per line
+
+    Returns:
+        List of InsiderTransaction in input order
+    """
+    transactions = []
+    for match in TRANSACTION_ROW.finditer(text):
+        shares = int(match["shares"].replace(",", ""))
+        price = float(match["price"].replace(",", ""))
+        transactions.append(InsiderTransaction(
+            insider_name=match["name"],
+            title=match["title"],
+            transaction_type=match["type"],
+            shares=shares,
+            price=price,
+            date=match["date"],
+            value=shares * price
+        ))
+    return transactions
+
+
+def split_symbol_sections(text: str) -> dict:
+    """
+    Split batch output into the text under each '=== SYMBOL ===' header.
+
+    Returns:
+        dict mapping upper-cased symbols to their section text
+    """
+    headers = list(SYMBOL_HEADER.finditer(text))
+    return {
+        header["symbol"].upper(): text[header.end():nxt.start() if nxt else len(text)]
+        for header, nxt in zip(headers, headers[1:] + [None])
+    }
+
+
+def _read_output(path: str) -> Optional[str]:
+    """Text the agent saved to path, or None if it saved nothing."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read() or None
+    except OSError:
+        return None
+
+
+# Insider filings change at most once per day, so results are cached per
+# (symbol, UTC day).
+DEFAULT_CACHE_TTL = 6 * 3600
+_cache = ResultCache("insider")
+
+
+def _cache_key(symbol: str) -> str:
+    """Build the cache key for a symbol on the current UTC day."""
+    return f"{symbol.upper()}:{datetime.now(timezone.utc):%Y-%m-%d}"
+
+
+def _result_from_cache(data: dict) -> InsiderActivityResult:
+    """Rebuild an InsiderActivityResult from its cached dict form."""
+    transactions = [InsiderTransaction(**t) for t in data.pop("transactions")]
+    return InsiderActivityResult(transactions=transactions, **data)
+
+
+def encode_result(result: InsiderActivityResult) -> bytes:
+    """
+    Encode a result as JSON bytes for transfer between processes.
+
+    Bytes are cheap to pickle through a multiprocessing.Queue, unlike the
+    dataclass itself. Use decode_result on the receiving side.
+    """
+    if orjson is not None:
+        return orjson.dumps(result)
+    return json.dumps(asdict(result)).encode("utf-8")
+
+
+def decode_result(data: bytes) -> InsiderActivityResult:
+    """Decode bytes produced by encode_result."""
+    loads = orjson.loads if orjson is not None else json.loads
+    return _result_from_cache(loads(data))
+
+
+# Agent step budget for fetching one symbol
+SYMBOL_MAX_STEPS = 15
+
+
+def _new_agent(max_steps: int, verbose: bool) -> AsyncDefaultAgent:
+    """Create an Actor-mode agent for one session."""
+    return AsyncDefaultAgent(
+        max_steps=max_steps,
+        model="lux-actor-1",  # Actor mode for speed
+        verbose=verbose
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_agent(max_steps: int, verbose: bool) -> AsyncDefaultAgent:
+    """Return a shared Actor-mode agent so its client is reused across calls."""
+    return _new_agent(max_steps, verbose)
+
+
 async def get_insider_activity(
     symbol: str = "AAPL",
-    verbose: bool = False
+    verbose: bool = False,
+    use_cache: bool = True,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    action_handler: Optional[AsyncPyautoguiActionHandler] = None,
+    image_provider: Optional[AsyncScreenshotMaker] = None,
+    agent: Optional[AsyncDefaultAgent] = None
 ) -> InsiderActivityResult:
     """
     Fetch insider activity from NASDAQ using Actor mode.
@@ -69,55 +265,60 @@ async def get_insider_activity(
     Args:
         symbol: Stock ticker symbol (default: AAPL)
         verbose: Enable verbose logging
+        use_cache: Return today's cached result for the symbol if present
+        cache_ttl: Maximum age in seconds of a cached result
+        action_handler: Action handler to reuse (created if not given)
+        image_provider: Screenshot provider to reuse (created if not given)
+        agent: Agent to run the session with (the shared one if not given)
 
     Returns:
         InsiderActivityResult with extracted transaction data
     """
-    start_time = datetime.now()
+    cache_key = _cache_key(symbol)
+    if use_cache:
+        cached = _cache.get(cache_key, ttl=cache_ttl)
+        if cached is not None:
+            return _result_from_cache(cached)
 
-    agent = AsyncDefaultAgent(
-        max_steps=15,
-        model="lux-actor-1",  # Actor mode for speed
-        verbose=verbose
-    )
+    start_time = time.perf_counter()
 
-    instruction = f"""
-    1. Navigate to https://www.nasdaq.com
-    2. Click on the search box or search icon
-    3. Type '{symbol}' in the search field
-    4. Click on the stock result for {symbol}
-    5. Wait for the stock page to load
-    6. Find and click on 'Insider Activity' tab or link
-    7. Wait for insider activity data to load
-    8. For each recent transaction in the table, extract:
-       - Insider name
-       - Title/Position
-       - Transaction type (Buy/Sell/Exercise)
-       - Number of shares
-       - Share price
-       - Transaction date
-    9. Copy the extracted data to clipboard
-    """
+    agent = agent or _get_agent(SYMBOL_MAX_STEPS, verbose)
 
     try:
-        result = await agent.execute(
-            instruction,
-            action_handler=AsyncPyautoguiActionHandler(),
-            image_provider=AsyncScreenshotMaker()
-        )
-
-        execution_time = (datetime.now() - start_time).total_seconds()
-
-        return InsiderActivityResult(
+        with tempfile.TemporaryDirectory() as workdir:
+            output_path = os.path.join(workdir, "transactions.txt")
+            result = await agent.execute(
+                INSIDER_INSTRUCTION.format(symbol=symbol, output_path=output_path),
+                action_handler=action_handler or AsyncPyautoguiActionHandler(),
+                image_provider=image_provider or AsyncScreenshotMaker(config=SCREENSHOT_CONFIG)
+            )
+            text = _read_output(output_path) if result else None
+
+        execution_time = time.perf_counter() - start_time
+
+        if text is None:
+            return InsiderActivityResult(
+                symbol=symbol,
+                company_name="",
+                transactions=[],
+                extraction_time=execution_time,
+                success=False,
+                error_message="No insider activity data was extracted"
+            )
+
+        activity = InsiderActivityResult(
             symbol=symbol,
             company_name=f"{symbol} Inc.",
-            transactions=[],  # Would be populated from clipboard/result
+            transactions=parse_transactions(text),
             extraction_time=execution_time,
-            success=result if isinstance(result, bool) else True
+            success=True
         )
+        _cache.set(cache_key, asdict(activity))
+
+        return activity
 
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         return InsiderActivityResult(
             symbol=symbol,
             company_name="",
@@ -128,36 +329,243 @@ async def get_insider_activity(
         )
 
 
+async def _fetch_symbols(
+    symbols: List[str],
+    on_result: Callable[[str, InsiderActivityResult], None],
+    verbose: bool,
+    concurrency: int,
+    use_cache: bool,
+    cache_ttl: float,
+    rate_limit: Optional[float]
+) -> None:
+    """Fetch symbols concurrently, passing each result to on_result as it completes."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = AsyncRateLimiter(rate_limit) if rate_limit else None
+    # One session at a time can reuse the shared agent and handlers;
+    # concurrent sessions each get their own
+    shared = concurrency <= 1
+    if shared:
+        action_handler = AsyncPyautoguiActionHandler()
+        image_provider = AsyncScreenshotMaker(config=SCREENSHOT_CONFIG)
+
+    async def fetch(i: int, symbol: str) -> None:
+        async with semaphore:
+            if limiter is not None:
+                await limiter.acquire()
+            logger.info("[%d/%d] Fetching %s...", i, len(symbols), symbol)
+            if shared:
+                session = {"action_handler": action_handler, "image_provider": image_provider}
+            else:
+                session = {
+                    "action_handler": AsyncPyautoguiActionHandler(),
+                    "image_provider": AsyncScreenshotMaker(config=SCREENSHOT_CONFIG),
+                    "agent": _new_agent(SYMBOL_MAX_STEPS, verbose),
+                }
+            result = await get_insider_activity(
+                symbol,
+                verbose,
+                use_cache=use_cache,
+                cache_ttl=cache_ttl,
+                **session
+            )
+
+        if result.success:
+            logger.info("    [%s] Success in %.2fs", symbol, result.extraction_time)
+        else:
+            logger.warning("    [%s] Failed: %s", symbol, result.error_message)
+        on_result(symbol, result)
+
+    # The task group cancels every in-flight session if one fails or the
+    # run is interrupted, so no agent keeps driving the desktop after exit
+    async with asyncio.TaskGroup() as group:
+        for i, symbol in enumerate(symbols, 1):
+            group.create_task(fetch(i, symbol))
+
+
 async def get_multiple_stocks(
     symbols: List[str],
-    verbose: bool = False
+    verbose: bool = False,
+    concurrency: int = 1,
+    use_cache: bool = True,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    rate_limit: Optional[float] = None
 ) -> dict:
     """
     Fetch insider activity for multiple stock symbols.
 
+    Symbols are fetched concurrently, with at most `concurrency` agent
+    sessions in flight at once. Values above 1 require isolated desktop
+    sessions (e.g. OSGym environments), since each session drives its own
+    mouse and keyboard.
+
     Args:
         symbols: List of stock ticker symbols
         verbose: Enable verbose logging
+        concurrency: Maximum number of concurrent agent sessions
+        use_cache: Reuse today's cached results where present
+        cache_ttl: Maximum age in seconds of a cached result
+        rate_limit: Maximum agent sessions started per minute (None for no limit)
 
     Returns:
         dict mapping symbols to their InsiderActivityResult
     """
     results = {}
+    await _fetch_symbols(
+        symbols, results.__setitem__, verbose, concurrency, use_cache, cache_ttl, rate_limit
+    )
+    return {symbol: results[symbol] for symbol in symbols}
 
-    for i, symbol in enumerate(symbols, 1):
-        print(f"\n[{i}/{len(symbols)}] Fetching {symbol}...")
-        result = await get_insider_activity(symbol, verbose)
-        results[symbol] = result
 
-        status = "Success" if result.success else f"Failed: {result.error_message}"
-        print(f"    Status: {status}")
-        print(f"    Time: {result.extraction_time:.2f}s")
+def _completed_symbols(output_path: str) -> set:
+    """Return the symbols already fetched successfully in a JSONL output file."""
+    completed = set()
+    try:
+        with open(output_path, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Partial line from an interrupted run
+                if record.get("success"):
+                    completed.add(record["symbol"])
+    except FileNotFoundError:
+        pass
+    return completed
+
+
+async def stream_multiple_stocks(
+    symbols: List[str],
+    output_path: str,
+    verbose: bool = False,
+    concurrency: int = 1,
+    use_cache: bool = True,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    rate_limit: Optional[float] = None
+) -> Tuple[int, int]:
+    """
+    Fetch insider activity for multiple symbols, appending results to JSONL.
 
-        # Brief pause between requests
-        if i < len(symbols):
-            await asyncio.sleep(2)
+    Each result is written as one JSON line as soon as it completes, so
+    only the success/failure counts are kept in memory. Symbols already
+    fetched successfully in an existing output file are skipped, which
+    lets an interrupted run resume where it stopped.
 
-    return results
+    Args:
+        symbols: List of stock ticker symbols
+        output_path: JSONL file to append results to
+        verbose: Enable verbose logging
+        concurrency: Maximum number of concurrent agent sessions
+        use_cache: Reuse today's cached results where present
+        cache_ttl: Maximum age in seconds of a cached result
+        rate_limit: Maximum agent sessions started per minute (None for no limit)
+
+    Returns:
+        Tuple of (successful, failed) counts for the symbols fetched
+    """
+    completed = _completed_symbols(output_path)
+    pending = [symbol for symbol in symbols if symbol not in completed]
+    if len(pending) < len(symbols):
+        logger.info("Skipping %d symbols already in %s", len(symbols) - len(pending), output_path)
+
+    counts = [0, 0]
+
+    with open(output_path, "ab") as f:
+        def write_result(symbol: str, result: InsiderActivityResult) -> None:
+            f.write(encode_result(result) + b"\n")
+            f.flush()
+            counts[0 if result.success else 1] += 1
+
+        await _fetch_symbols(
+            pending, write_result, verbose, concurrency, use_cache, cache_ttl, rate_limit
+        )
+
+    return counts[0], counts[1]
+
+
+async def get_insider_activity_batch(
+    symbols: List[str],
+    verbose: bool = False,
+    use_cache: bool = True,
+    cache_ttl: float = DEFAULT_CACHE_TTL
+) -> dict:
+    """
+    Fetch insider activity for multiple symbols in a single agent session.
+
+    All symbols share the same site and navigation path, so one session
+    navigates to NASDAQ once and extracts each symbol in turn instead of
+    paying the navigation and page-load cost per symbol. Symbols the batch
+    session did not extract (or all of them, if it failed) are fetched
+    individually as a fallback.
+
+    Args:
+        symbols: List of stock ticker symbols
+        verbose: Enable verbose logging
+        use_cache: Reuse today's cached results where present
+        cache_ttl: Maximum age in seconds of a cached result
+
+    Returns:
+        dict mapping symbols to their InsiderActivityResult
+    """
+    results = {}
+    pending = []
+
+    for symbol in symbols:
+        cached = _cache.get(_cache_key(symbol), ttl=cache_ttl) if use_cache else None
+        if cached is not None:
+            results[symbol] = _result_from_cache(cached)
+        else:
+            pending.append(symbol)
+
+    if not pending:
+        return results
+
+    start_time = time.perf_counter()
+
+    agent = _get_agent(8 * len(pending), verbose)
+
+    sections = {}
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            output_path = os.path.join(workdir, "transactions.txt")
+            completed = await agent.execute(
+                BATCH_INSIDER_INSTRUCTION.format(
+                    symbol_list=", ".join(pending), output_path=output_path
+                ),
+                action_handler=AsyncPyautoguiActionHandler(),
+                image_provider=AsyncScreenshotMaker(config=SCREENSHOT_CONFIG)
+            )
+            text = _read_output(output_path) if completed else None
+        if text is not None:
+            sections = split_symbol_sections(text)
+    except Exception as e:
+        logger.warning("Batch session failed (%s), falling back to per-symbol fetch", e)
+
+    # Only symbols with their own section were extracted; the session cost
+    # is shared evenly across them
+    extracted = [symbol for symbol in pending if symbol.upper() in sections]
+    if extracted:
+        execution_time = (time.perf_counter() - start_time) / len(extracted)
+
+    for symbol in extracted:
+        activity = InsiderActivityResult(
+            symbol=symbol,
+            company_name=f"{symbol} Inc.",
+            transactions=parse_transactions(sections[symbol.upper()]),
+            extraction_time=execution_time,
+            success=True
+        )
+        _cache.set(_cache_key(symbol), asdict(activity))
+        results[symbol] = activity
+
+    missing = [symbol for symbol in pending if symbol not in results]
+    if missing:
+        if extracted:
+            logger.warning("Batch session missed %s, fetching individually", ", ".join(missing))
+        results.update(await get_multiple_stocks(
+            missing, verbose, use_cache=use_cache, cache_ttl=cache_ttl
+        ))
+
+    return {symbol: results[symbol] for symbol in symbols}
 
 
 def print_results(result: InsiderActivityResult):
@@ -181,14 +589,14 @@ def print_results(result: InsiderActivityResult):
             print()
     else:
         print("\n  No transaction data extracted.")
-        print("  (In production, transactions would be parsed from execution results)")
 
     if result.error_message:
         print(f"\nError: {result.error_message}")
 
 
-def parse_args():
-    """Parse command line arguments."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Fetch insider activity from NASDAQ using Lux Actor mode"
     )
@@ -202,18 +610,59 @@ def parse_args():
         nargs="+",
         help="Multiple stock symbols to fetch"
     )
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        default=1,
+        help="Max concurrent sessions for --symbols (default: 1; >1 needs isolated desktops)"
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        help="Max agent sessions started per minute for --symbols (default: no limit)"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        help="Append --symbols results to this JSONL file as they complete, "
+             "skipping symbols already fetched (not used with --batch)"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Fetch all --symbols in a single agent session"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached results and always run the agent"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help=f"Max age of cached results in seconds (default: {DEFAULT_CACHE_TTL})"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
         help="Enable verbose output"
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args():
+    """Parse command line arguments."""
+    return _build_parser().parse_args()
 
 
 async def main():
     """Main entry point."""
     args = parse_args()
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(message)s"
+    )
 
     print("=" * 60)
     print("NASDAQ Insider Activity - Actor Mode Example")
@@ -224,7 +673,39 @@ async def main():
     if args.symbols:
         # Multiple symbols
         print(f"Symbols: {', '.join(args.symbols)}")
-        results = await get_multiple_stocks(args.symbols, args.verbose)
+        if args.batch:
+            results = await get_insider_activity_batch(
+                args.symbols,
+                args.verbose,
+                use_cache=not args.no_cache,
+                cache_ttl=args.cache_ttl
+            )
+        elif args.output:
+            successful, failed = await stream_multiple_stocks(
+                args.symbols,
+                args.output,
+                args.verbose,
+                concurrency=args.concurrency,
+                use_cache=not args.no_cache,
+                cache_ttl=args.cache_ttl,
+                rate_limit=args.rate_limit
+            )
+
+            print("\n" + "=" * 60)
+            print("SUMMARY")
+            print("=" * 60)
+            print(f"  Fetched: {successful} OK, {failed} FAIL")
+            print(f"  Results: {args.output}")
+            return 0 if failed == 0 else 1
+        else:
+            results = await get_multiple_stocks(
+                args.symbols,
+                args.verbose,
+                concurrency=args.concurrency,
+                use_cache=not args.no_cache,
+                cache_ttl=args.cache_ttl,
+                rate_limit=args.rate_limit
+            )
 
         print("\n" + "=" * 60)
         print("SUMMARY")
@@ -236,12 +717,23 @@ async def main():
     else:
         # Single symbol
         print(f"Symbol: {args.symbol}")
-        result = await get_insider_activity(args.symbol, args.verbose)
+        result = await get_insider_activity(
+            args.symbol,
+            args.verbose,
+            use_cache=not args.no_cache,
+            cache_ttl=args.cache_ttl
+        )
         print_results(result)
 
     return 0
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
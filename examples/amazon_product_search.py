@@ -17,25 +17,46 @@ Usage:
 
 import asyncio
 import argparse
+import functools
+import importlib.util
 import json
-from dataclasses import dataclass, field
+import logging
+import re
+import tempfile
+from dataclasses import dataclass, field, asdict
 from typing import Optional, List
 from datetime import datetime
 import sys
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Only add the project root to sys.path when run as a plain script;
+# `python -m examples.<name>` from the project root already resolves src.
+if importlib.util.find_spec("src") is None:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.cache import ResultCache
+from src.rate_limit import AsyncRateLimiter
+
+try:
+    import orjson  # Optional: faster JSON export
+except ImportError:
+    orjson = None
 
 try:
     from oagi import TaskerAgent
-    from oagi import AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+    from oagi import AsyncPyautoguiActionHandler, AsyncScreenshotMaker, ImageConfig
 except ImportError:
     print("Error: oagi package not installed. Run: pip install oagi")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Screenshots are downscaled and JPEG-encoded: much cheaper to encode and
+# upload than full-resolution PNG, which cuts per-step latency.
+SCREENSHOT_CONFIG = ImageConfig(max_width=1280, max_height=720, quality=75, format="jpeg")
+
+
+@dataclass(slots=True)
 class SearchConfig:
     """Configuration for Amazon product search."""
     product_name: str
@@ -47,7 +68,7 @@ class SearchConfig:
     output_file: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProductInfo:
     """Extracted product information."""
     name: str
@@ -59,7 +80,7 @@ class ProductInfo:
     is_bestseller: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Result of product search operation."""
     success: bool
@@ -70,19 +91,102 @@ class SearchResult:
     errors: List[str] = field(default_factory=list)
 
 
-async def search_amazon_products(config: SearchConfig, verbose: bool = False) -> SearchResult:
+# Amazon sort parameter for each --sort-by option
+SORT_MAPPING = {
+    "relevance": "relevanceblender",
+    "price-low-high": "price-asc-rank",
+    "price-high-low": "price-desc-rank",
+    "best-sellers": "bestsellers",
+    "rating": "review-rank",
+    "newest": "date-desc-rank"
+}
+
+# Step templates for the search task sequence. Constant steps are stored
+# as tuples; the rest are filled per search with str.format.
+NAVIGATION_STEPS = (
+    "Navigate to https://www.amazon.com",
+    "Wait for the page to fully load",
+    "Click on the search box at the top of the page",
+)
+SEARCH_STEP = "Type '{product_name}' in the search box"
+SEARCH_SUBMIT_STEPS = (
+    "Click the search button or press Enter",
+    "Wait for search results to load",
+    "Click on the 'Sort by' dropdown",
+)
+SORT_STEP = "Select '{sort_label}' from the dropdown options"
+SORT_WAIT_STEPS = ("Wait for results to update",)
+PRIME_FILTER_STEP = "Check the 'Prime' filter checkbox on the left sidebar"
+RATING_FILTER_STEP = "Click on '{min_rating} Stars & Up' in the Customer Reviews filter"
+PRICE_FILTER_STEP = "Enter '{max_price}' in the Max price field and apply filter"
+EXTRACTION_STEP = "For each of the top {max_products} products in the results, extract:"
+EXTRACTION_FIELD_STEPS = (
+    "  - Product name/title",
+    "  - Price",
+    "  - Star rating",
+    "  - Number of reviews",
+    "  - Whether it has Prime badge",
+    "  - Whether it's a Best Seller",
+)
+SAVE_PRODUCTS_STEP = (
+    "Save all extracted product data to {output_path}, one product per line as: "
+    "Name | Price | Rating | Reviews | Prime (yes/no) | Best Seller (yes/no)"
+)
+
+# One saved row per product, matching SAVE_PRODUCTS_STEP above
+PRODUCT_ROW = re.compile(
+    r"^[ \t]*(?P<name>[^|\n]+?)[ \t]*\|[ \t]*(?P<price>[^|\n]+?)[ \t]*\|"
+    r"[ \t]*(?P<rating>[^|\n]*?)[ \t]*\|[ \t]*(?P<reviews>[^|\n]*?)[ \t]*\|"
+    r"[ \t]*(?P<prime>yes|no)[ \t]*\|[ \t]*(?P<bestseller>yes|no)[ \t]*$",
+    re.MULTILINE | re.IGNORECASE
+)
+
+
+def parse_products(text: str) -> List[ProductInfo]:
     """
-    Search for products on Amazon using TaskerAgent.
+    Parse products from text saved by the agent.
+
+    Lines that do not match the expected row format are skipped.
 
     Args:
-        config: SearchConfig with search parameters
-        verbose: Enable verbose logging
+        text: Saved text with one product per line
 
     Returns:
-        SearchResult with found products
+        List of ProductInfo in input order
     """
-    # Initialize TaskerAgent
-    tasker = TaskerAgent(
+    return [
+        ProductInfo(
+            name=match["name"],
+            price=match["price"],
+            rating=match["rating"] or None,
+            review_count=match["reviews"] or None,
+            is_prime=match["prime"].lower() == "yes",
+            is_bestseller=match["bestseller"].lower() == "yes"
+        )
+        for match in PRODUCT_ROW.finditer(text)
+    ]
+
+
+DEFAULT_CACHE_TTL = 6 * 3600
+_cache = ResultCache("amazon")
+
+
+def _cache_key(config: SearchConfig) -> str:
+    """Build the cache key from the search parameters (output file excluded)."""
+    params = asdict(config)
+    params.pop("output_file")
+    return json.dumps(params, sort_keys=True)
+
+
+def _result_from_cache(data: dict) -> SearchResult:
+    """Rebuild a SearchResult from its cached dict form."""
+    products = [ProductInfo(**p) for p in data.pop("products")]
+    return SearchResult(products=products, **data)
+
+
+def _new_tasker(verbose: bool) -> TaskerAgent:
+    """Create a TaskerAgent for one search session."""
+    return TaskerAgent(
         max_steps=30,
         model="lux-tasker-1",
         retry_on_failure=True,
@@ -91,96 +195,133 @@ async def search_amazon_products(config: SearchConfig, verbose: bool = False) ->
         verbose=verbose
     )
 
+
+@functools.lru_cache(maxsize=2)
+def _get_tasker(verbose: bool) -> TaskerAgent:
+    """Return a shared TaskerAgent so its client is reused across searches."""
+    return _new_tasker(verbose)
+
+
+async def search_amazon_products(
+    config: SearchConfig,
+    verbose: bool = False,
+    use_cache: bool = True,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    action_handler: Optional[AsyncPyautoguiActionHandler] = None,
+    image_provider: Optional[AsyncScreenshotMaker] = None,
+    tasker: Optional[TaskerAgent] = None
+) -> SearchResult:
+    """
+    Search for products on Amazon using TaskerAgent.
+
+    Args:
+        config: SearchConfig with search parameters
+        verbose: Enable verbose logging
+        use_cache: Return a cached result for identical search parameters
+        cache_ttl: Maximum age in seconds of a cached result
+        action_handler: Action handler to reuse (created if not given)
+        image_provider: Screenshot provider to reuse (created if not given)
+        tasker: TaskerAgent to run the search with (the shared one if not given)
+
+    Returns:
+        SearchResult with found products
+    """
+    cache_key = _cache_key(config)
+    if use_cache:
+        cached = _cache.get(cache_key, ttl=cache_ttl)
+        if cached is not None:
+            return _result_from_cache(cached)
+
+    tasker = tasker or _get_tasker(verbose)
+
     # Build sort parameter
-    sort_mapping = {
-        "relevance": "relevanceblender",
-        "price-low-high": "price-asc-rank",
-        "price-high-low": "price-desc-rank",
-        "best-sellers": "bestsellers",
-        "rating": "review-rank",
-        "newest": "date-desc-rank"
-    }
-    sort_param = sort_mapping.get(config.sort_by, "relevanceblender")
+    sort_param = SORT_MAPPING.get(config.sort_by, "relevanceblender")
 
     # Build filter steps
     filter_steps = []
     if config.prime_only:
-        filter_steps.append("Check the 'Prime' filter checkbox on the left sidebar")
+        filter_steps.append(PRIME_FILTER_STEP)
     if config.min_rating:
-        filter_steps.append(f"Click on '{config.min_rating} Stars & Up' in the Customer Reviews filter")
+        filter_steps.append(RATING_FILTER_STEP.format(min_rating=config.min_rating))
     if config.max_price:
-        filter_steps.append(f"Enter '{config.max_price}' in the Max price field and apply filter")
+        filter_steps.append(PRICE_FILTER_STEP.format(max_price=config.max_price))
 
-    # Define the step-by-step task sequence
+    # Fill the step templates; only a few steps depend on the config
     steps = [
-        # Navigation
-        "Navigate to https://www.amazon.com",
-        "Wait for the page to fully load",
-
-        # Search
-        f"Click on the search box at the top of the page",
-        f"Type '{config.product_name}' in the search box",
-        "Click the search button or press Enter",
-        "Wait for search results to load",
-
-        # Sorting
-        f"Click on the 'Sort by' dropdown",
-        f"Select '{config.sort_by.replace('-', ' ').title()}' from the dropdown options",
-        "Wait for results to update",
-
-        # Apply filters (if any)
+        *NAVIGATION_STEPS,
+        SEARCH_STEP.format(product_name=config.product_name),
+        *SEARCH_SUBMIT_STEPS,
+        SORT_STEP.format(sort_label=config.sort_by.replace('-', ' ').title()),
+        *SORT_WAIT_STEPS,
         *filter_steps,
-
-        # Data extraction
-        f"For each of the top {config.max_products} products in the results, extract:",
-        "  - Product name/title",
-        "  - Price",
-        "  - Star rating",
-        "  - Number of reviews",
-        "  - Whether it has Prime badge",
-        "  - Whether it's a Best Seller",
-
-        # Copy data
-        "Select and copy all extracted product data to clipboard",
+        EXTRACTION_STEP.format(max_products=config.max_products),
+        *EXTRACTION_FIELD_STEPS,
     ]
 
-    # Execute the task
-    result = await tasker.execute(
-        steps=steps,
-        action_handler=AsyncPyautoguiActionHandler(),
-        image_provider=AsyncScreenshotMaker(),
-    )
+    # Execute the task; the agent saves product rows to a scratch file
+    with tempfile.TemporaryDirectory() as workdir:
+        output_path = os.path.join(workdir, "products.txt")
+        result = await tasker.execute(
+            steps=[*steps, SAVE_PRODUCTS_STEP.format(output_path=output_path)],
+            action_handler=action_handler or AsyncPyautoguiActionHandler(),
+            image_provider=image_provider or AsyncScreenshotMaker(config=SCREENSHOT_CONFIG),
+        )
+        try:
+            with open(output_path, "r", encoding="utf-8") as f:
+                products = parse_products(f.read())
+        except OSError:
+            products = []
 
-    return SearchResult(
+    search_result = SearchResult(
         success=result.success,
-        products=[],  # Would be populated from clipboard data
+        products=products,
         search_query=config.product_name,
         execution_time=result.execution_time,
         errors=result.errors if hasattr(result, 'errors') else []
     )
 
+    # An empty listing usually means nothing was saved; don't serve it
+    # from the cache for the whole TTL
+    if search_result.success and search_result.products:
+        _cache.set(cache_key, asdict(search_result))
+
+    return search_result
+
 
 async def search_multiple_products(
     products: List[str],
     config: SearchConfig,
-    verbose: bool = False
+    verbose: bool = False,
+    concurrency: int = 1,
+    rate_limit: Optional[float] = None
 ) -> dict:
     """
-    Search for multiple products sequentially.
+    Search for multiple products concurrently.
+
+    At most `concurrency` TaskerAgent sessions run at once. Values above 1
+    require isolated desktop sessions (e.g. OSGym environments).
 
     Args:
         products: List of product names to search
         config: Base SearchConfig (product_name will be overwritten)
         verbose: Enable verbose logging
+        concurrency: Maximum number of concurrent agent sessions
+        rate_limit: Maximum searches started per minute (None for no limit)
 
     Returns:
         dict mapping product names to their SearchResults
     """
-    results = {}
-
-    for i, product in enumerate(products, 1):
-        print(f"\nSearching {i}/{len(products)}: {product}")
-
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = AsyncRateLimiter(rate_limit) if rate_limit else None
+    # One search at a time can reuse the shared tasker and handlers;
+    # concurrent searches each get their own, since TaskerAgent keeps
+    # per-run state
+    shared = concurrency <= 1
+    if shared:
+        action_handler = AsyncPyautoguiActionHandler()
+        image_provider = AsyncScreenshotMaker(config=SCREENSHOT_CONFIG)
+
+    async def search(i: int, product: str) -> SearchResult:
         # Create config for this product
         product_config = SearchConfig(
             product_name=product,
@@ -191,63 +332,72 @@ async def search_multiple_products(
             prime_only=config.prime_only
         )
 
-        try:
-            result = await search_amazon_products(product_config, verbose)
-            results[product] = result
-            print(f"  Status: {'Success' if result.success else 'Failed'}")
-        except Exception as e:
-            print(f"  Error: {e}")
-            results[product] = SearchResult(
-                success=False,
-                search_query=product,
-                errors=[str(e)]
-            )
-
-        # Brief pause between searches
-        if i < len(products):
-            await asyncio.sleep(2)
-
-    return results
+        async with semaphore:
+            if limiter is not None:
+                await limiter.acquire()
+            logger.info("Searching %d/%d: %s", i, len(products), product)
+            if shared:
+                session = {"action_handler": action_handler, "image_provider": image_provider}
+            else:
+                session = {
+                    "action_handler": AsyncPyautoguiActionHandler(),
+                    "image_provider": AsyncScreenshotMaker(config=SCREENSHOT_CONFIG),
+                    "tasker": _new_tasker(verbose),
+                }
+            try:
+                result = await search_amazon_products(product_config, verbose, **session)
+                logger.info("  [%s] Status: %s", product, "Success" if result.success else "Failed")
+                return result
+            except Exception as e:
+                logger.warning("  [%s] Error: %s", product, e)
+                return SearchResult(
+                    success=False,
+                    search_query=product,
+                    errors=[str(e)]
+                )
+
+    # The task group cancels every in-flight session if the run is interrupted
+    async with asyncio.TaskGroup() as group:
+        tasks = [
+            group.create_task(search(i, product))
+            for i, product in enumerate(products, 1)
+        ]
+
+    return {product: task.result() for product, task in zip(products, tasks)}
 
 
 def export_results(results: SearchResult, output_file: str):
     """Export search results to JSON file."""
+    # Products are serialized directly from their dataclasses
     data = {
         "search_query": results.search_query,
         "success": results.success,
         "total_results": results.total_results,
         "execution_time": results.execution_time,
         "timestamp": datetime.now().isoformat(),
-        "products": [
-            {
-                "name": p.name,
-                "price": p.price,
-                "rating": p.rating,
-                "review_count": p.review_count,
-                "url": p.url,
-                "is_prime": p.is_prime,
-                "is_bestseller": p.is_bestseller
-            }
-            for p in results.products
-        ],
+        "products": results.products,
         "errors": results.errors
     }
 
-    with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(data, f, indent=2, default=asdict)
 
     print(f"\nResults exported to: {output_file}")
 
 
-def parse_args():
-    """Parse command line arguments."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Search Amazon products using Lux TaskerAgent"
     )
     parser.add_argument("--product", required=True, help="Product name to search")
     parser.add_argument("--sort-by", default="relevance",
-                        choices=["relevance", "price-low-high", "price-high-low",
-                                 "best-sellers", "rating", "newest"],
+                        choices=list(SORT_MAPPING),
                         help="Sort order for results")
     parser.add_argument("--max-products", type=int, default=10,
                         help="Maximum number of products to extract")
@@ -255,14 +405,27 @@ def parse_args():
     parser.add_argument("--max-price", type=float, help="Maximum price filter")
     parser.add_argument("--prime-only", action="store_true", help="Only show Prime items")
     parser.add_argument("--output", help="Output JSON file path")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached results and always run the agent")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_CACHE_TTL,
+                        help="Max age of cached results in seconds")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args():
+    """Parse command line arguments."""
+    return _build_parser().parse_args()
 
 
 async def main():
     """Main entry point."""
     args = parse_args()
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(message)s"
+    )
 
     # Create search configuration
     config = SearchConfig(
@@ -290,7 +453,12 @@ async def main():
     print("")
 
     # Execute search
-    result = await search_amazon_products(config, verbose=args.verbose)
+    result = await search_amazon_products(
+        config,
+        verbose=args.verbose,
+        use_cache=not args.no_cache,
+        cache_ttl=args.cache_ttl
+    )
 
     # Print results
     print("\n" + "=" * 60)
@@ -319,5 +487,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
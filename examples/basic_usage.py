@@ -7,102 +7,110 @@ for simple computer automation tasks.
 
 import asyncio
 import os
+import sys
 from dotenv import load_dotenv
 
+try:
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+    _OAGI_AVAILABLE = True
+except ImportError:
+    _OAGI_AVAILABLE = False
+
+OAGI_MISSING_MESSAGE = "Error: oagi package not installed. Run: pip install oagi"
+
 # Load environment variables
 load_dotenv()
 
 
-async def simple_navigation():
+async def simple_navigation(agent=None, action_handler=None, image_provider=None):
     """Navigate to a website."""
-    try:
-        from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
-
-        print("Starting simple navigation example...")
+    if not _OAGI_AVAILABLE:
+        print(OAGI_MISSING_MESSAGE)
+        return False
 
-        agent = AsyncDefaultAgent(max_steps=5, model="lux-actor-1")
+    print("Starting simple navigation example...")
 
-        completed = await agent.execute(
-            "Open Chrome and navigate to google.com",
-            action_handler=AsyncPyautoguiActionHandler(),
-            image_provider=AsyncScreenshotMaker(),
-        )
+    agent = agent or AsyncDefaultAgent(max_steps=5, model="lux-actor-1")
 
-        print(f"Navigation completed: {completed}")
-        return completed
+    completed = await agent.execute(
+        "Open Chrome and navigate to google.com",
+        action_handler=action_handler or AsyncPyautoguiActionHandler(),
+        image_provider=image_provider or AsyncScreenshotMaker(),
+    )
 
-    except ImportError:
-        print("Error: oagi package not installed. Run: pip install oagi")
-        return False
+    print(f"Navigation completed: {completed}")
+    return completed
 
 
-async def search_google(query: str):
+async def search_google(query: str, agent=None, action_handler=None, image_provider=None):
     """Search for something on Google."""
-    try:
-        from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+    if not _OAGI_AVAILABLE:
+        print(OAGI_MISSING_MESSAGE)
+        return False
 
-        print(f"Searching Google for: {query}")
+    print(f"Searching Google for: {query}")
 
-        agent = AsyncDefaultAgent(max_steps=10, model="lux-actor-1")
+    agent = agent or AsyncDefaultAgent(max_steps=10, model="lux-actor-1")
 
-        completed = await agent.execute(
-            f"Go to Google and search for '{query}'",
-            action_handler=AsyncPyautoguiActionHandler(),
-            image_provider=AsyncScreenshotMaker(),
-        )
+    completed = await agent.execute(
+        f"Go to Google and search for '{query}'",
+        action_handler=action_handler or AsyncPyautoguiActionHandler(),
+        image_provider=image_provider or AsyncScreenshotMaker(),
+    )
 
-        print(f"Search completed: {completed}")
-        return completed
+    print(f"Search completed: {completed}")
+    return completed
 
-    except ImportError:
-        print("Error: oagi package not installed. Run: pip install oagi")
-        return False
 
-
-async def click_element(element_description: str):
+async def click_element(
+    element_description: str,
+    agent=None,
+    action_handler=None,
+    image_provider=None
+):
     """Click on an element described in natural language."""
-    try:
-        from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
-
-        print(f"Clicking: {element_description}")
+    if not _OAGI_AVAILABLE:
+        print(OAGI_MISSING_MESSAGE)
+        return False
 
-        agent = AsyncDefaultAgent(max_steps=5, model="lux-actor-1")
+    print(f"Clicking: {element_description}")
 
-        completed = await agent.execute(
-            f"Click on the {element_description}",
-            action_handler=AsyncPyautoguiActionHandler(),
-            image_provider=AsyncScreenshotMaker(),
-        )
+    agent = agent or AsyncDefaultAgent(max_steps=5, model="lux-actor-1")
 
-        print(f"Click completed: {completed}")
-        return completed
+    completed = await agent.execute(
+        f"Click on the {element_description}",
+        action_handler=action_handler or AsyncPyautoguiActionHandler(),
+        image_provider=image_provider or AsyncScreenshotMaker(),
+    )
 
-    except ImportError:
-        print("Error: oagi package not installed. Run: pip install oagi")
-        return False
+    print(f"Click completed: {completed}")
+    return completed
 
 
-async def type_text(field_description: str, text: str):
+async def type_text(
+    field_description: str,
+    text: str,
+    agent=None,
+    action_handler=None,
+    image_provider=None
+):
     """Type text into a field."""
-    try:
-        from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
-
-        print(f"Typing into {field_description}: {text}")
+    if not _OAGI_AVAILABLE:
+        print(OAGI_MISSING_MESSAGE)
+        return False
 
-        agent = AsyncDefaultAgent(max_steps=5, model="lux-actor-1")
+    print(f"Typing into {field_description}: {text}")
 
-        completed = await agent.execute(
-            f"Click on the {field_description} and type '{text}'",
-            action_handler=AsyncPyautoguiActionHandler(),
-            image_provider=AsyncScreenshotMaker(),
-        )
+    agent = agent or AsyncDefaultAgent(max_steps=5, model="lux-actor-1")
 
-        print(f"Typing completed: {completed}")
-        return completed
+    completed = await agent.execute(
+        f"Click on the {field_description} and type '{text}'",
+        action_handler=action_handler or AsyncPyautoguiActionHandler(),
+        image_provider=image_provider or AsyncScreenshotMaker(),
+    )
 
-    except ImportError:
-        print("Error: oagi package not installed. Run: pip install oagi")
-        return False
+    print(f"Typing completed: {completed}")
+    return completed
 
 
 async def main():
@@ -111,28 +119,53 @@ async def main():
     print("Lux Basic Usage Examples")
     print("=" * 50)
 
-    # Check for API key
+    # Fail fast rather than starting runs that cannot succeed
+    if not _OAGI_AVAILABLE:
+        print(OAGI_MISSING_MESSAGE)
+        return 1
+
     if not os.getenv("OAGI_API_KEY"):
-        print("\nWarning: OAGI_API_KEY not set in environment.")
+        print("\nError: OAGI_API_KEY not set in environment.")
         print("Please set your API key: export OAGI_API_KEY='your_key_here'")
         print("Get your key at: https://developer.agiopen.org\n")
+        return 1
+
+    # Create the handlers once and share them across examples; agents are
+    # shared per step budget so each example keeps its own limit
+    handlers = {
+        "action_handler": AsyncPyautoguiActionHandler(),
+        "image_provider": AsyncScreenshotMaker(),
+    }
+    short_agent = AsyncDefaultAgent(max_steps=5, model="lux-actor-1")
 
     # Example 1: Simple navigation
     print("\n--- Example 1: Simple Navigation ---")
-    await simple_navigation()
+    await simple_navigation(agent=short_agent, **handlers)
 
     # Example 2: Google search
     print("\n--- Example 2: Google Search ---")
-    await search_google("OpenAGI Lux computer use model")
+    await search_google(
+        "OpenAGI Lux computer use model",
+        agent=AsyncDefaultAgent(max_steps=10, model="lux-actor-1"),
+        **handlers
+    )
 
     # Example 3: Click element
     print("\n--- Example 3: Click Element ---")
-    await click_element("first search result")
+    await click_element("first search result", agent=short_agent, **handlers)
 
     print("\n" + "=" * 50)
     print("Examples completed!")
     print("=" * 50)
 
+    return 0
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    sys.exit(asyncio.run(main()))
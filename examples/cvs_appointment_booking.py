@@ -19,23 +19,28 @@ Usage:
 
 import asyncio
 import argparse
-from dataclasses import dataclass
-from typing import Optional
+import functools
+import logging
+import random
+from dataclasses import dataclass, asdict
+from typing import List, Optional
 import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
     from oagi import TaskerAgent
-    from oagi import AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+    from oagi import AsyncPyautoguiActionHandler, AsyncScreenshotMaker, ImageConfig
 except ImportError:
     print("Error: oagi package not installed. Run: pip install oagi")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
+# Screenshots are downscaled and JPEG-encoded: much cheaper to encode and
+# upload than full-resolution PNG, which cuts per-step latency.
+SCREENSHOT_CONFIG = ImageConfig(max_width=1280, max_height=720, quality=75, format="jpeg")
 
-@dataclass
+
+@dataclass(slots=True)
 class AppointmentInfo:
     """Personal information for CVS appointment booking."""
     first_name: str
@@ -48,13 +53,74 @@ class AppointmentInfo:
     preferred_time: Optional[str] = None  # e.g., "morning", "afternoon", "evening"
 
 
-async def book_cvs_appointment(info: AppointmentInfo, verbose: bool = False) -> dict:
+# Step sequence with {field} placeholders filled from AppointmentInfo
+STEP_TEMPLATES = (
+    # Navigation
+    "Navigate to https://www.cvs.com/immunizations/flu",
+    "Wait for the page to fully load",
+    "Click on 'Schedule an appointment' button",
+
+    # Location search
+    "Enter zip code '{zip_code}' in the location search field",
+    "Click the 'Search' or 'Find' button",
+    "Wait for location results to load",
+
+    # Select location
+    "Click on the first available CVS location from the results",
+    "Verify the location details are displayed",
+
+    # Date/time selection
+    "Click on 'Select a date' or similar date picker",
+    "Select the {date_choice} date",
+    "Select {time_choice} time slot",
+    "Click 'Continue' or 'Next' to proceed",
+
+    # Personal information
+    "Enter '{first_name}' in the First Name field",
+    "Enter '{last_name}' in the Last Name field",
+    "Enter '{phone}' in the Phone Number field",
+    "Enter '{email}' in the Email field",
+    "Enter '{birthdate}' in the Date of Birth field",
+
+    # Review and confirm
+    "Review the appointment details",
+    "Check any required consent checkboxes",
+    "Click 'Schedule Appointment' or 'Confirm' button",
+
+    # Verification
+    "Wait for confirmation page to load",
+    "Verify appointment confirmation message is displayed",
+)
+
+
+def build_steps(info: AppointmentInfo) -> List[str]:
+    """
+    Fill the step templates with the appointment details.
+
+    Args:
+        info: AppointmentInfo dataclass with personal details
+
+    Returns:
+        List of step instructions for TaskerAgent
+    """
+    values = asdict(info)
+    values["date_choice"] = info.preferred_date or "earliest available"
+    values["time_choice"] = info.preferred_time or "any available"
+    return [template.format_map(values) for template in STEP_TEMPLATES]
+
+
+async def book_cvs_appointment(
+    info: AppointmentInfo,
+    verbose: bool = False,
+    steps: Optional[List[str]] = None
+) -> dict:
     """
     Book a flu shot appointment on CVS.com using TaskerAgent.
 
     Args:
         info: AppointmentInfo dataclass with personal details
         verbose: Enable verbose logging
+        steps: Prebuilt step list from build_steps (built from info if None)
 
     Returns:
         dict with booking result status and details
@@ -69,50 +135,14 @@ async def book_cvs_appointment(info: AppointmentInfo, verbose: bool = False) ->
         verbose=verbose
     )
 
-    # Define the step-by-step task sequence
-    steps = [
-        # Navigation
-        "Navigate to https://www.cvs.com/immunizations/flu",
-        "Wait for the page to fully load",
-        "Click on 'Schedule an appointment' button",
-
-        # Location search
-        f"Enter zip code '{info.zip_code}' in the location search field",
-        "Click the 'Search' or 'Find' button",
-        "Wait for location results to load",
-
-        # Select location
-        "Click on the first available CVS location from the results",
-        "Verify the location details are displayed",
-
-        # Date/time selection
-        "Click on 'Select a date' or similar date picker",
-        f"Select the {'earliest available' if not info.preferred_date else info.preferred_date} date",
-        f"Select {'any available' if not info.preferred_time else info.preferred_time} time slot",
-        "Click 'Continue' or 'Next' to proceed",
-
-        # Personal information
-        f"Enter '{info.first_name}' in the First Name field",
-        f"Enter '{info.last_name}' in the Last Name field",
-        f"Enter '{info.phone}' in the Phone Number field",
-        f"Enter '{info.email}' in the Email field",
-        f"Enter '{info.birthdate}' in the Date of Birth field",
-
-        # Review and confirm
-        "Review the appointment details",
-        "Check any required consent checkboxes",
-        "Click 'Schedule Appointment' or 'Confirm' button",
-
-        # Verification
-        "Wait for confirmation page to load",
-        "Verify appointment confirmation message is displayed",
-    ]
+    if steps is None:
+        steps = build_steps(info)
 
     # Execute the task sequence
     result = await tasker.execute(
         steps=steps,
         action_handler=AsyncPyautoguiActionHandler(),
-        image_provider=AsyncScreenshotMaker(),
+        image_provider=AsyncScreenshotMaker(config=SCREENSHOT_CONFIG),
     )
 
     return {
@@ -125,35 +155,53 @@ async def book_cvs_appointment(info: AppointmentInfo, verbose: bool = False) ->
     }
 
 
-async def book_with_retry(info: AppointmentInfo, max_attempts: int = 3) -> dict:
+async def book_with_retry(
+    info: AppointmentInfo,
+    max_attempts: int = 3,
+    base_delay: float = 2.0,
+    max_delay: float = 60.0
+) -> dict:
     """
     Attempt to book appointment with retry logic.
 
+    Failed attempts are retried with exponential backoff and full jitter:
+    before attempt n+1 the wait is drawn uniformly from
+    [0, min(max_delay, base_delay * 2**(n-1))]. Errors caused by invalid
+    input (ValueError, TypeError) are raised immediately without retrying.
+
     Args:
         info: AppointmentInfo dataclass with personal details
         max_attempts: Maximum number of booking attempts
+        base_delay: Backoff delay in seconds after the first failure
+        max_delay: Upper bound on the backoff delay in seconds
 
     Returns:
         dict with final booking result
     """
+    # The steps only depend on info, so build them once for all attempts
+    steps = build_steps(info)
+
     for attempt in range(1, max_attempts + 1):
-        print(f"\nAttempt {attempt}/{max_attempts}...")
+        logger.info("Attempt %d/%d...", attempt, max_attempts)
 
         try:
-            result = await book_cvs_appointment(info, verbose=True)
+            result = await book_cvs_appointment(info, verbose=True, steps=steps)
 
             if result["success"]:
-                print(f"Booking successful on attempt {attempt}!")
+                logger.info("Booking successful on attempt %d!", attempt)
                 return result
             else:
-                print(f"Attempt {attempt} failed: {result.get('errors', 'Unknown error')}")
+                logger.warning("Attempt %d failed: %s", attempt, result.get('errors', 'Unknown error'))
 
+        except (ValueError, TypeError):
+            raise
         except Exception as e:
-            print(f"Attempt {attempt} raised exception: {e}")
+            logger.warning("Attempt %d raised exception: %s", attempt, e)
 
         if attempt < max_attempts:
-            print("Waiting before retry...")
-            await asyncio.sleep(5)
+            delay = random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+            logger.info("Waiting %.1fs before retry...", delay)
+            await asyncio.sleep(delay)
 
     return {
         "success": False,
@@ -162,8 +210,9 @@ async def book_with_retry(info: AppointmentInfo, max_attempts: int = 3) -> dict:
     }
 
 
-def parse_args():
-    """Parse command line arguments."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Book a CVS flu shot appointment using Lux TaskerAgent"
     )
@@ -179,12 +228,21 @@ def parse_args():
     parser.add_argument("--max-attempts", type=int, default=3, help="Max retry attempts")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args():
+    """Parse command line arguments."""
+    return _build_parser().parse_args()
 
 
 async def main():
     """Main entry point."""
     args = parse_args()
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(message)s"
+    )
 
     # Create appointment info from arguments
     info = AppointmentInfo(
@@ -225,5 +283,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
@@ -7,26 +7,31 @@ Demonstrates data processing capabilities:
 - Data extraction
 """
 
+import argparse
 import asyncio
+import importlib.util
 import os
 import sys
-from dotenv import load_dotenv
+from typing import Callable
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Only add the project root to sys.path when run as a plain script;
+# `python -m examples.<name>` from the project root already resolves src.
+if importlib.util.find_spec("src") is None:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.data_processing import BulkDataEntry, ReportGenerator
 from src.data_processing.bulk_entry import EntryRecord
 from src.data_processing.report_generator import ReportConfig, DataSource, ReportFormat
 
-load_dotenv()
+SEPARATOR = "=" * 60
+SECTION_SEPARATOR = "=" * 50
 
 
-async def demo_bulk_data_entry():
+async def demo_bulk_data_entry(emit: Callable[[str], None] = print):
     """Demonstrate bulk data entry capabilities."""
-    print("\n" + "=" * 50)
-    print("Demo: Bulk Data Entry")
-    print("=" * 50)
+    emit("\n" + SECTION_SEPARATOR)
+    emit("Demo: Bulk Data Entry")
+    emit(SECTION_SEPARATOR)
 
     entry = BulkDataEntry(
         max_steps_per_record=20,
@@ -59,11 +64,11 @@ async def demo_bulk_data_entry():
         }),
     ]
 
-    print(f"\nEntering {len(records)} records...")
+    emit(f"\nEntering {len(records)} records...")
     for i, record in enumerate(records, 1):
-        print(f"\nRecord {i}:")
+        emit(f"\nRecord {i}:")
         for field, value in record.data.items():
-            print(f"  - {field}: {value}")
+            emit(f"  - {field}: {value}")
 
     result = await entry.enter_records(
         url="https://crm.example.com/contacts/new",  # Replace with actual URL
@@ -72,19 +77,19 @@ async def demo_bulk_data_entry():
         new_record_button_text="Add New Contact"
     )
 
-    print(f"\nResult:")
-    print(f"  Total records: {result.total_records}")
-    print(f"  Successful: {result.successful}")
-    print(f"  Failed: {result.failed}")
+    emit(f"\nResult:")
+    emit(f"  Total records: {result.total_records}")
+    emit(f"  Successful: {result.successful}")
+    emit(f"  Failed: {result.failed}")
     if result.errors:
-        print(f"  Errors: {result.errors}")
+        emit(f"  Errors: {result.errors}")
 
 
-async def demo_report_generation():
+async def demo_report_generation(emit: Callable[[str], None] = print):
     """Demonstrate report generation capabilities."""
-    print("\n" + "=" * 50)
-    print("Demo: Report Generation")
-    print("=" * 50)
+    emit("\n" + SECTION_SEPARATOR)
+    emit("Demo: Report Generation")
+    emit(SECTION_SEPARATOR)
 
     generator = ReportGenerator(max_steps=100, model="lux-thinker-1")
 
@@ -113,30 +118,30 @@ async def demo_report_generation():
         date_range="December 1-31, 2025"
     )
 
-    print(f"\nGenerating report: {config.title}")
-    print(f"Data sources:")
+    emit(f"\nGenerating report: {config.title}")
+    emit(f"Data sources:")
     for source in config.sources:
-        print(f"  - {source.name}: {source.url}")
-    print(f"Output format: {config.output_format.value}")
+        emit(f"  - {source.name}: {source.url}")
+    emit(f"Output format: {config.output_format.value}")
 
     result = await generator.generate(
         config=config,
         output_path="reports/december_2025_report.md"
     )
 
-    print(f"\nResult: {'Success' if result.success else 'Failed'}")
-    print(f"Sources processed: {result.sources_processed}")
+    emit(f"\nResult: {'Success' if result.success else 'Failed'}")
+    emit(f"Sources processed: {result.sources_processed}")
     if result.output_path:
-        print(f"Output saved to: {result.output_path}")
+        emit(f"Output saved to: {result.output_path}")
     if result.errors:
-        print(f"Errors: {result.errors}")
+        emit(f"Errors: {result.errors}")
 
 
-async def demo_dashboard_extraction():
+async def demo_dashboard_extraction(emit: Callable[[str], None] = print):
     """Demonstrate dashboard metric extraction."""
-    print("\n" + "=" * 50)
-    print("Demo: Dashboard Metric Extraction")
-    print("=" * 50)
+    emit("\n" + SECTION_SEPARATOR)
+    emit("Demo: Dashboard Metric Extraction")
+    emit(SECTION_SEPARATOR)
 
     generator = ReportGenerator(max_steps=30, model="lux-actor-1")
 
@@ -149,9 +154,9 @@ async def demo_dashboard_extraction():
         "Net Promoter Score"
     ]
 
-    print(f"\nExtracting metrics from dashboard:")
+    emit(f"\nExtracting metrics from dashboard:")
     for metric in metrics:
-        print(f"  - {metric}")
+        emit(f"  - {metric}")
 
     result = await generator.extract_dashboard_metrics(
         url="https://analytics.example.com/dashboard",  # Replace with actual URL
@@ -159,18 +164,18 @@ async def demo_dashboard_extraction():
         output_format="json"
     )
 
-    print(f"\nResult: {'Success' if result.get('success') else 'Failed'}")
+    emit(f"\nResult: {'Success' if result.get('success') else 'Failed'}")
     if result.get('metrics'):
-        print("Extracted metrics:")
+        emit("Extracted metrics:")
         for metric, value in result['metrics'].items():
-            print(f"  - {metric}: {value}")
+            emit(f"  - {metric}: {value}")
 
 
-async def demo_csv_import():
+async def demo_csv_import(emit: Callable[[str], None] = print):
     """Demonstrate importing data from CSV."""
-    print("\n" + "=" * 50)
-    print("Demo: CSV Data Import")
-    print("=" * 50)
+    emit("\n" + SECTION_SEPARATOR)
+    emit("Demo: CSV Data Import")
+    emit(SECTION_SEPARATOR)
 
     entry = BulkDataEntry(max_steps_per_record=15, model="lux-actor-1")
 
@@ -183,30 +188,34 @@ async def demo_csv_import():
         "role": "Job Title"
     }
 
-    print("\nField mapping (CSV -> Form):")
+    emit("\nField mapping (CSV -> Form):")
     for csv_col, form_field in field_mapping.items():
-        print(f"  {csv_col} -> {form_field}")
+        emit(f"  {csv_col} -> {form_field}")
 
-    # Note: In a real scenario, you would have an actual CSV file
-    print("\nNote: This demo requires a CSV file at 'data/contacts.csv'")
-    print("Example CSV format:")
-    print("  name,email,phone,company,role")
-    print("  John Doe,john@example.com,+1-555-0101,Acme Inc,Manager")
+    csv_path = "data/contacts.csv"
+    if not os.path.exists(csv_path):
+        emit(f"\nNote: This demo requires a CSV file at '{csv_path}'")
+        emit("Example CSV format:")
+        emit("  name,email,phone,company,role")
+        emit("  John Doe,john@example.com,+1-555-0101,Acme Inc,Manager")
+        return
 
-    # Uncomment below to actually run:
-    # result = await entry.enter_from_csv(
-    #     url="https://crm.example.com/contacts/new",
-    #     csv_path="data/contacts.csv",
-    #     field_mapping=field_mapping
-    # )
-    # print(f"\nResult: {result.successful}/{result.total_records} records imported")
+    result = await entry.enter_from_csv(
+        url="https://crm.example.com/contacts/new",  # Replace with actual URL
+        csv_path=csv_path,
+        field_mapping=field_mapping
+    )
+
+    emit(f"\nResult: {result.successful}/{result.total_records} records imported")
+    if result.errors:
+        emit(f"Errors: {result.errors}")
 
 
-async def demo_record_update():
+async def demo_record_update(emit: Callable[[str], None] = print):
     """Demonstrate updating existing records."""
-    print("\n" + "=" * 50)
-    print("Demo: Record Update")
-    print("=" * 50)
+    emit("\n" + SECTION_SEPARATOR)
+    emit("Demo: Record Update")
+    emit(SECTION_SEPARATOR)
 
     entry = BulkDataEntry(max_steps_per_record=25, model="lux-thinker-1")
 
@@ -230,12 +239,12 @@ async def demo_record_update():
         ),
     ]
 
-    print(f"\nUpdating {len(records)} records...")
+    emit(f"\nUpdating {len(records)} records...")
     for record in records:
-        print(f"\n  Identifier: {record.identifier}")
+        emit(f"\n  Identifier: {record.identifier}")
         for field, value in record.data.items():
             if field != "Email":  # Don't show the identifier twice
-                print(f"    {field}: {value}")
+                emit(f"    {field}: {value}")
 
     result = await entry.update_records(
         search_url="https://crm.example.com/contacts",  # Replace with actual URL
@@ -244,18 +253,33 @@ async def demo_record_update():
         update_fields=["Phone", "Department"]
     )
 
-    print(f"\nResult:")
-    print(f"  Total: {result.total_records}")
-    print(f"  Updated: {result.successful}")
-    print(f"  Failed: {result.failed}")
+    emit(f"\nResult:")
+    emit(f"  Total: {result.total_records}")
+    emit(f"  Updated: {result.successful}")
+    emit(f"  Failed: {result.failed}")
+
+
+async def main(parallel: bool = False):
+    """
+    Run all data processing demos.
+
+    Demos print as they go. When run concurrently, each demo's output is
+    collected and printed once it finishes, so demos do not interleave.
 
+    Args:
+        parallel: Run the demos concurrently. Requires isolated desktop
+            sessions, since each demo drives its own mouse and keyboard.
+    """
+    from dotenv import load_dotenv
 
-async def main():
-    """Run all data processing demos."""
-    print("=" * 60)
-    print("   Data Processing Demonstration")
-    print("   Using OpenAGI Lux Model")
-    print("=" * 60)
+    load_dotenv()
+
+    print("\n".join([
+        SEPARATOR,
+        "   Data Processing Demonstration",
+        "   Using OpenAGI Lux Model",
+        SEPARATOR,
+    ]))
 
     # Check for API key
     if not os.getenv("OAGI_API_KEY"):
@@ -263,17 +287,49 @@ async def main():
         print("Set it with: export OAGI_API_KEY='your_key_here'")
         print("Get your key at: https://developer.agiopen.org\n")
 
-    # Run demos
-    await demo_bulk_data_entry()
-    await demo_report_generation()
-    await demo_dashboard_extraction()
-    await demo_csv_import()
-    await demo_record_update()
+    demos = [
+        demo_bulk_data_entry,
+        demo_report_generation,
+        demo_dashboard_extraction,
+        demo_csv_import,
+        demo_record_update,
+    ]
 
-    print("\n" + "=" * 60)
-    print("All data processing demos completed!")
-    print("=" * 60)
+    # Run demos
+    if parallel:
+        buffers = [[] for _ in demos]
+        outcomes = await asyncio.gather(
+            *(demo(buffer.append) for demo, buffer in zip(demos, buffers)),
+            return_exceptions=True
+        )
+        for demo, buffer, outcome in zip(demos, buffers, outcomes):
+            print("\n".join(buffer))
+            if isinstance(outcome, Exception):
+                print(f"\n{demo.__name__} failed: {outcome}")
+    else:
+        for demo in demos:
+            await demo()
+
+    print("\n".join([
+        "\n" + SEPARATOR,
+        "All data processing demos completed!",
+        SEPARATOR,
+    ]))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Run the data processing demos")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run demos concurrently (requires isolated desktop sessions)"
+    )
+    args = parser.parse_args()
+
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(main(parallel=args.parallel))
@@ -18,22 +18,66 @@ Usage:
 
 import asyncio
 import argparse
-from dataclasses import dataclass
+import importlib.util
+from dataclasses import asdict, dataclass
 from typing import Optional
-from datetime import datetime
 import sys
-import os
+import time
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SEPARATOR = "=" * 60
 
-try:
-    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
-except ImportError:
-    print("Error: oagi package not installed. Run: pip install oagi")
-    sys.exit(1)
+NAVIGATION_INSTRUCTION = """
+    1. Navigate to https://www.healthcare.gov
+    2. Look for 'Get Coverage', 'See Plans', or 'Start Application' button
+    3. Click the main call-to-action button
+    4. If asked for ZIP code, enter: {zip_code}
+    5. If asked for state, select: {state}
+    6. The site should detect California and offer to redirect to Covered California
+    7. Click to proceed to Covered California (coveredca.com)
+    8. On Covered California website:
+       - If prompted, confirm the ZIP code: {zip_code}
+       - Enter household size: {household_size}
+       - Enter estimated annual income: ${annual_income:,}
+    9. Click 'Shop and Compare' or 'See Plans' button
+    10. Wait for plan options to load
+    11. Verify health plan options are displayed
+    """
+
+PLAN_OPTIONS_INSTRUCTION = """
+    1. Navigate to https://www.coveredca.com
+    2. Click 'Shop and Compare' or 'Get Started'
+    3. Enter ZIP code: {zip_code}
+    4. Enter household information:
+       - Household size: {household_size}
+       - Annual income: ${annual_income:,}
+    5. Click 'See Plans' or 'Get Quote'
+    6. Wait for plan results to load
+    7. Filter plans by tier: {plan_tier}
+    8. For each displayed plan, note:
+       - Plan name
+       - Monthly premium
+       - Annual deductible
+       - Insurance provider
+    9. Take a screenshot of the plan comparison
+    """
+
+
+# (label, attribute, format) rows printed by print_results
+_USER_FIELDS = (
+    ("ZIP Code", "zip_code", "{}"),
+    ("State", "state", "{}"),
+    ("Household Size", "household_size", "{}"),
+    ("Annual Income", "annual_income", "${:,}"),
+)
 
+_STATUS_FIELDS = (
+    ("Success", "success"),
+    ("Reached CoveredCA", "reached_coveredca"),
+    ("Plans Displayed", "plans_displayed"),
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class UserInfo:
     """User information for healthcare enrollment."""
     zip_code: str
@@ -45,7 +89,7 @@ class UserInfo:
     num_dependents: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthcarePlan:
     """Represents a healthcare plan option."""
     name: str
@@ -55,7 +99,7 @@ class HealthcarePlan:
     provider: str
 
 
-@dataclass
+@dataclass(slots=True)
 class NavigationResult:
     """Result of healthcare navigation."""
     success: bool
@@ -83,7 +127,9 @@ async def navigate_to_coveredca(
     Returns:
         NavigationResult with navigation outcome
     """
-    start_time = datetime.now()
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+
+    start_time = time.perf_counter()
 
     agent = AsyncDefaultAgent(
         max_steps=25,
@@ -91,29 +137,7 @@ async def navigate_to_coveredca(
         verbose=verbose
     )
 
-    # Build household description
-    household_desc = f"{user_info.household_size} person(s)"
-    if user_info.include_spouse:
-        household_desc += " (including spouse)"
-    if user_info.num_dependents > 0:
-        household_desc += f", {user_info.num_dependents} dependent(s)"
-
-    instruction = f"""
-    1. Navigate to https://www.healthcare.gov
-    2. Look for 'Get Coverage', 'See Plans', or 'Start Application' button
-    3. Click the main call-to-action button
-    4. If asked for ZIP code, enter: {user_info.zip_code}
-    5. If asked for state, select: {user_info.state}
-    6. The site should detect California and offer to redirect to Covered California
-    7. Click to proceed to Covered California (coveredca.com)
-    8. On Covered California website:
-       - If prompted, confirm the ZIP code: {user_info.zip_code}
-       - Enter household size: {user_info.household_size}
-       - Enter estimated annual income: ${user_info.annual_income:,}
-    9. Click 'Shop and Compare' or 'See Plans' button
-    10. Wait for plan options to load
-    11. Verify health plan options are displayed
-    """
+    instruction = NAVIGATION_INSTRUCTION.format_map(asdict(user_info))
 
     try:
         result = await agent.execute(
@@ -122,7 +146,7 @@ async def navigate_to_coveredca(
             image_provider=AsyncScreenshotMaker()
         )
 
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
 
         return NavigationResult(
             success=result if isinstance(result, bool) else True,
@@ -132,7 +156,7 @@ async def navigate_to_coveredca(
         )
 
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         return NavigationResult(
             success=False,
             reached_coveredca=False,
@@ -158,7 +182,9 @@ async def explore_plan_options(
     Returns:
         NavigationResult with navigation outcome
     """
-    start_time = datetime.now()
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+
+    start_time = time.perf_counter()
 
     agent = AsyncDefaultAgent(
         max_steps=30,
@@ -166,23 +192,9 @@ async def explore_plan_options(
         verbose=verbose
     )
 
-    instruction = f"""
-    1. Navigate to https://www.coveredca.com
-    2. Click 'Shop and Compare' or 'Get Started'
-    3. Enter ZIP code: {user_info.zip_code}
-    4. Enter household information:
-       - Household size: {user_info.household_size}
-       - Annual income: ${user_info.annual_income:,}
-    5. Click 'See Plans' or 'Get Quote'
-    6. Wait for plan results to load
-    7. Filter plans by tier: {plan_tier}
-    8. For each displayed plan, note:
-       - Plan name
-       - Monthly premium
-       - Annual deductible
-       - Insurance provider
-    9. Take a screenshot of the plan comparison
-    """
+    values = asdict(user_info)
+    values["plan_tier"] = plan_tier
+    instruction = PLAN_OPTIONS_INSTRUCTION.format_map(values)
 
     try:
         result = await agent.execute(
@@ -191,7 +203,7 @@ async def explore_plan_options(
             image_provider=AsyncScreenshotMaker()
         )
 
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
 
         return NavigationResult(
             success=result if isinstance(result, bool) else True,
@@ -201,7 +213,7 @@ async def explore_plan_options(
         )
 
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         return NavigationResult(
             success=False,
             reached_coveredca=False,
@@ -213,26 +225,28 @@ async def explore_plan_options(
 
 def print_results(result: NavigationResult, user_info: UserInfo):
     """Print formatted navigation results."""
-    print("\n" + "=" * 60)
-    print("HEALTHCARE NAVIGATION RESULTS")
-    print("=" * 60)
-    print(f"\nUser Information:")
-    print(f"  ZIP Code: {user_info.zip_code}")
-    print(f"  State: {user_info.state}")
-    print(f"  Household Size: {user_info.household_size}")
-    print(f"  Annual Income: ${user_info.annual_income:,}")
-
-    print(f"\nNavigation Status:")
-    print(f"  Success: {'Yes' if result.success else 'No'}")
-    print(f"  Reached CoveredCA: {'Yes' if result.reached_coveredca else 'No'}")
-    print(f"  Plans Displayed: {'Yes' if result.plans_displayed else 'No'}")
-    print(f"  Execution Time: {result.execution_time:.2f} seconds")
+    lines = [
+        "\n" + SEPARATOR,
+        "HEALTHCARE NAVIGATION RESULTS",
+        SEPARATOR,
+        "\nUser Information:",
+    ]
+    for label, attr, fmt in _USER_FIELDS:
+        lines.append(f"  {label}: {fmt.format(getattr(user_info, attr))}")
+
+    lines.append("\nNavigation Status:")
+    for label, attr in _STATUS_FIELDS:
+        lines.append(f"  {label}: {'Yes' if getattr(result, attr) else 'No'}")
+    lines.append(f"  Execution Time: {result.execution_time:.2f} seconds")
 
     if result.error_message:
-        print(f"\nError: {result.error_message}")
+        lines.append(f"\nError: {result.error_message}")
 
     if result.screenshot_path:
-        print(f"\nScreenshot saved: {result.screenshot_path}")
+        lines.append(f"\nScreenshot saved: {result.screenshot_path}")
+
+    # One write for the whole report instead of a flush per line
+    print("\n".join(lines))
 
 
 def parse_args():
@@ -297,6 +311,11 @@ async def main():
     """Main entry point."""
     args = parse_args()
 
+    # oagi is imported by the agent functions, so --help stays fast
+    if importlib.util.find_spec("oagi") is None:
+        print("Error: oagi package not installed. Run: pip install oagi")
+        return 1
+
     # Create user info
     user_info = UserInfo(
         zip_code=args.zip_code,
@@ -308,12 +327,14 @@ async def main():
         num_dependents=args.dependents
     )
 
-    print("=" * 60)
-    print("Healthcare Navigation - Actor Mode Example")
-    print("=" * 60)
-    print(f"\nModel: lux-actor-1 (Actor mode)")
-    print("Speed: ~1 second per step")
-    print(f"\nStarting from: {'CoveredCA (direct)' if args.direct else 'Healthcare.gov'}")
+    print("\n".join([
+        SEPARATOR,
+        "Healthcare Navigation - Actor Mode Example",
+        SEPARATOR,
+        "\nModel: lux-actor-1 (Actor mode)",
+        "Speed: ~1 second per step",
+        f"\nStarting from: {'CoveredCA (direct)' if args.direct else 'Healthcare.gov'}",
+    ]))
 
     if args.direct:
         result = await explore_plan_options(
@@ -330,5 +351,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
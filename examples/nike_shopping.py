@@ -17,22 +17,71 @@ Usage:
 
 import asyncio
 import argparse
+import importlib.util
 from dataclasses import dataclass
 from typing import Optional, List
-from datetime import datetime
 import sys
-import os
+import time
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SEPARATOR = "=" * 60
 
-try:
-    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
-except ImportError:
-    print("Error: oagi package not installed. Run: pip install oagi")
-    sys.exit(1)
+SHOP_INSTRUCTION = """
+    1. Navigate to https://www.nike.com
+    2. Click on the search icon or search bar
+    3. Type '{product_query}' in the search field
+    4. Press Enter or click search
+    5. Wait for search results to load
+    6. Apply filters:
+       {filter_instructions}
+    7. Click on the first product in the results
+    8. Wait for product page to load completely
+    9. Note the product name and price
+    10. Click on size selector
+    11. Select size: {size}
+    12. Verify size {size} is available
+    """
+
+ADD_TO_CART_STEPS = """
+    13. Click 'Add to Bag' button
+    14. Wait for confirmation
+    15. Verify item was added to cart (check cart icon or popup)
+    """
 
+CHECKOUT_STEPS = """
+    16. Click on cart icon
+    17. Click 'Checkout' button
+    18. Wait for checkout page to load
+    """
 
-@dataclass
+# Trailing steps appended to SHOP_INSTRUCTION, keyed on (add_to_cart, checkout)
+SHOP_TAILS = {
+    (False, False): "",
+    (True, False): ADD_TO_CART_STEPS,
+    (False, True): CHECKOUT_STEPS,
+    (True, True): ADD_TO_CART_STEPS + CHECKOUT_STEPS,
+}
+
+AVAILABILITY_INSTRUCTION = """
+    1. Navigate to {product_url}
+    2. Wait for product page to load
+    3. Note the product name and current price
+    4. Look at the size selector
+    5. Check if size {size} is available (not grayed out)
+    6. Note all available sizes
+    7. Check if 'Add to Bag' button is active
+    """
+
+
+# (label, attribute) yes/no rows printed by print_results
+_STATUS_FIELDS = (
+    ("Success", "success"),
+    ("Product Found", "product_found"),
+    ("Size Available", "size_available"),
+    ("Added to Cart", "added_to_cart"),
+)
+
+
+@dataclass(slots=True)
 class ShoppingConfig:
     """Configuration for Nike shopping automation."""
     product_query: str
@@ -44,7 +93,7 @@ class ShoppingConfig:
     checkout: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProductInfo:
     """Information about a Nike product."""
     name: str
@@ -55,7 +104,7 @@ class ProductInfo:
     url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ShoppingResult:
     """Result of Nike shopping automation."""
     success: bool
@@ -84,7 +133,9 @@ async def shop_nike(
     Returns:
         ShoppingResult with shopping outcome
     """
-    start_time = datetime.now()
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+
+    start_time = time.perf_counter()
 
     agent = AsyncDefaultAgent(
         max_steps=30,
@@ -103,35 +154,11 @@ async def shop_nike(
 
     filter_instructions = "\n       ".join(filters) if filters else "No additional filters"
 
-    instruction = f"""
-    1. Navigate to https://www.nike.com
-    2. Click on the search icon or search bar
-    3. Type '{config.product_query}' in the search field
-    4. Press Enter or click search
-    5. Wait for search results to load
-    6. Apply filters:
-       {filter_instructions}
-    7. Click on the first product in the results
-    8. Wait for product page to load completely
-    9. Note the product name and price
-    10. Click on size selector
-    11. Select size: {config.size}
-    12. Verify size {config.size} is available
-    """
-
-    if config.add_to_cart:
-        instruction += """
-    13. Click 'Add to Bag' button
-    14. Wait for confirmation
-    15. Verify item was added to cart (check cart icon or popup)
-    """
-
-    if config.checkout:
-        instruction += """
-    16. Click on cart icon
-    17. Click 'Checkout' button
-    18. Wait for checkout page to load
-    """
+    instruction = SHOP_INSTRUCTION.format(
+        product_query=config.product_query,
+        filter_instructions=filter_instructions,
+        size=config.size
+    ) + SHOP_TAILS[config.add_to_cart, config.checkout]
 
     try:
         result = await agent.execute(
@@ -140,7 +167,7 @@ async def shop_nike(
             image_provider=AsyncScreenshotMaker()
         )
 
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
 
         return ShoppingResult(
             success=result if isinstance(result, bool) else True,
@@ -151,7 +178,7 @@ async def shop_nike(
         )
 
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         return ShoppingResult(
             success=False,
             product_found=False,
@@ -178,7 +205,9 @@ async def check_product_availability(
     Returns:
         ShoppingResult with availability info
     """
-    start_time = datetime.now()
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+
+    start_time = time.perf_counter()
 
     agent = AsyncDefaultAgent(
         max_steps=15,
@@ -186,15 +215,10 @@ async def check_product_availability(
         verbose=verbose
     )
 
-    instruction = f"""
-    1. Navigate to {product_url}
-    2. Wait for product page to load
-    3. Note the product name and current price
-    4. Look at the size selector
-    5. Check if size {size} is available (not grayed out)
-    6. Note all available sizes
-    7. Check if 'Add to Bag' button is active
-    """
+    instruction = AVAILABILITY_INSTRUCTION.format(
+        product_url=product_url,
+        size=size
+    )
 
     try:
         result = await agent.execute(
@@ -203,7 +227,7 @@ async def check_product_availability(
             image_provider=AsyncScreenshotMaker()
         )
 
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
 
         return ShoppingResult(
             success=result if isinstance(result, bool) else True,
@@ -214,7 +238,7 @@ async def check_product_availability(
         )
 
     except Exception as e:
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.perf_counter() - start_time
         return ShoppingResult(
             success=False,
             product_found=False,
@@ -228,72 +252,86 @@ async def check_product_availability(
 async def compare_products(
     products: List[str],
     size: str,
-    verbose: bool = False
+    verbose: bool = False,
+    concurrency: int = 1
 ) -> dict:
     """
     Compare multiple Nike products.
 
+    At most `concurrency` shopping sessions run at once. Values above 1
+    require isolated desktop sessions (e.g. OSGym environments).
+
     Args:
         products: List of product search queries
         size: Size to check for all products
         verbose: Enable verbose logging
+        concurrency: Maximum number of concurrent agent sessions
 
     Returns:
         dict mapping product queries to ShoppingResult
     """
-    results = {}
-
-    for i, product in enumerate(products, 1):
-        print(f"\n[{i}/{len(products)}] Searching: {product}")
+    semaphore = asyncio.Semaphore(max(1, concurrency))
 
+    async def compare(i: int, product: str):
         config = ShoppingConfig(
             product_query=product,
             size=size,
             add_to_cart=False
         )
 
-        result = await shop_nike(config, verbose)
-        results[product] = result
+        async with semaphore:
+            print(f"\n[{i}/{len(products)}] Searching: {product}")
+            return product, await shop_nike(config, verbose)
 
-        status = "Found" if result.product_found else "Not Found"
-        print(f"    Status: {status}")
-        print(f"    Time: {result.execution_time:.2f}s")
+    results = dict(await asyncio.gather(
+        *(compare(i, product) for i, product in enumerate(products, 1))
+    ))
 
-        if i < len(products):
-            await asyncio.sleep(2)
+    # Report per-product status in input order once every session is done
+    lines = []
+    for product, result in results.items():
+        status = "Found" if result.product_found else "Not Found"
+        lines.append(f"\n{product}")
+        lines.append(f"    Status: {status}")
+        lines.append(f"    Time: {result.execution_time:.2f}s")
+    print("\n".join(lines))
 
     return results
 
 
 def print_results(result: ShoppingResult, config: ShoppingConfig):
     """Print formatted shopping results."""
-    print("\n" + "=" * 60)
-    print("NIKE SHOPPING RESULTS")
-    print("=" * 60)
-
-    print(f"\nSearch: {config.product_query}")
-    print(f"Size: {config.size}")
+    lines = [
+        "\n" + SEPARATOR,
+        "NIKE SHOPPING RESULTS",
+        SEPARATOR,
+        f"\nSearch: {config.product_query}",
+        f"Size: {config.size}",
+    ]
     if config.color:
-        print(f"Color: {config.color}")
+        lines.append(f"Color: {config.color}")
     if config.max_price:
-        print(f"Max Price: ${config.max_price:.2f}")
+        lines.append(f"Max Price: ${config.max_price:.2f}")
 
-    print(f"\nStatus:")
-    print(f"  Success: {'Yes' if result.success else 'No'}")
-    print(f"  Product Found: {'Yes' if result.product_found else 'No'}")
-    print(f"  Size Available: {'Yes' if result.size_available else 'No'}")
-    print(f"  Added to Cart: {'Yes' if result.added_to_cart else 'No'}")
-    print(f"  Execution Time: {result.execution_time:.2f} seconds")
+    lines.append("\nStatus:")
+    for label, attr in _STATUS_FIELDS:
+        lines.append(f"  {label}: {'Yes' if getattr(result, attr) else 'No'}")
+    lines.append(f"  Execution Time: {result.execution_time:.2f} seconds")
 
     if result.product:
-        print(f"\nProduct Details:")
-        print(f"  Name: {result.product.name}")
-        print(f"  Price: ${result.product.price:.2f}")
-        print(f"  Color: {result.product.color}")
-        print(f"  In Stock: {'Yes' if result.product.in_stock else 'No'}")
+        lines += [
+            "\nProduct Details:",
+            f"  Name: {result.product.name}",
+            f"  Price: ${result.product.price:.2f}",
+            f"  Color: {result.product.color}",
+            f"  In Stock: {'Yes' if result.product.in_stock else 'No'}",
+        ]
 
     if result.error_message:
-        print(f"\nError: {result.error_message}")
+        lines.append(f"\nError: {result.error_message}")
+
+    # One write for the whole report instead of a flush per line
+    print("\n".join(lines))
 
 
 def parse_args():
@@ -340,6 +378,12 @@ def parse_args():
         nargs="+",
         help="Compare multiple products"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Maximum concurrent sessions for --compare (default: 1)"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -353,23 +397,31 @@ async def main():
     """Main entry point."""
     args = parse_args()
 
-    print("=" * 60)
-    print("Nike Shopping - Actor Mode Example")
-    print("=" * 60)
-    print(f"\nModel: lux-actor-1 (Actor mode)")
-    print("Speed: ~1 second per step")
+    # oagi is imported by the agent functions, so --help stays fast
+    if importlib.util.find_spec("oagi") is None:
+        print("Error: oagi package not installed. Run: pip install oagi")
+        return 1
+
+    print("\n".join([
+        SEPARATOR,
+        "Nike Shopping - Actor Mode Example",
+        SEPARATOR,
+        "\nModel: lux-actor-1 (Actor mode)",
+        "Speed: ~1 second per step",
+    ]))
 
     if args.compare:
         # Compare multiple products
         print(f"\nComparing {len(args.compare)} products...")
-        results = await compare_products(args.compare, args.size, args.verbose)
+        results = await compare_products(
+            args.compare, args.size, args.verbose, args.concurrency
+        )
 
-        print("\n" + "=" * 60)
-        print("COMPARISON SUMMARY")
-        print("=" * 60)
+        lines = ["\n" + SEPARATOR, "COMPARISON SUMMARY", SEPARATOR]
         for product, result in results.items():
             status = "OK" if result.success else "FAIL"
-            print(f"  [{status}] {product}")
+            lines.append(f"  [{status}] {product}")
+        print("\n".join(lines))
 
     else:
         # Single product search
@@ -391,5 +443,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
@@ -21,15 +21,30 @@ Usage:
 
 import asyncio
 import argparse
-from dataclasses import dataclass, field
-from typing import List, Optional
+import functools
+import importlib.util
+import json
+import math
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 import sys
+import time
 import os
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Only add the project root to sys.path when run as a plain script;
+# `python -m examples.<name>` from the project root already resolves src.
+if importlib.util.find_spec("src") is None:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.rate_limit import AdaptiveConcurrencyLimiter
+
+try:
+    import orjson  # Optional: faster result encoding
+except ImportError:
+    orjson = None
 
 try:
     from oagi import TaskerAgent
@@ -47,7 +62,15 @@ class TestStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+_STATUS_SYMBOL = {
+    TestStatus.PASSED: "[PASS]",
+    TestStatus.FAILED: "[FAIL]",
+    TestStatus.SKIPPED: "[SKIP]",
+    TestStatus.ERROR: "[ERROR]"
+}
+
+
+@dataclass(slots=True)
 class TestCase:
     """Definition of a single test case."""
     name: str
@@ -57,7 +80,7 @@ class TestCase:
     category: str = "general"
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of a single test case execution."""
     test_name: str
@@ -67,17 +90,46 @@ class TestResult:
     screenshots: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TestReport:
-    """Complete test report."""
-    total_tests: int
-    passed: int
-    failed: int
-    skipped: int
-    errors: int
+    """Complete test report. Counts and pass rate are derived from results."""
     duration: float
     results: List[TestResult] = field(default_factory=list)
     timestamp: str = ""
+    total_tests: int = field(init=False)
+    passed: int = field(init=False)
+    failed: int = field(init=False)
+    skipped: int = field(init=False)
+    errors: int = field(init=False)
+    pass_rate: float = field(init=False)
+    mean_duration: float = field(init=False)
+    p95_duration: float = field(init=False)
+
+    def __post_init__(self):
+        counts = Counter(r.status for r in self.results)
+        self.total_tests = len(self.results)
+        self.passed = counts[TestStatus.PASSED]
+        self.failed = counts[TestStatus.FAILED]
+        self.skipped = counts[TestStatus.SKIPPED]
+        self.errors = counts[TestStatus.ERROR]
+        self.pass_rate = (self.passed / self.total_tests * 100) if self.total_tests > 0 else 0.0
+
+        durations = sorted(r.duration for r in self.results)
+        if durations:
+            self.mean_duration = sum(durations) / len(durations)
+            # Nearest-rank percentile
+            self.p95_duration = durations[math.ceil(0.95 * len(durations)) - 1]
+        else:
+            self.mean_duration = self.p95_duration = 0.0
+
+
+def encode_result(result: TestResult) -> bytes:
+    """Encode a test result as one JSON line (without the newline)."""
+    data = asdict(result)
+    data["status"] = result.status.value
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
 
 
 # Define sidebar navigation test cases
@@ -90,30 +142,36 @@ SIDEBAR_BUTTONS = [
     "About"
 ]
 
-
-def generate_sidebar_tests() -> List[TestCase]:
-    """Generate test cases for all sidebar buttons."""
-    tests = []
-    for button in SIDEBAR_BUTTONS:
-        tests.append(TestCase(
+# Steps shared by every sidebar test, with {button} filled per test. The
+# step text is identical across tests apart from the button name.
+SIDEBAR_STEP_TEMPLATES = (
+    "Locate the '{button}' button in the left sidebar",
+    "Click the '{button}' button",
+    "Wait for the {button} page to load",
+    "Verify the {button} page content is displayed correctly",
+    "Take a screenshot for verification",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def generate_sidebar_tests() -> Tuple[TestCase, ...]:
+    """Generate test cases for all sidebar buttons (built once, shared)."""
+    return tuple(
+        TestCase(
             name=f"sidebar_{button.lower()}_navigation",
             description=f"Test navigation to {button} page via sidebar",
-            steps=[
-                f"Locate the '{button}' button in the left sidebar",
-                f"Click the '{button}' button",
-                f"Wait for the {button} page to load",
-                f"Verify the {button} page content is displayed correctly",
-                "Take a screenshot for verification"
-            ],
+            steps=[step.format(button=button) for step in SIDEBAR_STEP_TEMPLATES],
             expected_result=f"The {button} page should load with appropriate content displayed",
             category="navigation"
-        ))
-    return tests
+        )
+        for button in SIDEBAR_BUTTONS
+    )
 
 
-def generate_playback_tests() -> List[TestCase]:
-    """Generate test cases for playback functionality."""
-    return [
+@functools.lru_cache(maxsize=1)
+def generate_playback_tests() -> Tuple[TestCase, ...]:
+    """Generate test cases for playback functionality (built once, shared)."""
+    return (
         TestCase(
             name="search_and_play",
             description="Search for a song and play it",
@@ -170,12 +228,13 @@ def generate_playback_tests() -> List[TestCase]:
             expected_result="Skip controls should navigate between songs",
             category="playback"
         )
-    ]
+    )
 
 
-def generate_search_tests() -> List[TestCase]:
-    """Generate test cases for search functionality."""
-    return [
+@functools.lru_cache(maxsize=1)
+def generate_search_tests() -> Tuple[TestCase, ...]:
+    """Generate test cases for search functionality (built once, shared)."""
+    return (
         TestCase(
             name="basic_search",
             description="Test basic search functionality",
@@ -215,39 +274,69 @@ def generate_search_tests() -> List[TestCase]:
             expected_result="App should handle special characters without crashing",
             category="search"
         )
-    ]
+    )
+
 
+# Suites in the order they run, keyed by name
+TEST_SUITES = {
+    "sidebar": generate_sidebar_tests,
+    "playback": generate_playback_tests,
+    "search": generate_search_tests,
+}
 
-async def run_test(test: TestCase, verbose: bool = False) -> TestResult:
+
+def _new_tasker(max_steps: int, verbose: bool) -> TaskerAgent:
+    """Create a TaskerAgent for one session."""
+    return TaskerAgent(
+        max_steps=max_steps,
+        model="lux-tasker-1",
+        retry_on_failure=True,
+        max_retries=2,
+        timeout_per_step=15,
+        verbose=verbose
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_tasker(max_steps: int, verbose: bool) -> TaskerAgent:
+    """Return a shared TaskerAgent so its client is reused across tests."""
+    return _new_tasker(max_steps, verbose)
+
+
+async def run_test(
+    test: TestCase,
+    verbose: bool = False,
+    action_handler: Optional[AsyncPyautoguiActionHandler] = None,
+    image_provider: Optional[AsyncScreenshotMaker] = None,
+    isolated: bool = False
+) -> TestResult:
     """
     Execute a single test case using TaskerAgent.
 
     Args:
         test: TestCase to execute
         verbose: Enable verbose logging
+        action_handler: Shared action handler (created if None)
+        image_provider: Shared screenshot maker (created if None)
+        isolated: Use a TaskerAgent of its own instead of the shared one,
+            for tests running concurrently
 
     Returns:
         TestResult with execution details
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
 
-    tasker = TaskerAgent(
-        max_steps=len(test.steps) + 5,  # Extra steps for verification
-        model="lux-tasker-1",
-        retry_on_failure=True,
-        max_retries=2,
-        timeout_per_step=15,
-        verbose=verbose
-    )
+    # Extra steps for verification
+    tasker = (_new_tasker if isolated else _get_tasker)(len(test.steps) + 5, verbose)
 
     try:
         result = await tasker.execute(
             steps=test.steps,
-            action_handler=AsyncPyautoguiActionHandler(),
-            image_provider=AsyncScreenshotMaker(),
+            action_handler=action_handler or AsyncPyautoguiActionHandler(),
+            image_provider=image_provider or AsyncScreenshotMaker(),
         )
 
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
 
         if result.success:
             return TestResult(
@@ -264,7 +353,7 @@ async def run_test(test: TestCase, verbose: bool = False) -> TestResult:
             )
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         return TestResult(
             test_name=test.name,
             status=TestStatus.ERROR,
@@ -273,52 +362,176 @@ async def run_test(test: TestCase, verbose: bool = False) -> TestResult:
         )
 
 
-async def run_test_suite(tests: List[TestCase], verbose: bool = False) -> TestReport:
+async def run_test_batch(
+    tests: List[TestCase],
+    verbose: bool = False,
+    action_handler: Optional[AsyncPyautoguiActionHandler] = None,
+    image_provider: Optional[AsyncScreenshotMaker] = None,
+    isolated: bool = False
+) -> List[TestResult]:
     """
-    Run a suite of test cases.
+    Execute several test cases as one TaskerAgent run.
+
+    The steps of all tests are submitted in a single session, so tests
+    built from the same template (e.g. the sidebar pages) are planned
+    together instead of once per test. If the combined run does not
+    succeed, each test is re-run on its own to find the failures.
 
     Args:
-        tests: List of TestCase to execute
+        tests: TestCases to execute, in order
         verbose: Enable verbose logging
+        action_handler: Shared action handler (created if None)
+        image_provider: Shared screenshot maker (created if None)
+        isolated: Use TaskerAgents of its own instead of the shared ones,
+            for batches running concurrently
 
     Returns:
-        TestReport with all results
+        List of TestResult in the same order as tests
     """
-    start_time = datetime.now()
-    results = []
+    if len(tests) < 2:
+        return [
+            await run_test(test, verbose, action_handler, image_provider, isolated)
+            for test in tests
+        ]
+
+    start_time = time.perf_counter()
+    steps = [step for test in tests for step in test.steps]
+    tasker = (_new_tasker if isolated else _get_tasker)(len(steps) + 5, verbose)
+
+    try:
+        result = await tasker.execute(
+            steps=steps,
+            action_handler=action_handler or AsyncPyautoguiActionHandler(),
+            image_provider=image_provider or AsyncScreenshotMaker(),
+        )
+        success = result.success
+    except Exception:
+        success = False
+
+    if success:
+        # Per-test time is not observable inside one run; split it evenly
+        duration = (time.perf_counter() - start_time) / len(tests)
+        return [
+            TestResult(test_name=test.name, status=TestStatus.PASSED, duration=duration)
+            for test in tests
+        ]
+
+    print(f"        Batch of {len(tests)} failed; re-running tests individually")
+    return [
+        await run_test(test, verbose, action_handler, image_provider, isolated)
+        for test in tests
+    ]
 
-    print(f"\nRunning {len(tests)} test(s)...\n")
 
-    for i, test in enumerate(tests, 1):
-        print(f"[{i}/{len(tests)}] {test.name}")
-        print(f"        {test.description}")
+async def run_test_suite(
+    tests: List[TestCase],
+    verbose: bool = False,
+    concurrency: int = 1,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+    batch: bool = False,
+    pace_seconds: float = 0.0,
+    results_path: Optional[str] = None
+) -> TestReport:
+    """
+    Run a suite of test cases.
 
-        result = await run_test(test, verbose)
-        results.append(result)
+    Tests start one at a time and the number running at once grows
+    towards `concurrency` while they succeed; each ERROR result (timeouts,
+    backend overload) halves it. Values above 1 require tests that do not
+    share UI state, e.g. separate Nuclear Player instances in isolated
+    desktop sessions.
 
-        status_symbol = {
-            TestStatus.PASSED: "[PASS]",
-            TestStatus.FAILED: "[FAIL]",
-            TestStatus.SKIPPED: "[SKIP]",
-            TestStatus.ERROR: "[ERROR]"
-        }
+    Args:
+        tests: List of TestCase to execute
+        verbose: Enable verbose logging
+        concurrency: Maximum number of concurrent TaskerAgent sessions
+        limiter: Limiter shared with other suites (overrides concurrency)
+        batch: Run each category as one TaskerAgent session (see run_test_batch)
+        pace_seconds: Pause after each test before its session slot is freed
+        results_path: JSONL file that each result is written to as it finishes
 
-        print(f"        {status_symbol[result.status]} ({result.duration:.2f}s)")
-        if result.error_message:
-            print(f"        Error: {result.error_message}")
+    Returns:
+        TestReport with all results
+    """
+    start_time = time.perf_counter()
+    if limiter is None:
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency=max(1, concurrency))
+    # TaskerAgent keeps per-run state, so once more than one job may run at
+    # once each job gets its own tasker and handlers
+    isolated = limiter.max_concurrency > 1
+    if not isolated:
+        action_handler = AsyncPyautoguiActionHandler()
+        image_provider = AsyncScreenshotMaker()
 
-        # Brief pause between tests
-        if i < len(tests):
-            await asyncio.sleep(1)
+    print(f"\nRunning {len(tests)} test(s)...\n")
 
-    total_duration = (datetime.now() - start_time).total_seconds()
+    if batch:
+        groups = {}
+        for test in tests:
+            groups.setdefault(test.category, []).append(test)
+        jobs = list(groups.values())
+    else:
+        jobs = [[test] for test in tests]
+    numbers = {test.name: i for i, test in enumerate(tests, 1)}
+
+    error = TestStatus.ERROR
+
+    async def run(job: List[TestCase]) -> List[TestResult]:
+        await limiter.acquire()
+        header = []
+        for test in job:
+            header.append(f"[{numbers[test.name]}/{len(tests)}] {test.name}")
+            header.append(f"        {test.description}")
+        if verbose:
+            # Progressive output so agent logs appear under their test
+            print("\n".join(header))
+            header = []
+
+        # Free the slot even if the job raises or is cancelled, so other
+        # jobs waiting on the limiter are not stuck
+        overloaded = True
+        try:
+            if isolated:
+                job_results = await run_test_batch(
+                    job, verbose, AsyncPyautoguiActionHandler(), AsyncScreenshotMaker(), isolated=True
+                )
+            else:
+                job_results = await run_test_batch(job, verbose, action_handler, image_provider)
+            overloaded = any(r.status is error for r in job_results)
+            if pace_seconds > 0:
+                await asyncio.sleep(pace_seconds)
+        finally:
+            await limiter.release(overloaded=overloaded)
+
+        # One write per finished job keeps concurrent output from interleaving
+        lines = header
+        for result in job_results:
+            lines.append(f"        {result.test_name}: {_STATUS_SYMBOL[result.status]} ({result.duration:.2f}s)")
+            if result.error_message:
+                lines.append(f"        Error: {result.error_message}")
+        print("\n".join(lines))
+
+        if results_file is not None:
+            results_file.write(b"".join(encode_result(r) + b"\n" for r in job_results))
+            results_file.flush()
+        return job_results
+
+    # Results stream to disk as they finish, so an interrupted run keeps them
+    results_file = open(results_path, "wb") if results_path else None
+    try:
+        # Results come back in submission order regardless of completion order
+        results = [
+            result
+            for job_results in await asyncio.gather(*(run(job) for job in jobs))
+            for result in job_results
+        ]
+    finally:
+        if results_file is not None:
+            results_file.close()
+
+    total_duration = time.perf_counter() - start_time
 
     return TestReport(
-        total_tests=len(tests),
-        passed=sum(1 for r in results if r.status == TestStatus.PASSED),
-        failed=sum(1 for r in results if r.status == TestStatus.FAILED),
-        skipped=sum(1 for r in results if r.status == TestStatus.SKIPPED),
-        errors=sum(1 for r in results if r.status == TestStatus.ERROR),
         duration=total_duration,
         results=results,
         timestamp=datetime.now().isoformat()
@@ -339,13 +552,14 @@ def print_report(report: TestReport):
     print(f"  Errors:  {report.errors}")
     print(f"  Skipped: {report.skipped}")
 
-    pass_rate = (report.passed / report.total_tests * 100) if report.total_tests > 0 else 0
-    print(f"\nPass Rate: {pass_rate:.1f}%")
+    print(f"\nPass Rate: {report.pass_rate:.1f}%")
+    print(f"Test Duration: mean {report.mean_duration:.2f}s, p95 {report.p95_duration:.2f}s")
 
     if report.failed > 0 or report.errors > 0:
         print("\nFailed/Error Tests:")
+        failed, error = TestStatus.FAILED, TestStatus.ERROR
         for result in report.results:
-            if result.status in (TestStatus.FAILED, TestStatus.ERROR):
+            if result.status is failed or result.status is error:
                 print(f"  - {result.test_name}: {result.error_message}")
 
 
@@ -362,6 +576,15 @@ def parse_args():
                         help="Test search functionality")
     parser.add_argument("--all", action="store_true",
                         help="Run all test suites")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Maximum tests to run at once (default: 1; "
+                             "higher values need isolated desktop sessions)")
+    parser.add_argument("--batch", action="store_true",
+                        help="Run each test category as one TaskerAgent session")
+    parser.add_argument("--pace", type=float, default=0.0,
+                        help="Seconds to pause after each test (default: 0)")
+    parser.add_argument("--output", "-o",
+                        help="Write each test result to this JSONL file as it finishes")
     parser.add_argument("--verbose", action="store_true",
                         help="Enable verbose output")
 
@@ -372,39 +595,46 @@ async def main():
     """Main entry point."""
     args = parse_args()
 
-    # Collect tests based on arguments
-    tests = []
-
-    if args.all or args.verify_all_pages:
-        tests.extend(generate_sidebar_tests())
-
-    if args.all or args.test_playback:
-        tests.extend(generate_playback_tests())
-
-    if args.all or args.test_search:
-        tests.extend(generate_search_tests())
+    # Collect tests based on arguments; each suite is included at most once
+    selected = {
+        "sidebar": args.verify_all_pages,
+        "playback": args.test_playback,
+        "search": args.test_search,
+    }
+    tests = [
+        test
+        for name, generate in TEST_SUITES.items()
+        if args.all or selected[name]
+        for test in generate()
+    ]
 
     # Default to sidebar tests if nothing specified
     if not tests:
         print("No test suite specified. Running sidebar navigation tests by default.")
-        tests = generate_sidebar_tests()
+        tests = list(generate_sidebar_tests())
 
     print("=" * 60)
     print("Nuclear Player QA Testing - TaskerAgent Example")
     print("=" * 60)
     print(f"\nTest Categories:")
 
-    categories = set(t.category for t in tests)
-    for cat in sorted(categories):
-        count = sum(1 for t in tests if t.category == cat)
-        print(f"  - {cat}: {count} test(s)")
+    counts = Counter(t.category for t in tests)
+    for cat in sorted(counts):
+        print(f"  - {cat}: {counts[cat]} test(s)")
 
     # Verify Nuclear Player is running
     print("\nNote: Ensure Nuclear Player is running before starting tests.")
     print("      Download from: https://nuclear.js.org/")
 
     # Run test suite
-    report = await run_test_suite(tests, verbose=args.verbose)
+    report = await run_test_suite(
+        tests,
+        verbose=args.verbose,
+        concurrency=args.concurrency,
+        batch=args.batch,
+        pace_seconds=args.pace,
+        results_path=args.output
+    )
 
     # Print report
     print_report(report)
@@ -414,5 +644,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
@@ -7,13 +7,18 @@ Demonstrates QA testing capabilities:
 - Visual regression testing
 """
 
+import argparse
 import asyncio
+import importlib.util
 import os
 import sys
+from typing import Callable
 from dotenv import load_dotenv
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Only add the project root to sys.path when run as a plain script;
+# `python -m examples.<name>` from the project root already resolves src.
+if importlib.util.find_spec("src") is None:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.qa_testing import TestRunner, TestCase, UIValidator
 from src.qa_testing.test_runner import TestStep
@@ -22,11 +27,11 @@ from src.qa_testing.ui_validator import ValidationRule, ValidationType
 load_dotenv()
 
 
-async def demo_login_test():
+async def demo_login_test(emit: Callable[[str], None] = print):
     """Demonstrate login test execution."""
-    print("\n" + "=" * 50)
-    print("Demo: Login Test")
-    print("=" * 50)
+    emit("\n" + "=" * 50)
+    emit("Demo: Login Test")
+    emit("=" * 50)
 
     runner = TestRunner(max_steps_per_test=30, model="lux-tasker-1")
 
@@ -64,26 +69,26 @@ async def demo_login_test():
         tags=["authentication", "smoke"]
     )
 
-    print(f"\nRunning test: {login_test.name}")
-    print(f"Steps: {len(login_test.steps)}")
+    emit(f"\nRunning test: {login_test.name}")
+    emit(f"Steps: {len(login_test.steps)}")
 
     result = await runner.run_test(
         login_test,
         base_url="https://example.com/login"  # Replace with actual URL
     )
 
-    print(f"\nResult: {'PASS' if result.success else 'FAIL'}")
-    print(f"Steps passed: {result.steps_passed}/{result.steps_total}")
-    print(f"Duration: {result.duration_seconds:.2f}s")
+    emit(f"\nResult: {'PASS' if result.success else 'FAIL'}")
+    emit(f"Steps passed: {result.steps_passed}/{result.steps_total}")
+    emit(f"Duration: {result.duration_seconds:.2f}s")
     if result.errors:
-        print(f"Errors: {result.errors}")
+        emit(f"Errors: {result.errors}")
 
 
-async def demo_ui_validation():
+async def demo_ui_validation(emit: Callable[[str], None] = print):
     """Demonstrate UI validation capabilities."""
-    print("\n" + "=" * 50)
-    print("Demo: UI Validation")
-    print("=" * 50)
+    emit("\n" + "=" * 50)
+    emit("Demo: UI Validation")
+    emit("=" * 50)
 
     validator = UIValidator(max_steps=20, model="lux-actor-1")
 
@@ -108,30 +113,30 @@ async def demo_ui_validation():
         ),
     ]
 
-    print("\nValidating the following rules:")
+    emit("\nValidating the following rules:")
     for rule in rules:
-        print(f"  - {rule.validation_type.value}: {rule.target}")
+        emit(f"  - {rule.validation_type.value}: {rule.target}")
         if rule.expected_value:
-            print(f"    Expected: {rule.expected_value}")
+            emit(f"    Expected: {rule.expected_value}")
 
     results = await validator.validate(
         url="https://example.com",  # Replace with actual URL
         rules=rules
     )
 
-    print("\nResults:")
+    emit("\nResults:")
     for result in results:
         status = "PASS" if result.passed else "FAIL"
-        print(f"  [{status}] {result.rule.validation_type.value}: {result.rule.target}")
+        emit(f"  [{status}] {result.rule.validation_type.value}: {result.rule.target}")
         if result.error_message:
-            print(f"        Error: {result.error_message}")
+            emit(f"        Error: {result.error_message}")
 
 
-async def demo_test_suite():
+async def demo_test_suite(emit: Callable[[str], None] = print):
     """Demonstrate running a test suite."""
-    print("\n" + "=" * 50)
-    print("Demo: Test Suite Execution")
-    print("=" * 50)
+    emit("\n" + "=" * 50)
+    emit("Demo: Test Suite Execution")
+    emit("=" * 50)
 
     runner = TestRunner(max_steps_per_test=20, model="lux-actor-1")
 
@@ -167,20 +172,20 @@ async def demo_test_suite():
         ),
     ]
 
-    print(f"\nRunning test suite with {len(tests)} tests...")
+    emit(f"\nRunning test suite with {len(tests)} tests...")
 
     results = await runner.run_suite(tests, stop_on_failure=False)
 
     # Generate report
     report = runner.generate_report(results, format="markdown")
-    print("\n" + report)
+    emit("\n" + report)
 
 
-async def demo_element_check():
+async def demo_element_check(emit: Callable[[str], None] = print):
     """Demonstrate quick element checking."""
-    print("\n" + "=" * 50)
-    print("Demo: Quick Element Check")
-    print("=" * 50)
+    emit("\n" + "=" * 50)
+    emit("Demo: Quick Element Check")
+    emit("=" * 50)
 
     validator = UIValidator(max_steps=10, model="lux-actor-1")
 
@@ -193,17 +198,32 @@ async def demo_element_check():
         ("Footer", "Check if footer is present"),
     ]
 
-    print(f"\nChecking elements on: {url}")
+    emit(f"\nChecking elements on: {url}")
 
-    for element, description in checks:
-        print(f"\n{description}...")
-        result = await validator.check_element_exists(url, element)
+    # All checks target the same page, so validate them in one session
+    rules = [
+        ValidationRule(ValidationType.ELEMENT_EXISTS, element)
+        for element, _ in checks
+    ]
+    results = await validator.validate(url, rules)
+
+    for (element, description), result in zip(checks, results):
         status = "Found" if result.passed else "Not found"
-        print(f"  {element}: {status}")
+        emit(f"\n{description}...")
+        emit(f"  {element}: {status}")
+
+
+async def main(parallel: bool = False):
+    """
+    Run all QA testing demos.
 
+    Demos print as they go. When run concurrently, each demo's output is
+    collected and printed once it finishes, so demos do not interleave.
 
-async def main():
-    """Run all QA testing demos."""
+    Args:
+        parallel: Run the demos concurrently. Requires isolated desktop
+            sessions, since each demo drives its own mouse and keyboard.
+    """
     print("=" * 60)
     print("   QA Testing Demonstration")
     print("   Using OpenAGI Lux Model")
@@ -215,11 +235,27 @@ async def main():
         print("Set it with: export OAGI_API_KEY='your_key_here'")
         print("Get your key at: https://developer.agiopen.org\n")
 
+    demos = [
+        demo_login_test,
+        demo_ui_validation,
+        demo_test_suite,
+        demo_element_check,
+    ]
+
     # Run demos
-    await demo_login_test()
-    await demo_ui_validation()
-    await demo_test_suite()
-    await demo_element_check()
+    if parallel:
+        buffers = [[] for _ in demos]
+        outcomes = await asyncio.gather(
+            *(demo(buffer.append) for demo, buffer in zip(demos, buffers)),
+            return_exceptions=True
+        )
+        for demo, buffer, outcome in zip(demos, buffers, outcomes):
+            print("\n".join(buffer))
+            if isinstance(outcome, Exception):
+                print(f"\n{demo.__name__} failed: {outcome}")
+    else:
+        for demo in demos:
+            await demo()
 
     print("\n" + "=" * 60)
     print("All QA testing demos completed!")
@@ -227,4 +263,18 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Run the QA testing demos")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run demos concurrently (requires isolated desktop sessions)"
+    )
+    args = parser.parse_args()
+
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(main(parallel=args.parallel))
@@ -8,40 +8,86 @@ Tests include:
 - Systematic functionality testing
 """
 
+import argparse
 import asyncio
+import json
 import os
 import sys
+import time
+from collections import Counter
+from dataclasses import replace
 from datetime import datetime
+from itertools import chain
+from typing import Optional, TextIO
 from dotenv import load_dotenv
 
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 # Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, _PROJECT_ROOT)
 
 from src.qa_testing import TestRunner, TestCase, UIValidator
 from src.qa_testing.test_runner import TestStep
 from src.qa_testing.ui_validator import ValidationRule, ValidationType
 
-load_dotenv()
+load_dotenv(os.path.join(_PROJECT_ROOT, ".env"))
 
 # Configuration
 APP_URL = "https://talentum.tkhongsap.io/"
-TEST_RESULTS = []
+
+# Caps agent sessions in flight across all phases. Raise QA_MAX_PARALLEL only
+# when each session gets its own desktop; on a shared desktop they would
+# fight over the mouse and keyboard.
+BROWSER_SEM = asyncio.Semaphore(int(os.getenv("QA_MAX_PARALLEL", "1")))
+
+
+# Line-buffered JSONL file that main() opens when --output is given; each
+# result is written as it is logged so an interrupted run keeps them
+RESULTS_FILE: Optional[TextIO] = None
+
+# Step tags selected with --tags; when set, the runner phases run only the
+# steps carrying one of them (e.g. "smoke")
+ONLY_TAGS: frozenset[str] = frozenset()
+
+STATUS_EMOJI = {"PASS": "✅", "FAIL": "❌", "ERROR": "⚠️"}
+
+# Lines logged by the test phases, written out by a single writer task
+LOG_QUEUE: asyncio.Queue = asyncio.Queue()
+
+
+def emit(text: str = ""):
+    """Queue a line of output for the log writer."""
+    LOG_QUEUE.put_nowait(text)
 
 
-def log_result(test_name: str, status: str, details: str = ""):
-    """Log test result with timestamp."""
-    timestamp = datetime.now().strftime("%H:%M:%S")
+async def _log_writer():
+    """Write queued lines to stdout, batching whatever has accumulated."""
+    while True:
+        lines = [await LOG_QUEUE.get()]
+        while not LOG_QUEUE.empty():
+            lines.append(LOG_QUEUE.get_nowait())
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        for _ in lines:
+            LOG_QUEUE.task_done()
+
+
+def log_result(results: list, test_name: str, status: str, details: str = ""):
+    """Log test result with timestamp, appending it to the phase's results."""
+    timestamp = time.strftime("%H:%M:%S")
     result = {
         "timestamp": timestamp,
         "test": test_name,
         "status": status,
         "details": details
     }
-    TEST_RESULTS.append(result)
-    status_emoji = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
-    print(f"[{timestamp}] {status_emoji} {test_name}: {status}")
+    results.append(result)
+    if RESULTS_FILE is not None:
+        RESULTS_FILE.write(json.dumps(result, ensure_ascii=False) + "\n")
+    status_emoji = STATUS_EMOJI.get(status, "⚠️")
+    emit(f"[{timestamp}] {status_emoji} {test_name}: {status}")
     if details:
-        print(f"           Details: {details}")
+        emit(f"           Details: {details}")
 
 
 async def test_ui_validation():
@@ -51,9 +97,10 @@ async def test_ui_validation():
     - Verify elements are clickable
     - Validate correct text display
     """
-    print("\n" + "=" * 60)
-    print("TEST 1: UI VALIDATION")
-    print("=" * 60)
+    results = []
+    emit("\n" + "=" * 60)
+    emit("TEST 1: UI VALIDATION")
+    emit("=" * 60)
 
     validator = UIValidator(max_steps=30, model="lux-actor-1")
 
@@ -84,36 +131,84 @@ async def test_ui_validation():
         ),
     ]
 
-    print(f"\nValidating UI elements on: {APP_URL}")
-    print("-" * 40)
+    emit(f"\nValidating UI elements on: {APP_URL}")
+    emit("-" * 40)
 
     try:
-        results = await validator.validate(
-            url=APP_URL,
-            rules=ui_rules
-        )
+        async with BROWSER_SEM:
+            validations = await validator.validate(
+                url=APP_URL,
+                rules=ui_rules
+            )
 
         passed = 0
         failed = 0
-        for result in results:
+        for result in validations:
             if result.passed:
                 passed += 1
                 log_result(
+                    results,
                     f"UI: {result.rule.target}",
                     "PASS"
                 )
             else:
                 failed += 1
                 log_result(
+                    results,
                     f"UI: {result.rule.target}",
                     "FAIL",
                     result.error_message or "Element not found or not as expected"
                 )
 
-        print(f"\nUI Validation Summary: {passed} passed, {failed} failed")
+        emit(f"\nUI Validation Summary: {passed} passed, {failed} failed")
 
     except Exception as e:
-        log_result("UI Validation", "ERROR", str(e))
+        log_result(results, "UI Validation", "ERROR", str(e))
+
+    return results
+
+
+NAVIGATION_TEST = TestCase(
+    name="Talentum Navigation Test",
+    description="Test navigation between different pages and sections",
+    steps=(
+        TestStep(
+            description="Verify homepage loaded",
+            action=f"Look at the current page ({APP_URL}) and confirm it has loaded. Identify the main sections visible.",
+            expected_result="Homepage is fully loaded with navigation elements visible",
+            tags=("smoke",)
+        ),
+        TestStep(
+            description="Identify navigation menu items",
+            action="Look for navigation menu items, sidebar links, or main menu options. List what navigation options are available.",
+            expected_result="Navigation options are identified",
+            tags=("smoke",)
+        ),
+        TestStep(
+            description="Click first navigation item",
+            action="Click on the first available navigation link or menu item (could be Dashboard, Home, or any main menu item)",
+            expected_result="Page navigates to the selected section",
+            tags=("smoke",)
+        ),
+        TestStep(
+            description="Verify navigation succeeded",
+            action="Confirm the page has changed or content has updated. Check for page title or heading changes.",
+            expected_result="New page/section is displayed",
+            tags=("smoke",)
+        ),
+        TestStep(
+            description="Navigate to another section",
+            action="Click on a different navigation item to go to another section of the app",
+            expected_result="Successfully navigated to another section"
+        ),
+        TestStep(
+            description="Return to home/dashboard",
+            action="Click on the logo, 'Home', or 'Dashboard' link to return to the main page",
+            expected_result="Returned to the home page or dashboard"
+        ),
+    ),
+    tags=["navigation", "core"]
+)
 
 
 async def test_navigation():
@@ -122,61 +217,26 @@ async def test_navigation():
     - Navigate between different pages/sections
     - Verify page transitions work correctly
     """
-    print("\n" + "=" * 60)
-    print("TEST 2: NAVIGATION TESTING")
-    print("=" * 60)
+    results = []
+    emit("\n" + "=" * 60)
+    emit("TEST 2: NAVIGATION TESTING")
+    emit("=" * 60)
 
     runner = TestRunner(max_steps_per_test=50, model="lux-actor-1", verbose=True)
 
-    navigation_test = TestCase(
-        name="Talentum Navigation Test",
-        description="Test navigation between different pages and sections",
-        steps=[
-            TestStep(
-                description="Verify homepage loaded",
-                action=f"Look at the current page ({APP_URL}) and confirm it has loaded. Identify the main sections visible.",
-                expected_result="Homepage is fully loaded with navigation elements visible"
-            ),
-            TestStep(
-                description="Identify navigation menu items",
-                action="Look for navigation menu items, sidebar links, or main menu options. List what navigation options are available.",
-                expected_result="Navigation options are identified"
-            ),
-            TestStep(
-                description="Click first navigation item",
-                action="Click on the first available navigation link or menu item (could be Dashboard, Home, or any main menu item)",
-                expected_result="Page navigates to the selected section"
-            ),
-            TestStep(
-                description="Verify navigation succeeded",
-                action="Confirm the page has changed or content has updated. Check for page title or heading changes.",
-                expected_result="New page/section is displayed"
-            ),
-            TestStep(
-                description="Navigate to another section",
-                action="Click on a different navigation item to go to another section of the app",
-                expected_result="Successfully navigated to another section"
-            ),
-            TestStep(
-                description="Return to home/dashboard",
-                action="Click on the logo, 'Home', or 'Dashboard' link to return to the main page",
-                expected_result="Returned to the home page or dashboard"
-            ),
-        ],
-        tags=["navigation", "core"]
-    )
-
-    print(f"\nRunning navigation test on: {APP_URL}")
-    print("-" * 40)
+    emit(f"\nRunning navigation test on: {APP_URL}")
+    emit("-" * 40)
 
     try:
-        result = await runner.run_test(
-            navigation_test,
-            base_url=APP_URL
-        )
+        async with BROWSER_SEM:
+            result = await runner.run_test(
+                replace(NAVIGATION_TEST, only_tags=ONLY_TAGS),
+                base_url=APP_URL
+            )
 
         status = "PASS" if result.success else "FAIL"
         log_result(
+            results,
             "Navigation Test",
             status,
             f"Steps passed: {result.steps_passed}/{result.steps_total}, Duration: {result.duration_seconds:.2f}s"
@@ -184,10 +244,66 @@ async def test_navigation():
 
         if result.errors:
             for error in result.errors:
-                print(f"  ⚠️ Error: {error}")
+                emit(f"  ⚠️ Error: {error}")
 
     except Exception as e:
-        log_result("Navigation Test", "ERROR", str(e))
+        log_result(results, "Navigation Test", "ERROR", str(e))
+
+    return results
+
+
+FUNCTIONALITY_TEST = TestCase(
+    name="Talentum Functionality Test",
+    description="Systematically test core functionality of the Talentum application",
+    steps=(
+        # Step 1: App State Assessment
+        TestStep(
+            description="Assess current app state",
+            action="Examine the current state of the Talentum app. Describe what you see - the main sections, any data displayed, user interface elements.",
+            expected_result="Current app state is documented",
+            tags=("smoke",)
+        ),
+        # Step 2: Identify interactive elements
+        TestStep(
+            description="Identify interactive elements",
+            action="Look for buttons, links, forms, dropdowns, or any interactive elements on the current page. List them.",
+            expected_result="Interactive elements are identified",
+            tags=("smoke",)
+        ),
+        # Step 3: Test a button or action
+        TestStep(
+            description="Test a primary action button",
+            action="Find and click a primary action button (like 'Add', 'Create', 'New', 'Submit', or similar). If a modal or form appears, note it.",
+            expected_result="Button is clickable and responds appropriately"
+        ),
+        # Step 4: Check for forms
+        TestStep(
+            description="Test form interaction (if any)",
+            action="If there's a form visible, click on an input field to test if it's focusable and accepts input. If no form, look for search or filter functionality.",
+            expected_result="Form elements are interactive"
+        ),
+        # Step 5: Test any dropdown/select
+        TestStep(
+            description="Test dropdown or menu",
+            action="Find any dropdown menu, select box, or expandable menu and click to open it. Verify it expands.",
+            expected_result="Dropdown opens and shows options"
+        ),
+        # Step 6: Check responsive elements
+        TestStep(
+            description="Verify page responsiveness",
+            action="Scroll down the page to see if there's more content. Check if the page scrolls smoothly and content loads properly.",
+            expected_result="Page scrolls and content is accessible"
+        ),
+        # Step 7: Final state check
+        TestStep(
+            description="Final state verification",
+            action="Navigate back to the main view/dashboard and confirm the app is in a stable state. Report any issues observed.",
+            expected_result="App is in stable state",
+            tags=("smoke",)
+        ),
+    ),
+    tags=["functionality", "core", "comprehensive"]
+)
 
 
 async def test_systematic_functionality():
@@ -196,9 +312,10 @@ async def test_systematic_functionality():
     - Test core app features
     - Capture state at each step
     """
-    print("\n" + "=" * 60)
-    print("TEST 3: SYSTEMATIC FUNCTIONALITY TESTING")
-    print("=" * 60)
+    results = []
+    emit("\n" + "=" * 60)
+    emit("TEST 3: SYSTEMATIC FUNCTIONALITY TESTING")
+    emit("=" * 60)
 
     runner = TestRunner(
         max_steps_per_test=60,
@@ -207,67 +324,19 @@ async def test_systematic_functionality():
         screenshot_on_failure=True
     )
 
-    functionality_test = TestCase(
-        name="Talentum Functionality Test",
-        description="Systematically test core functionality of the Talentum application",
-        steps=[
-            # Step 1: App State Assessment
-            TestStep(
-                description="Assess current app state",
-                action="Examine the current state of the Talentum app. Describe what you see - the main sections, any data displayed, user interface elements.",
-                expected_result="Current app state is documented"
-            ),
-            # Step 2: Identify interactive elements
-            TestStep(
-                description="Identify interactive elements",
-                action="Look for buttons, links, forms, dropdowns, or any interactive elements on the current page. List them.",
-                expected_result="Interactive elements are identified"
-            ),
-            # Step 3: Test a button or action
-            TestStep(
-                description="Test a primary action button",
-                action="Find and click a primary action button (like 'Add', 'Create', 'New', 'Submit', or similar). If a modal or form appears, note it.",
-                expected_result="Button is clickable and responds appropriately"
-            ),
-            # Step 4: Check for forms
-            TestStep(
-                description="Test form interaction (if any)",
-                action="If there's a form visible, click on an input field to test if it's focusable and accepts input. If no form, look for search or filter functionality.",
-                expected_result="Form elements are interactive"
-            ),
-            # Step 5: Test any dropdown/select
-            TestStep(
-                description="Test dropdown or menu",
-                action="Find any dropdown menu, select box, or expandable menu and click to open it. Verify it expands.",
-                expected_result="Dropdown opens and shows options"
-            ),
-            # Step 6: Check responsive elements
-            TestStep(
-                description="Verify page responsiveness",
-                action="Scroll down the page to see if there's more content. Check if the page scrolls smoothly and content loads properly.",
-                expected_result="Page scrolls and content is accessible"
-            ),
-            # Step 7: Final state check
-            TestStep(
-                description="Final state verification",
-                action="Navigate back to the main view/dashboard and confirm the app is in a stable state. Report any issues observed.",
-                expected_result="App is in stable state"
-            ),
-        ],
-        tags=["functionality", "core", "comprehensive"]
-    )
-
-    print(f"\nRunning functionality test on: {APP_URL}")
-    print("-" * 40)
+    emit(f"\nRunning functionality test on: {APP_URL}")
+    emit("-" * 40)
 
     try:
-        result = await runner.run_test(
-            functionality_test,
-            base_url=APP_URL
-        )
+        async with BROWSER_SEM:
+            result = await runner.run_test(
+                replace(FUNCTIONALITY_TEST, only_tags=ONLY_TAGS),
+                base_url=APP_URL
+            )
 
         status = "PASS" if result.success else "FAIL"
         log_result(
+            results,
             "Functionality Test",
             status,
             f"Steps passed: {result.steps_passed}/{result.steps_total}, Duration: {result.duration_seconds:.2f}s"
@@ -275,10 +344,12 @@ async def test_systematic_functionality():
 
         if result.errors:
             for error in result.errors:
-                print(f"  ⚠️ Error: {error}")
+                emit(f"  ⚠️ Error: {error}")
 
     except Exception as e:
-        log_result("Functionality Test", "ERROR", str(e))
+        log_result(results, "Functionality Test", "ERROR", str(e))
+
+    return results
 
 
 async def test_element_checks():
@@ -286,9 +357,10 @@ async def test_element_checks():
     Test 4: Quick Element Checks
     - Verify specific elements exist and are functional
     """
-    print("\n" + "=" * 60)
-    print("TEST 4: ELEMENT EXISTENCE CHECKS")
-    print("=" * 60)
+    results = []
+    emit("\n" + "=" * 60)
+    emit("TEST 4: ELEMENT EXISTENCE CHECKS")
+    emit("=" * 60)
 
     validator = UIValidator(max_steps=20, model="lux-actor-1")
 
@@ -301,55 +373,85 @@ async def test_element_checks():
         ("Footer", "Page footer if visible"),
     ]
 
-    print(f"\nChecking elements on: {APP_URL}")
-    print("-" * 40)
+    emit(f"\nChecking elements on: {APP_URL}")
+    emit("-" * 40)
+
+    # One validation session covers every element, so the page is loaded
+    # once instead of once per element
+    rules = [
+        ValidationRule(ValidationType.ELEMENT_EXISTS, element_desc)
+        for _, element_desc in elements_to_check
+    ]
 
-    for element_name, element_desc in elements_to_check:
-        try:
-            result = await validator.check_element_exists(APP_URL, element_desc)
+    try:
+        async with BROWSER_SEM:
+            checks = await validator.validate(APP_URL, rules)
+
+        for (element_name, _), result in zip(elements_to_check, checks):
             status = "PASS" if result.passed else "FAIL"
-            log_result(f"Element: {element_name}", status)
-        except Exception as e:
-            log_result(f"Element: {element_name}", "ERROR", str(e))
+            log_result(results, f"Element: {element_name}", status)
+
+    except Exception as e:
+        log_result(results, "Element Checks", "ERROR", str(e))
 
+    return results
 
-def generate_final_report():
+
+def generate_final_report(results: list):
     """Generate a comprehensive test report."""
-    print("\n")
-    print("=" * 60)
-    print("           QA TEST REPORT - TALENTUM")
-    print("=" * 60)
-    print(f"Application: {APP_URL}")
-    print(f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-" * 60)
-
-    passed = sum(1 for r in TEST_RESULTS if r["status"] == "PASS")
-    failed = sum(1 for r in TEST_RESULTS if r["status"] == "FAIL")
-    errors = sum(1 for r in TEST_RESULTS if r["status"] == "ERROR")
-    total = len(TEST_RESULTS)
-
-    print(f"\n📊 SUMMARY:")
-    print(f"   Total Tests: {total}")
-    print(f"   ✅ Passed:   {passed}")
-    print(f"   ❌ Failed:   {failed}")
-    print(f"   ⚠️  Errors:   {errors}")
-    print(f"   Pass Rate:  {(passed/total*100) if total > 0 else 0:.1f}%")
-
-    print(f"\n📋 DETAILED RESULTS:")
-    print("-" * 60)
-    for result in TEST_RESULTS:
-        status_emoji = "✅" if result["status"] == "PASS" else "❌" if result["status"] == "FAIL" else "⚠️"
-        print(f"[{result['timestamp']}] {status_emoji} {result['test']}")
+    counts = Counter(r["status"] for r in results)
+    passed, failed, errors = counts["PASS"], counts["FAIL"], counts["ERROR"]
+    total = len(results)
+
+    lines = [
+        "\n",
+        "=" * 60,
+        "           QA TEST REPORT - TALENTUM",
+        "=" * 60,
+        f"Application: {APP_URL}",
+        f"Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "-" * 60,
+        "\n📊 SUMMARY:",
+        f"   Total Tests: {total}",
+        f"   ✅ Passed:   {passed}",
+        f"   ❌ Failed:   {failed}",
+        f"   ⚠️  Errors:   {errors}",
+        f"   Pass Rate:  {(passed/total*100) if total > 0 else 0:.1f}%",
+        "\n📋 DETAILED RESULTS:",
+        "-" * 60,
+    ]
+    for result in results:
+        status_emoji = STATUS_EMOJI.get(result["status"], "⚠️")
+        lines.append(f"[{result['timestamp']}] {status_emoji} {result['test']}")
         if result["details"]:
-            print(f"              └─ {result['details']}")
+            lines.append(f"              └─ {result['details']}")
+
+    lines.append("\n" + "=" * 60)
+    lines.append("           END OF QA TEST REPORT")
+    lines.append("=" * 60)
+
+    print("\n".join(lines))
 
-    print("\n" + "=" * 60)
-    print("           END OF QA TEST REPORT")
-    print("=" * 60)
 
+async def main(
+    parallel: bool = False,
+    results_path: Optional[str] = None,
+    tags: Optional[list[str]] = None
+):
+    """
+    Run all QA tests for Talentum application.
+
+    Args:
+        parallel: Run the four test phases concurrently. Requires isolated
+            desktop sessions, since each phase drives its own mouse and
+            keyboard.
+        results_path: JSONL file that each result is written to as it is logged
+        tags: Run only test steps carrying one of these tags (e.g. ["smoke"])
+    """
+    global RESULTS_FILE, ONLY_TAGS
+
+    ONLY_TAGS = frozenset(tags or ())
 
-async def main():
-    """Run all QA tests for Talentum application."""
     print("=" * 60)
     print("   TALENTUM QA TESTING SUITE")
     print("   https://talentum.tkhongsap.io/")
@@ -363,26 +465,78 @@ async def main():
         print("Get your key at: https://developer.agiopen.org\n")
         print("Continuing with tests anyway (may fail without API key)...\n")
 
-    # Run all tests
-    try:
-        # Test 1: UI Validation
-        await test_ui_validation()
-
-        # Test 2: Navigation
-        await test_navigation()
-
-        # Test 3: Systematic Functionality
-        await test_systematic_functionality()
+    phases = [
+        test_ui_validation,
+        test_navigation,
+        test_systematic_functionality,
+        test_element_checks,
+    ]
 
-        # Test 4: Element Checks
-        await test_element_checks()
+    if results_path:
+        RESULTS_FILE = open(results_path, "w", encoding="utf-8", buffering=1)
 
-    except Exception as e:
-        print(f"\n❌ Test suite encountered an error: {e}")
+    try:
+        writer = asyncio.create_task(_log_writer())
+
+        # Run all tests; each phase returns its own results list
+        phase_results = []
+        if parallel:
+            outcomes = await asyncio.gather(
+                *(phase() for phase in phases),
+                return_exceptions=True
+            )
+            for phase, outcome in zip(phases, outcomes):
+                if isinstance(outcome, Exception):
+                    errored = []
+                    log_result(errored, phase.__name__, "ERROR", repr(outcome))
+                    outcome = errored
+                phase_results.append(outcome)
+        else:
+            try:
+                for phase in phases:
+                    phase_results.append(await phase())
+            except Exception as e:
+                emit(f"\n❌ Test suite encountered an error: {e}")
+
+        await LOG_QUEUE.join()
+        writer.cancel()
+    finally:
+        if RESULTS_FILE is not None:
+            RESULTS_FILE.close()
+            RESULTS_FILE = None
 
     # Generate final report
-    generate_final_report()
+    generate_final_report(list(chain.from_iterable(phase_results)))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Run the Talentum QA test suite")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run test phases concurrently (requires isolated desktop sessions)"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        metavar="PATH",
+        help="Write each result to this JSONL file as it is logged"
+    )
+    parser.add_argument(
+        "--tags",
+        nargs="+",
+        metavar="TAG",
+        help="Run only test steps with one of these tags (e.g. --tags smoke)"
+    )
+    args = parser.parse_args()
+
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(main(
+        parallel=args.parallel,
+        results_path=args.output,
+        tags=args.tags
+    ))
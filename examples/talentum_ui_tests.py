@@ -21,27 +21,23 @@ Usage:
 
 import asyncio
 import argparse
+import functools
+import importlib.util
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from enum import Enum
+from urllib.parse import urljoin
 import sys
+import time
 import os
 from dotenv import load_dotenv
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Load environment variables from .env file in project root
-dotenv_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env')
-load_dotenv(dotenv_path)
-
-try:
-    from oagi import AsyncDefaultAgent
-    from oagi import AsyncPyautoguiActionHandler, AsyncScreenshotMaker
-except ImportError:
-    print("Error: oagi package not installed. Run: pip install oagi")
-    sys.exit(1)
+load_dotenv(os.path.join(_PROJECT_ROOT, ".env"))
 
 
 # =============================================================================
@@ -50,13 +46,32 @@ except ImportError:
 
 APP_URL = "https://talentum.tkhongsap.io/"
 PAGES = {
-    "search": APP_URL,
-    "shortlists": f"{APP_URL}shortlists",
-    "summaries": f"{APP_URL}summaries",
-    "history": f"{APP_URL}history",
-    "admin": f"{APP_URL}admin",
+    name: urljoin(APP_URL, path)
+    for name, path in {
+        "search": "",
+        "shortlists": "shortlists",
+        "summaries": "summaries",
+        "history": "history",
+        "admin": "admin",
+    }.items()
 }
 
+# Pause after a failed or slow test before starting the next one
+INTERTEST_DELAY = float(os.getenv("TEST_INTERTEST_DELAY", "2.0"))
+SLOW_TEST_SECONDS = 10.0
+
+# Opening step for tests that start on each page
+NAVIGATE_TO = {name: f"Navigate to {url}" for name, url in PAGES.items()}
+
+# Agent instruction for a test case; see build_instruction
+INSTRUCTION_TEMPLATE = """Test: {name}
+Description: {description}
+
+Execute the following steps in order:
+{steps}
+
+Expected result: {expected_result}"""
+
 
 # =============================================================================
 # DATA STRUCTURES
@@ -70,17 +85,37 @@ class TestStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+_STATUS_SYMBOL = {
+    TestStatus.PASSED: "✅ PASS",
+    TestStatus.FAILED: "❌ FAIL",
+    TestStatus.SKIPPED: "⏭️ SKIP",
+    TestStatus.ERROR: "⚠️ ERROR"
+}
+
+_STATUS_EMOJI = {
+    TestStatus.PASSED: "✅",
+    TestStatus.FAILED: "❌",
+    TestStatus.ERROR: "⚠️",
+    TestStatus.SKIPPED: "⏭️"
+}
+
+
+@dataclass(slots=True, frozen=True)
 class TestCase:
     """Definition of a single test case."""
     name: str
     description: str
-    steps: List[str]
+    steps: Tuple[str, ...]
     expected_result: str
     category: str = "general"
+    instruction: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Built once per test case instead of on every run
+        object.__setattr__(self, "instruction", build_instruction(self))
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of a single test case execution."""
     test_name: str
@@ -88,10 +123,11 @@ class TestResult:
     duration: float
     steps_completed: int = 0
     total_steps: int = 0
+    category: str = "general"
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TestReport:
     """Complete test report."""
     total_tests: int
@@ -108,14 +144,15 @@ class TestReport:
 # TEST CASE DEFINITIONS
 # =============================================================================
 
-def generate_navigation_tests() -> List[TestCase]:
-    """Generate test cases for sidebar navigation."""
-    return [
+@functools.lru_cache(maxsize=1)
+def generate_navigation_tests() -> Tuple[TestCase, ...]:
+    """Generate test cases for sidebar navigation (built once, shared)."""
+    return (
         TestCase(
             name="navigation_all_pages",
             description="Test navigation to all main pages via sidebar",
-            steps=[
-                f"Navigate to {APP_URL}",
+            steps=(
+                NAVIGATE_TO["search"],
                 "Wait for the page to fully load",
                 "Verify the TalentMatch logo is visible in the sidebar",
                 "Click on the 'Search' link in the sidebar navigation",
@@ -129,30 +166,30 @@ def generate_navigation_tests() -> List[TestCase]:
                 "Click on the 'Admin' link in the sidebar navigation",
                 "Verify the URL changes to /admin and 'Admin Settings' heading appears",
                 "Click back on 'Search' to return to the home page",
-            ],
+            ),
             expected_result="All navigation links work and load correct pages",
             category="navigation"
         ),
         TestCase(
             name="sidebar_toggle",
             description="Test sidebar collapse/expand functionality",
-            steps=[
-                f"Navigate to {APP_URL}",
+            steps=(
+                NAVIGATE_TO["search"],
                 "Wait for the page to fully load",
                 "Locate the Toggle Sidebar button (hamburger icon) in the header",
                 "Click the Toggle Sidebar button",
                 "Verify the sidebar collapses (becomes narrower or icons only)",
                 "Click the Toggle Sidebar button again",
                 "Verify the sidebar expands back to full width",
-            ],
+            ),
             expected_result="Sidebar toggles between collapsed and expanded states",
             category="navigation"
         ),
         TestCase(
             name="header_elements",
             description="Test header elements including language selector and theme toggle",
-            steps=[
-                f"Navigate to {APP_URL}",
+            steps=(
+                NAVIGATE_TO["search"],
                 "Wait for the page to fully load",
                 "Verify the language selector showing 'US English' is visible in the header",
                 "Click on the language selector dropdown",
@@ -160,21 +197,22 @@ def generate_navigation_tests() -> List[TestCase]:
                 "Click elsewhere to close the dropdown",
                 "Look for a theme toggle button (sun/moon icon) in the header",
                 "Verify the user profile section is visible at the bottom of sidebar",
-            ],
+            ),
             expected_result="Header elements are functional and accessible",
             category="navigation"
         ),
-    ]
+    )
 
 
-def generate_search_tests() -> List[TestCase]:
-    """Generate test cases for search functionality."""
-    return [
+@functools.lru_cache(maxsize=1)
+def generate_search_tests() -> Tuple[TestCase, ...]:
+    """Generate test cases for search functionality (built once, shared)."""
+    return (
         TestCase(
             name="search_basic",
             description="Test basic search functionality",
-            steps=[
-                f"Navigate to {APP_URL}",
+            steps=(
+                NAVIGATE_TO["search"],
                 "Wait for the search page to fully load",
                 "Verify the search input field with placeholder 'Search for candidates' is visible",
                 "Click on the search input field",
@@ -182,30 +220,30 @@ def generate_search_tests() -> List[TestCase]:
                 "Click the 'Search' button",
                 "Wait for search results to load",
                 "Verify search results appear showing candidate cards or a results list",
-            ],
+            ),
             expected_result="Search returns relevant candidate results",
             category="search"
         ),
         TestCase(
             name="search_filters_experience",
             description="Test experience filter slider",
-            steps=[
-                f"Navigate to {APP_URL}",
+            steps=(
+                NAVIGATE_TO["search"],
                 "Wait for the page to fully load",
                 "Locate the 'Experience (years)' filter section on the left sidebar",
                 "Verify the experience slider is visible with range 0-20+ years",
                 "Drag the minimum slider handle to approximately 2 years",
                 "Drag the maximum slider handle to approximately 10 years",
                 "Verify the slider values update",
-            ],
+            ),
             expected_result="Experience slider filter can be adjusted",
             category="search"
         ),
         TestCase(
             name="search_filters_location",
             description="Test location filter checkboxes",
-            steps=[
-                f"Navigate to {APP_URL}",
+            steps=(
+                NAVIGATE_TO["search"],
                 "Wait for the page to fully load",
                 "Locate the 'Location' filter section",
                 "Click the 'Bangkok' checkbox to select it",
@@ -214,15 +252,15 @@ def generate_search_tests() -> List[TestCase]:
                 "Verify both Bangkok and Tokyo checkboxes are checked",
                 "Click the 'Bangkok' checkbox again to deselect it",
                 "Verify only Tokyo checkbox remains checked",
-            ],
+            ),
             expected_result="Location checkboxes can be selected and deselected",
             category="search"
         ),
         TestCase(
             name="search_filters_skills",
             description="Test skills filter selection",
-            steps=[
-                f"Navigate to {APP_URL}",
+            steps=(
+                NAVIGATE_TO["search"],
                 "Wait for the page to fully load",
                 "Locate the 'Skills' filter section",
                 "Click on the 'Python' skill tag to select it",
@@ -232,15 +270,15 @@ def generate_search_tests() -> List[TestCase]:
                 "Click on the custom skill input",
                 "Type 'TensorFlow' and press Enter",
                 "Verify TensorFlow appears as a selected skill",
-            ],
+            ),
             expected_result="Skills can be selected and custom skills can be added",
             category="search"
         ),
         TestCase(
             name="search_options",
             description="Test search options dropdowns",
-            steps=[
-                f"Navigate to {APP_URL}",
+            steps=(
+                NAVIGATE_TO["search"],
                 "Wait for the page to fully load",
                 "Find the 'Scoring Profile' dropdown showing 'Balanced'",
                 "Click on the Scoring Profile dropdown",
@@ -250,36 +288,37 @@ def generate_search_tests() -> List[TestCase]:
                 "Click on the Results dropdown",
                 "Verify dropdown opens with result count options",
                 "Select '20' from the dropdown",
-            ],
+            ),
             expected_result="Search option dropdowns work correctly",
             category="search"
         ),
         TestCase(
             name="upload_jd",
             description="Test Upload JD button functionality",
-            steps=[
-                f"Navigate to {APP_URL}",
+            steps=(
+                NAVIGATE_TO["search"],
                 "Wait for the page to fully load",
                 "Find the 'Upload JD' button in the search area",
                 "Click the 'Upload JD' button",
                 "Verify a file upload modal or dialog appears",
                 "Close the upload modal by clicking the close button or pressing Escape",
                 "Verify the modal is closed and search page is visible",
-            ],
+            ),
             expected_result="Upload JD button opens file upload interface",
             category="search"
         ),
-    ]
+    )
 
 
-def generate_shortlists_tests() -> List[TestCase]:
-    """Generate test cases for shortlists page."""
-    return [
+@functools.lru_cache(maxsize=1)
+def generate_shortlists_tests() -> Tuple[TestCase, ...]:
+    """Generate test cases for shortlists page (built once, shared)."""
+    return (
         TestCase(
             name="shortlists_page",
             description="Test shortlists page elements and functionality",
-            steps=[
-                f"Navigate to {PAGES['shortlists']}",
+            steps=(
+                NAVIGATE_TO["shortlists"],
                 "Wait for the page to fully load",
                 "Verify the 'My Shortlists' heading is displayed",
                 "Verify the subtitle 'Organize and manage your candidate shortlists' is visible",
@@ -292,35 +331,36 @@ def generate_shortlists_tests() -> List[TestCase]:
                 "Verify the shortlist card shows candidate count",
                 "Verify candidate avatar icons are displayed on the card",
                 "Verify the shortlist card shows a date",
-            ],
+            ),
             expected_result="Shortlists page displays correctly with management options",
             category="shortlists"
         ),
         TestCase(
             name="shortlist_interaction",
             description="Test interaction with shortlist cards",
-            steps=[
-                f"Navigate to {PAGES['shortlists']}",
+            steps=(
+                NAVIGATE_TO["shortlists"],
                 "Wait for the page to fully load",
                 "If there is an existing shortlist card, click on it",
                 "Verify the shortlist expands or shows more details",
                 "Look for candidate information within the expanded view",
                 "Click elsewhere or on a collapse button to close the expanded view",
-            ],
+            ),
             expected_result="Shortlist cards are interactive and show details",
             category="shortlists"
         ),
-    ]
+    )
 
 
-def generate_summaries_tests() -> List[TestCase]:
-    """Generate test cases for summaries page."""
-    return [
+@functools.lru_cache(maxsize=1)
+def generate_summaries_tests() -> Tuple[TestCase, ...]:
+    """Generate test cases for summaries page (built once, shared)."""
+    return (
         TestCase(
             name="summaries_page",
             description="Test summaries page table and functionality",
-            steps=[
-                f"Navigate to {PAGES['summaries']}",
+            steps=(
+                NAVIGATE_TO["summaries"],
                 "Wait for the page to fully load",
                 "Verify the 'Candidate Summaries' heading is displayed",
                 "Verify the subtitle 'Manage post-interview candidate briefs' is visible",
@@ -328,15 +368,15 @@ def generate_summaries_tests() -> List[TestCase]:
                 "Verify the 'All Summaries' filter button is visible",
                 "Verify the table has columns: Candidate, Role, English, Expected Salary, Updated",
                 "If there are rows in the table, verify data is displayed correctly",
-            ],
+            ),
             expected_result="Summaries page displays table with correct columns",
             category="summaries"
         ),
         TestCase(
             name="summaries_interaction",
             description="Test summaries table interactions",
-            steps=[
-                f"Navigate to {PAGES['summaries']}",
+            steps=(
+                NAVIGATE_TO["summaries"],
                 "Wait for the page to fully load",
                 "Click on the search input field",
                 "Type 'test' in the search field",
@@ -346,21 +386,22 @@ def generate_summaries_tests() -> List[TestCase]:
                 "Verify filter options appear",
                 "If there's a table row with a 3-dot menu, click on it",
                 "Verify a context menu appears with options",
-            ],
+            ),
             expected_result="Summaries table search and filters work correctly",
             category="summaries"
         ),
-    ]
+    )
 
 
-def generate_history_tests() -> List[TestCase]:
-    """Generate test cases for history page."""
-    return [
+@functools.lru_cache(maxsize=1)
+def generate_history_tests() -> Tuple[TestCase, ...]:
+    """Generate test cases for history page (built once, shared)."""
+    return (
         TestCase(
             name="history_page",
             description="Test history page display and functionality",
-            steps=[
-                f"Navigate to {PAGES['history']}",
+            steps=(
+                NAVIGATE_TO["history"],
                 "Wait for the page to fully load",
                 "Verify the 'Search History' heading is displayed",
                 "Verify the subtitle 'View and reuse your previous searches' is visible",
@@ -369,34 +410,35 @@ def generate_history_tests() -> List[TestCase]:
                 "Verify history items show the source type (e.g., 'JD Upload')",
                 "Verify history items show results count (e.g., '10 results')",
                 "Verify history items show date and time",
-            ],
+            ),
             expected_result="History page displays previous searches correctly",
             category="history"
         ),
         TestCase(
             name="history_reuse",
             description="Test reusing a search from history",
-            steps=[
-                f"Navigate to {PAGES['history']}",
+            steps=(
+                NAVIGATE_TO["history"],
                 "Wait for the page to fully load",
                 "If there are history items, click on the first one",
                 "Verify the search is reused or details are shown",
                 "Check if you're redirected to search page with the query populated",
-            ],
+            ),
             expected_result="History items can be clicked to reuse searches",
             category="history"
         ),
-    ]
+    )
 
 
-def generate_admin_tests() -> List[TestCase]:
-    """Generate test cases for admin page."""
-    return [
+@functools.lru_cache(maxsize=1)
+def generate_admin_tests() -> Tuple[TestCase, ...]:
+    """Generate test cases for admin page (built once, shared)."""
+    return (
         TestCase(
             name="admin_page",
             description="Test admin settings page display",
-            steps=[
-                f"Navigate to {PAGES['admin']}",
+            steps=(
+                NAVIGATE_TO["admin"],
                 "Wait for the page to fully load",
                 "Verify the 'Admin Settings' heading is displayed",
                 "Verify the subtitle 'Manage system settings and data operations' is visible",
@@ -409,75 +451,96 @@ def generate_admin_tests() -> List[TestCase]:
                 "Verify the coverage progress bar is visible",
                 "Find the 'Regenerate Embeddings' button",
                 "Verify the button is visible and appears clickable",
-            ],
+            ),
             expected_result="Admin page displays all settings and stats correctly",
             category="admin"
         ),
-    ]
+    )
+
+
+# Suites in the order they run, keyed by their --test-<name> flag
+TEST_SUITES = {
+    "navigation": generate_navigation_tests,
+    "search": generate_search_tests,
+    "shortlists": generate_shortlists_tests,
+    "summaries": generate_summaries_tests,
+    "history": generate_history_tests,
+    "admin": generate_admin_tests,
+}
 
 
 # =============================================================================
 # TEST EXECUTION
 # =============================================================================
 
-async def run_test(test: TestCase, verbose: bool = False) -> TestResult:
+async def run_test(
+    test: TestCase,
+    verbose: bool = False,
+    action_handler=None,
+    image_provider=None
+) -> TestResult:
     """
     Execute a single test case using AsyncDefaultAgent.
 
     Args:
         test: TestCase to execute
         verbose: Enable verbose logging
+        action_handler: Shared AsyncPyautoguiActionHandler (created if None)
+        image_provider: Shared AsyncScreenshotMaker (created if None)
 
     Returns:
         TestResult with execution details
     """
-    start_time = datetime.now()
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
 
-    # Build instruction from test steps
-    instruction = build_instruction(test)
+    start_time = time.perf_counter()
+    n_steps = len(test.steps)
 
     # Use AsyncDefaultAgent for task execution
     agent = AsyncDefaultAgent(
-        max_steps=len(test.steps) + 10,  # Extra steps for verification
+        max_steps=n_steps + 10,  # Extra steps for verification
         model="lux-actor-1",
     )
 
     try:
         # Execute the test instruction
         completed = await agent.execute(
-            instruction,
-            action_handler=AsyncPyautoguiActionHandler(),
-            image_provider=AsyncScreenshotMaker(),
+            test.instruction,
+            action_handler=action_handler or AsyncPyautoguiActionHandler(),
+            image_provider=image_provider or AsyncScreenshotMaker(),
         )
 
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
 
         if completed:
             return TestResult(
                 test_name=test.name,
+                category=test.category,
                 status=TestStatus.PASSED,
                 duration=duration,
-                steps_completed=len(test.steps),
-                total_steps=len(test.steps)
+                steps_completed=n_steps,
+                total_steps=n_steps
             )
         else:
             return TestResult(
                 test_name=test.name,
+                category=test.category,
                 status=TestStatus.FAILED,
                 duration=duration,
                 steps_completed=0,
-                total_steps=len(test.steps),
+                total_steps=n_steps,
                 error_message="Test did not complete successfully"
             )
 
     except Exception as e:
-        duration = (datetime.now() - start_time).total_seconds()
+        duration = time.perf_counter() - start_time
         return TestResult(
             test_name=test.name,
+            category=test.category,
             status=TestStatus.ERROR,
             duration=duration,
             steps_completed=0,
-            total_steps=len(test.steps),
+            total_steps=n_steps,
             error_message=str(e)
         )
 
@@ -492,70 +555,101 @@ def build_instruction(test: TestCase) -> str:
     Returns:
         Single instruction string for the agent
     """
-    parts = [
-        f"Test: {test.name}",
-        f"Description: {test.description}",
-        "",
-        "Execute the following steps in order:",
-    ]
-
-    for i, step in enumerate(test.steps, 1):
-        parts.append(f"{i}. {step}")
-
-    parts.append("")
-    parts.append(f"Expected result: {test.expected_result}")
-
-    return "\n".join(parts)
+    return INSTRUCTION_TEMPLATE.format(
+        name=test.name,
+        description=test.description,
+        steps="\n".join(f"{i}. {step}" for i, step in enumerate(test.steps, 1)),
+        expected_result=test.expected_result
+    )
 
 
-async def run_test_suite(tests: List[TestCase], verbose: bool = False) -> TestReport:
+async def run_test_suite(
+    tests: List[TestCase],
+    verbose: bool = False,
+    concurrency: int = 1
+) -> TestReport:
     """
     Run a suite of test cases.
 
+    At most `concurrency` agent sessions run at once. Values above 1
+    require isolated desktop sessions, since each test drives its own
+    mouse and keyboard.
+
     Args:
         tests: List of TestCase to execute
         verbose: Enable verbose logging
+        concurrency: Maximum number of concurrent agent sessions
 
     Returns:
         TestReport with all results
     """
-    start_time = datetime.now()
-    results = []
+    from oagi import AsyncPyautoguiActionHandler, AsyncScreenshotMaker
 
-    print(f"\nRunning {len(tests)} test(s)...\n")
-    print("-" * 60)
+    start_time = time.perf_counter()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    total = len(tests)
 
-    for i, test in enumerate(tests, 1):
-        print(f"\n[{i}/{len(tests)}] {test.name}")
-        print(f"         {test.description}")
-        print(f"         Steps: {len(test.steps)}")
+    # Every test gets its own agent, since max_steps is fixed at
+    # construction. Tests running one at a time share one action handler
+    # and screenshot maker; concurrent tests each create their own
+    shared = concurrency <= 1
+    if shared:
+        action_handler = AsyncPyautoguiActionHandler()
+        image_provider = AsyncScreenshotMaker()
+
+    print(f"\nRunning {total} test(s)...\n")
+    print("-" * 60)
 
-        result = await run_test(test, verbose)
-        results.append(result)
+    async def run(i: int, test: TestCase) -> TestResult:
+        header = [
+            f"\n[{i}/{total}] {test.name}",
+            f"         {test.description}",
+            f"         Steps: {len(test.steps)}",
+        ]
+        async with semaphore:
+            if concurrency <= 1:
+                # Tests run one at a time, so show what is running now
+                print("\n".join(header))
+                header = []
+
+            if shared:
+                result = await run_test(test, verbose, action_handler, image_provider)
+            else:
+                result = await run_test(test, verbose)
+
+            # Concurrent tests print header and result together so their
+            # output does not interleave
+            lines = header + [
+                f"         Result: {_STATUS_SYMBOL[result.status]} ({result.duration:.2f}s)",
+            ]
+            if result.error_message:
+                lines.append(f"         Error: {result.error_message[:100]}...")
+            print("\n".join(lines))
 
-        status_symbol = {
-            TestStatus.PASSED: "✅ PASS",
-            TestStatus.FAILED: "❌ FAIL",
-            TestStatus.SKIPPED: "⏭️ SKIP",
-            TestStatus.ERROR: "⚠️ ERROR"
-        }
+            # On a shared desktop, give the app time to settle after a failed
+            # or slow test; quick passes go straight on to the next test
+            if concurrency <= 1 and i < total and (
+                result.status is not TestStatus.PASSED
+                or result.duration >= SLOW_TEST_SECONDS
+            ):
+                await asyncio.sleep(INTERTEST_DELAY)
 
-        print(f"         Result: {status_symbol[result.status]} ({result.duration:.2f}s)")
-        if result.error_message:
-            print(f"         Error: {result.error_message[:100]}...")
+        return result
 
-        # Brief pause between tests
-        if i < len(tests):
-            await asyncio.sleep(2)
+    # Results come back in submission order regardless of completion order
+    results = list(await asyncio.gather(
+        *(run(i, test) for i, test in enumerate(tests, 1))
+    ))
 
-    total_duration = (datetime.now() - start_time).total_seconds()
+    total_duration = time.perf_counter() - start_time
+    counts = Counter(r.status for r in results)
 
     return TestReport(
-        total_tests=len(tests),
-        passed=sum(1 for r in results if r.status == TestStatus.PASSED),
-        failed=sum(1 for r in results if r.status == TestStatus.FAILED),
-        skipped=sum(1 for r in results if r.status == TestStatus.SKIPPED),
-        errors=sum(1 for r in results if r.status == TestStatus.ERROR),
+        total_tests=total,
+        passed=counts[TestStatus.PASSED],
+        failed=counts[TestStatus.FAILED],
+        skipped=counts[TestStatus.SKIPPED],
+        errors=counts[TestStatus.ERROR],
         duration=total_duration,
         results=results,
         timestamp=datetime.now().isoformat()
@@ -568,64 +662,56 @@ async def run_test_suite(tests: List[TestCase], verbose: bool = False) -> TestRe
 
 def print_report(report: TestReport):
     """Print a formatted test report."""
-    print("\n")
-    print("=" * 60)
-    print("         TALENTMATCH AI - UI TEST REPORT")
-    print("=" * 60)
-    print(f"\nApplication: {APP_URL}")
-    print(f"Timestamp: {report.timestamp}")
-    print(f"Duration: {report.duration:.2f} seconds")
-
-    print(f"\n📊 SUMMARY:")
-    print(f"   Total Tests: {report.total_tests}")
-    print(f"   ✅ Passed:   {report.passed}")
-    print(f"   ❌ Failed:   {report.failed}")
-    print(f"   ⚠️  Errors:   {report.errors}")
-    print(f"   ⏭️  Skipped:  {report.skipped}")
-
     pass_rate = (report.passed / report.total_tests * 100) if report.total_tests > 0 else 0
-    print(f"\n   Pass Rate: {pass_rate:.1f}%")
+    lines = [
+        "\n",
+        "=" * 60,
+        "         TALENTMATCH AI - UI TEST REPORT",
+        "=" * 60,
+        f"\nApplication: {APP_URL}",
+        f"Timestamp: {report.timestamp}",
+        f"Duration: {report.duration:.2f} seconds",
+        f"\n📊 SUMMARY:",
+        f"   Total Tests: {report.total_tests}",
+        f"   ✅ Passed:   {report.passed}",
+        f"   ❌ Failed:   {report.failed}",
+        f"   ⚠️  Errors:   {report.errors}",
+        f"   ⏭️  Skipped:  {report.skipped}",
+        f"\n   Pass Rate: {pass_rate:.1f}%",
+    ]
 
-    # Group by category
-    categories = {}
+    # Group by category and collect failures in one pass
+    categories = defaultdict(list)
+    category_passed = Counter()
+    failures = []
     for result in report.results:
-        cat = result.test_name.split('_')[0]
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(result)
+        categories[result.category].append(result)
+        if result.status is TestStatus.PASSED:
+            category_passed[result.category] += 1
+        elif result.status is TestStatus.FAILED or result.status is TestStatus.ERROR:
+            failures.append(result)
 
-    print(f"\n📋 RESULTS BY CATEGORY:")
-    print("-" * 60)
+    lines += [f"\n📋 RESULTS BY CATEGORY:", "-" * 60]
 
     for cat, cat_results in categories.items():
-        cat_passed = sum(1 for r in cat_results if r.status == TestStatus.PASSED)
-        cat_total = len(cat_results)
-        print(f"\n{cat.upper()}: {cat_passed}/{cat_total} passed")
+        lines.append(f"\n{cat.upper()}: {category_passed[cat]}/{len(cat_results)} passed")
 
         for result in cat_results:
-            status_emoji = {
-                TestStatus.PASSED: "✅",
-                TestStatus.FAILED: "❌",
-                TestStatus.ERROR: "⚠️",
-                TestStatus.SKIPPED: "⏭️"
-            }
-            print(f"  {status_emoji[result.status]} {result.test_name} ({result.duration:.2f}s)")
+            lines.append(f"  {_STATUS_EMOJI[result.status]} {result.test_name} ({result.duration:.2f}s)")
             if result.error_message:
-                print(f"     └─ {result.error_message[:80]}...")
+                lines.append(f"     └─ {result.error_message[:80]}...")
 
-    if report.failed > 0 or report.errors > 0:
-        print(f"\n⚠️ FAILED/ERROR TESTS:")
-        print("-" * 60)
-        for result in report.results:
-            if result.status in (TestStatus.FAILED, TestStatus.ERROR):
-                print(f"  • {result.test_name}")
-                print(f"    Steps: {result.steps_completed}/{result.total_steps}")
-                if result.error_message:
-                    print(f"    Error: {result.error_message}")
+    if failures:
+        lines += [f"\n⚠️ FAILED/ERROR TESTS:", "-" * 60]
+        for result in failures:
+            lines.append(f"  • {result.test_name}")
+            lines.append(f"    Steps: {result.steps_completed}/{result.total_steps}")
+            if result.error_message:
+                lines.append(f"    Error: {result.error_message}")
 
-    print("\n" + "=" * 60)
-    print("         END OF TEST REPORT")
-    print("=" * 60)
+    lines += ["\n" + "=" * 60, "         END OF TEST REPORT", "=" * 60]
+
+    print("\n".join(lines))
 
 
 # =============================================================================
@@ -643,6 +729,7 @@ Examples:
     python talentum_ui_tests.py --test-navigation
     python talentum_ui_tests.py --test-search --verbose
     python talentum_ui_tests.py --test-shortlists --test-summaries
+    python talentum_ui_tests.py --all --dry-run
         """
     )
 
@@ -662,6 +749,12 @@ Examples:
                         help="Run all test suites")
     parser.add_argument("--verbose", action="store_true",
                         help="Enable verbose output")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="List the selected tests as skipped without running an agent")
+    parser.add_argument("--concurrency", type=int,
+                        default=int(os.getenv("TEST_CONCURRENCY", "1")),
+                        help="Max concurrent agent sessions (needs isolated desktops); "
+                             "defaults to $TEST_CONCURRENCY or 1")
 
     return parser.parse_args()
 
@@ -670,58 +763,79 @@ async def main():
     """Main entry point."""
     args = parse_args()
 
-    # Collect tests based on arguments
-    tests = []
-
-    if args.all or args.test_navigation:
-        tests.extend(generate_navigation_tests())
-
-    if args.all or args.test_search:
-        tests.extend(generate_search_tests())
-
-    if args.all or args.test_shortlists:
-        tests.extend(generate_shortlists_tests())
+    if not args.dry_run:
+        # Without a key every agent call fails only after its own timeout
+        if not os.getenv("OAGI_API_KEY"):
+            print("Error: OAGI_API_KEY not set in environment.")
+            print("   Set it with: export OAGI_API_KEY='your_key_here'")
+            print("   Or in PowerShell: $env:OAGI_API_KEY='your_key_here'")
+            print("   Get your key at: https://developer.agiopen.org")
+            print("   Use --dry-run to list the selected tests without running them.")
+            return 2
+
+        # oagi is imported by run_test, so --help stays fast
+        if importlib.util.find_spec("oagi") is None:
+            print("Error: oagi package not installed. Run: pip install oagi")
+            return 1
 
-    if args.all or args.test_summaries:
-        tests.extend(generate_summaries_tests())
-
-    if args.all or args.test_history:
-        tests.extend(generate_history_tests())
-
-    if args.all or args.test_admin:
-        tests.extend(generate_admin_tests())
+    # Collect tests based on arguments
+    tests = [
+        test
+        for name, generate in TEST_SUITES.items()
+        if args.all or getattr(args, f"test_{name}")
+        for test in generate()
+    ]
 
     # Default to navigation tests if nothing specified
     if not tests:
         print("No test suite specified. Running navigation tests by default.")
         print("Use --help to see available options.\n")
-        tests = generate_navigation_tests()
-
-    print("=" * 60)
-    print("   TALENTMATCH AI - UI TESTING WITH OAGI TASKERAGENT")
-    print("=" * 60)
-    print(f"\nApplication: {APP_URL}")
-    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        tests = list(generate_navigation_tests())
+
+    banner = [
+        "=" * 60,
+        "   TALENTMATCH AI - UI TESTING WITH OAGI TASKERAGENT",
+        "=" * 60,
+        f"\nApplication: {APP_URL}",
+        f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"\nTest Categories:",
+    ]
 
     # Show test categories
-    categories = set(t.category for t in tests)
-    print(f"\nTest Categories:")
-    for cat in sorted(categories):
-        count = sum(1 for t in tests if t.category == cat)
-        print(f"  • {cat}: {count} test(s)")
-
-    print(f"\nTotal: {len(tests)} test(s)")
-
-    # Check API key
-    api_key = os.getenv("OAGI_API_KEY")
-    if not api_key:
-        print("\n⚠️  Warning: OAGI_API_KEY not set in environment.")
-        print("   Set it with: export OAGI_API_KEY='your_key_here'")
-        print("   Or in PowerShell: $env:OAGI_API_KEY='your_key_here'")
-        print("   Get your key at: https://developer.agiopen.org\n")
-
-    # Run test suite
-    report = await run_test_suite(tests, verbose=args.verbose)
+    categories = Counter(t.category for t in tests)
+    for cat, count in sorted(categories.items()):
+        banner.append(f"  • {cat}: {count} test(s)")
+
+    banner.append(f"\nTotal: {len(tests)} test(s)")
+    print("\n".join(banner))
+
+    # Run test suite, or report every test as skipped on a dry run
+    if args.dry_run:
+        report = TestReport(
+            total_tests=len(tests),
+            passed=0,
+            failed=0,
+            skipped=len(tests),
+            errors=0,
+            duration=0.0,
+            results=[
+                TestResult(
+                    test_name=test.name,
+                    category=test.category,
+                    status=TestStatus.SKIPPED,
+                    duration=0.0,
+                    total_steps=len(test.steps)
+                )
+                for test in tests
+            ],
+            timestamp=datetime.now().isoformat()
+        )
+    else:
+        report = await run_test_suite(
+            tests,
+            verbose=args.verbose,
+            concurrency=args.concurrency
+        )
 
     # Print report
     print_report(report)
@@ -731,5 +845,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
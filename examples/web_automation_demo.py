@@ -7,9 +7,11 @@ Demonstrates web automation capabilities:
 - Web research
 """
 
+import argparse
 import asyncio
 import os
 import sys
+from typing import Callable
 from dotenv import load_dotenv
 
 # Add parent directory to path for imports
@@ -22,11 +24,11 @@ from src.web_automation.data_scraper import ScrapeTarget
 load_dotenv()
 
 
-async def demo_form_filling():
+async def demo_form_filling(emit: Callable[[str], None] = print):
     """Demonstrate form filling capabilities."""
-    print("\n" + "=" * 50)
-    print("Demo: Form Filling")
-    print("=" * 50)
+    emit("\n" + "=" * 50)
+    emit("Demo: Form Filling")
+    emit("=" * 50)
 
     filler = FormFiller(max_steps=20, model="lux-actor-1")
 
@@ -40,9 +42,9 @@ async def demo_form_filling():
         FormField("Subscribe to newsletter", True, field_type="checkbox"),
     ]
 
-    print("\nFilling contact form with:")
+    emit("\nFilling contact form with:")
     for field in fields:
-        print(f"  - {field.name}: {field.value}")
+        emit(f"  - {field.name}: {field.value}")
 
     result = await filler.fill_form(
         url="https://example.com/contact",  # Replace with actual URL
@@ -50,17 +52,17 @@ async def demo_form_filling():
         submit=True
     )
 
-    print(f"\nResult: {'Success' if result.success else 'Failed'}")
-    print(f"Fields filled: {result.fields_filled}")
+    emit(f"\nResult: {'Success' if result.success else 'Failed'}")
+    emit(f"Fields filled: {result.fields_filled}")
     if result.errors:
-        print(f"Errors: {result.errors}")
+        emit(f"Errors: {result.errors}")
 
 
-async def demo_data_scraping():
+async def demo_data_scraping(emit: Callable[[str], None] = print):
     """Demonstrate data scraping capabilities."""
-    print("\n" + "=" * 50)
-    print("Demo: Data Scraping")
-    print("=" * 50)
+    emit("\n" + "=" * 50)
+    emit("Demo: Data Scraping")
+    emit("=" * 50)
 
     scraper = DataScraper(max_steps=30, model="lux-thinker-1")
 
@@ -73,33 +75,33 @@ async def demo_data_scraping():
         ScrapeTarget("features", "List of product features", expected_type="list"),
     ]
 
-    print("\nScraping product page for:")
+    emit("\nScraping product page for:")
     for target in targets:
-        print(f"  - {target.name}: {target.description}")
+        emit(f"  - {target.name}: {target.description}")
 
     result = await scraper.scrape(
         url="https://example.com/product/123",  # Replace with actual URL
         targets=targets
     )
 
-    print(f"\nResult: {'Success' if result.success else 'Failed'}")
-    print(f"URL: {result.url}")
+    emit(f"\nResult: {'Success' if result.success else 'Failed'}")
+    emit(f"URL: {result.url}")
     if result.errors:
-        print(f"Errors: {result.errors}")
+        emit(f"Errors: {result.errors}")
 
 
-async def demo_web_research():
+async def demo_web_research(emit: Callable[[str], None] = print):
     """Demonstrate web research capabilities."""
-    print("\n" + "=" * 50)
-    print("Demo: Web Research")
-    print("=" * 50)
+    emit("\n" + "=" * 50)
+    emit("Demo: Web Research")
+    emit("=" * 50)
 
     researcher = WebResearcher(max_steps=50, model="lux-thinker-1")
 
     topic = "Latest developments in AI computer use agents 2025"
 
-    print(f"\nResearching topic: {topic}")
-    print("Consulting 3 sources...")
+    emit(f"\nResearching topic: {topic}")
+    emit("Consulting 3 sources...")
 
     result = await researcher.research(
         topic=topic,
@@ -108,37 +110,46 @@ async def demo_web_research():
         output_format="markdown"
     )
 
-    print(f"\nResult: {'Success' if result.success else 'Failed'}")
-    print(f"Sources visited: {result.sources_visited}")
+    emit(f"\nResult: {'Success' if result.success else 'Failed'}")
+    emit(f"Sources visited: {result.sources_visited}")
     if result.errors:
-        print(f"Errors: {result.errors}")
+        emit(f"Errors: {result.errors}")
 
 
-async def demo_fact_check():
+async def demo_fact_check(emit: Callable[[str], None] = print):
     """Demonstrate fact-checking capabilities."""
-    print("\n" + "=" * 50)
-    print("Demo: Fact Checking")
-    print("=" * 50)
+    emit("\n" + "=" * 50)
+    emit("Demo: Fact Checking")
+    emit("=" * 50)
 
     researcher = WebResearcher(max_steps=40, model="lux-thinker-1")
 
     claim = "The Lux model by OpenAGI achieved an 83.6 score on the Online-Mind2Web benchmark"
 
-    print(f"\nFact-checking claim: {claim}")
+    emit(f"\nFact-checking claim: {claim}")
 
     result = await researcher.fact_check(
         claim=claim,
         num_sources=3
     )
 
-    print(f"\nResult: {'Success' if result.success else 'Failed'}")
-    print(f"Sources checked: {result.sources_visited}")
+    emit(f"\nResult: {'Success' if result.success else 'Failed'}")
+    emit(f"Sources checked: {result.sources_visited}")
     if result.errors:
-        print(f"Errors: {result.errors}")
+        emit(f"Errors: {result.errors}")
 
 
-async def main():
-    """Run all web automation demos."""
+async def main(parallel: bool = False):
+    """
+    Run all web automation demos.
+
+    Demos print as they go. When run concurrently, each demo's output is
+    collected and printed once it finishes, so demos do not interleave.
+
+    Args:
+        parallel: Run the demos concurrently. Requires isolated desktop
+            sessions, since each demo drives its own mouse and keyboard.
+    """
     print("=" * 60)
     print("   Web Automation Demonstration")
     print("   Using OpenAGI Lux Model")
@@ -150,11 +161,27 @@ async def main():
         print("Set it with: export OAGI_API_KEY='your_key_here'")
         print("Get your key at: https://developer.agiopen.org\n")
 
+    demos = [
+        demo_form_filling,
+        demo_data_scraping,
+        demo_web_research,
+        demo_fact_check,
+    ]
+
     # Run demos
-    await demo_form_filling()
-    await demo_data_scraping()
-    await demo_web_research()
-    await demo_fact_check()
+    if parallel:
+        buffers = [[] for _ in demos]
+        outcomes = await asyncio.gather(
+            *(demo(buffer.append) for demo, buffer in zip(demos, buffers)),
+            return_exceptions=True
+        )
+        for demo, buffer, outcome in zip(demos, buffers, outcomes):
+            print("\n".join(buffer))
+            if isinstance(outcome, Exception):
+                print(f"\n{demo.__name__} failed: {outcome}")
+    else:
+        for demo in demos:
+            await demo()
 
     print("\n" + "=" * 60)
     print("All demos completed!")
@@ -162,4 +189,18 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Run the web automation demos")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run demos concurrently (requires isolated desktop sessions)"
+    )
+    args = parser.parse_args()
+
+    try:
+        import uvloop  # Optional: faster event loop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(main(parallel=args.parallel))
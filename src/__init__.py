@@ -8,6 +8,8 @@ This package provides modules for automating computer tasks using the Lux model:
 """
 
 from .config import Config, get_config
+from .cache import ResultCache
+from .rate_limit import AdaptiveConcurrencyLimiter, AsyncRateLimiter
 
 __version__ = "0.1.0"
-__all__ = ["Config", "get_config"]
+__all__ = ["Config", "get_config", "ResultCache", "AsyncRateLimiter", "AdaptiveConcurrencyLimiter"]
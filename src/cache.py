@@ -0,0 +1,81 @@
+"""
+Result cache - Persist agent results on disk between runs.
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Optional
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "agiopen")
+
+
+class ResultCache:
+    """
+    JSON file cache for results of expensive agent runs.
+
+    Each entry is stored as one file under `<cache_dir>/<namespace>/`, named
+    by the SHA-256 of its key. Entries older than the `ttl` passed to `get`
+    are treated as missing.
+
+    Example:
+        cache = ResultCache("insider")
+
+        data = cache.get("AAPL:2025-01-15", ttl=6 * 3600)
+        if data is None:
+            result = await get_insider_activity("AAPL")
+            cache.set("AAPL:2025-01-15", asdict(result))
+    """
+
+    def __init__(self, namespace: str, cache_dir: Optional[str] = None):
+        root = cache_dir or os.getenv("OAGI_CACHE_DIR", DEFAULT_CACHE_DIR)
+        self.directory = os.path.join(root, namespace)
+
+    def _path(self, key: str) -> str:
+        """Map a cache key to its file path."""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key
+            ttl: Maximum entry age in seconds (None for no expiry)
+
+        Returns:
+            The cached JSON value, or None if missing, expired or unreadable
+        """
+        path = self._path(key)
+        try:
+            if ttl is not None and time.time() - os.path.getmtime(path) > ttl:
+                return None
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+
+    def clear(self) -> None:
+        """Remove every entry in this namespace."""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
@@ -2,14 +2,20 @@
 Configuration management for Lux automation.
 """
 
+import functools
 import os
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
-    """Configuration for Lux API and automation settings."""
+    """
+    Configuration for Lux API and automation settings.
+
+    Configs are immutable; use `dataclasses.replace` to derive a modified
+    copy and `set_config` to install it.
+    """
 
     api_key: str
     base_url: str = "https://api.agiopen.org"
@@ -47,16 +53,19 @@ class Config:
         )
 
 
-# Global config instance
+# Global config set explicitly via set_config; None means use the environment
 _config: Optional[Config] = None
 
 
+@functools.lru_cache(maxsize=1)
+def _env_config() -> Config:
+    """Load the configuration from the environment once, on first use."""
+    return Config.from_env()
+
+
 def get_config() -> Config:
     """Get the global configuration instance."""
-    global _config
-    if _config is None:
-        _config = Config.from_env()
-    return _config
+    return _config or _env_config()
 
 
 def set_config(config: Config) -> None:
@@ -3,18 +3,46 @@ Bulk Data Entry - High-volume data input automation.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 import asyncio
+import functools
 
+from ..rate_limit import AsyncRateLimiter
 
-@dataclass
+try:
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+    _OAGI_AVAILABLE = True
+except ImportError:
+    AsyncDefaultAgent = AsyncPyautoguiActionHandler = AsyncScreenshotMaker = None
+    _OAGI_AVAILABLE = False
+
+_OAGI_MISSING = "oagi package not installed. Run: pip install oagi"
+
+# Agent instruction for entering one record; see _build_entry_instruction
+ENTRY_INSTRUCTION_TEMPLATE = """Data Entry - Record {record_num} of {total_records}
+
+{start_line}2. Fill the form with the following data:
+{field_lines}3. Click '{submit_button}' to save the record
+4. Wait for confirmation that the record was saved"""
+
+
+@functools.lru_cache(maxsize=32)
+def _field_lines_template(field_names: tuple[str, ...]) -> str:
+    """Field list for one record schema, with a positional slot per value."""
+    return "".join(
+        "   - {}: {{}}\n".format(name.replace("{", "{{").replace("}", "}}"))
+        for name in field_names
+    )
+
+
+@dataclass(slots=True)
 class EntryRecord:
     """A single record to enter."""
     data: dict[str, Any]
     identifier: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EntryResult:
     """Result of entering a single record."""
     record: EntryRecord
@@ -22,7 +50,7 @@ class EntryResult:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BulkEntryResult:
     """Result of bulk entry operation."""
     total_records: int
@@ -36,6 +64,14 @@ class BulkDataEntry:
     """
     Automate bulk data entry using Lux.
 
+    Records are entered one at a time by default. `max_concurrency` above 1
+    runs several agents at once, which requires isolated desktop sessions
+    since each agent drives its own mouse and keyboard.
+
+    `delay_between_records` paces record starts with a token bucket shared
+    by all sessions: at most one record begins per delay, and a record that
+    took longer than the delay is followed immediately by the next.
+
     Example:
         entry = BulkDataEntry()
 
@@ -55,17 +91,43 @@ class BulkDataEntry:
         max_steps_per_record: int = 20,
         model: str = "lux-actor-1",
         verbose: bool = False,
-        delay_between_records: float = 1.0
+        delay_between_records: float = 1.0,
+        max_concurrency: int = 1
     ):
         self.max_steps_per_record = max_steps_per_record
         self.model = model
         self.verbose = verbose
         self.delay_between_records = delay_between_records
+        self.max_concurrency = max(1, max_concurrency)
+
+    def _agent_pool(self, size: int, **agent_kwargs) -> asyncio.Queue:
+        """
+        Queue of sessions reused across records, one per concurrent session.
+
+        Each session is an (agent, action handler, screenshot maker) tuple
+        and handles one record at a time, so concurrent records never share
+        a handler; taking one from the pool also bounds how many records
+        run at once.
+        """
+        pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(max(1, min(self.max_concurrency, size))):
+            pool.put_nowait((
+                AsyncDefaultAgent(**agent_kwargs),
+                AsyncPyautoguiActionHandler(),
+                AsyncScreenshotMaker(),
+            ))
+        return pool
+
+    def _record_limiter(self) -> Optional[AsyncRateLimiter]:
+        """Rate limiter for record starts, or None when there is no delay."""
+        if self.delay_between_records <= 0:
+            return None
+        return AsyncRateLimiter(max_rate=1, time_period=self.delay_between_records)
 
     async def enter_records(
         self,
         url: str,
-        records: list[EntryRecord],
+        records: Iterable[EntryRecord],
         submit_button_text: str = "Save",
         new_record_button_text: Optional[str] = "Add New"
     ) -> BulkEntryResult:
@@ -74,26 +136,43 @@ class BulkDataEntry:
 
         Args:
             url: URL of the data entry form
-            records: List of EntryRecord to enter
+            records: EntryRecords to enter (any iterable, e.g. a generator)
             submit_button_text: Text of the submit button
             new_record_button_text: Text of button to start new record
 
         Returns:
             BulkEntryResult with details of all entries
         """
-        results = []
-        errors = []
-
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        # Results keep a reference to every record, so one list is needed anyway
+        if not isinstance(records, list):
+            records = list(records)
 
-            for i, record in enumerate(records):
-                agent = AsyncDefaultAgent(
-                    max_steps=self.max_steps_per_record,
-                    model=self.model
-                )
+        if not _OAGI_AVAILABLE:
+            return BulkEntryResult(
+                total_records=len(records),
+                successful=0,
+                failed=len(records),
+                results=[],
+                errors=[_OAGI_MISSING]
+            )
 
-                # Build entry instruction
+        sessions = self._agent_pool(
+            len(records),
+            max_steps=self.max_steps_per_record,
+            model=self.model
+        )
+        limiter = self._record_limiter()
+        sequential = self.max_concurrency == 1
+
+        async def enter_one(i: int, record: EntryRecord) -> EntryResult:
+            session = await sessions.get()
+            agent, action_handler, image_provider = session
+            try:
+                if limiter is not None:
+                    await limiter.acquire()
+
+                # Build entry instruction; concurrent sessions each start
+                # from their own browser, so every record navigates
                 instruction = self._build_entry_instruction(
                     url=url,
                     record=record,
@@ -101,44 +180,45 @@ class BulkDataEntry:
                     total_records=len(records),
                     submit_button=submit_button_text,
                     new_record_button=new_record_button_text,
-                    is_first=(i == 0)
+                    is_first=(i == 0 or not sequential)
                 )
 
                 try:
                     completed = await agent.execute(
                         instruction,
-                        action_handler=AsyncPyautoguiActionHandler(),
-                        image_provider=AsyncScreenshotMaker(),
+                        action_handler=action_handler,
+                        image_provider=image_provider,
                     )
 
-                    results.append(EntryResult(
+                    result = EntryResult(
                         record=record,
                         success=completed,
                         error_message=None if completed else "Entry did not complete"
-                    ))
+                    )
 
                 except Exception as e:
-                    results.append(EntryResult(
+                    result = EntryResult(
                         record=record,
                         success=False,
                         error_message=str(e)
-                    ))
+                    )
 
-                # Delay between records
-                if i < len(records) - 1:
-                    await asyncio.sleep(self.delay_between_records)
+                return result
+            finally:
+                sessions.put_nowait(session)
 
-        except ImportError:
-            errors.append("oagi package not installed. Run: pip install oagi")
+        # Results come back in record order regardless of completion order
+        results = list(await asyncio.gather(
+            *(enter_one(i, record) for i, record in enumerate(records))
+        ))
 
-        successful = sum(1 for r in results if r.success)
+        successful = sum(r.success for r in results)
 
         return BulkEntryResult(
             total_records=len(records),
             successful=successful,
             failed=len(records) - successful,
-            results=results,
-            errors=errors
+            results=results
         )
 
     def _build_entry_instruction(
@@ -152,25 +232,25 @@ class BulkDataEntry:
         is_first: bool
     ) -> str:
         """Build instruction for entering a single record."""
-        parts = [f"Data Entry - Record {record_num} of {total_records}"]
-        parts.append("")
-
         if is_first:
-            parts.append(f"1. Navigate to {url}")
-            step_num = 2
+            start_line = f"1. Navigate to {url}\n"
+        elif new_record_button:
+            start_line = f"1. Click '{new_record_button}' to start a new entry\n"
         else:
-            if new_record_button:
-                parts.append(f"1. Click '{new_record_button}' to start a new entry")
-            step_num = 2
+            start_line = ""
 
-        parts.append(f"{step_num}. Fill the form with the following data:")
-        for field_name, value in record.data.items():
-            parts.append(f"   - {field_name}: {value}")
-
-        parts.append(f"{step_num + 1}. Click '{submit_button}' to save the record")
-        parts.append(f"{step_num + 2}. Wait for confirmation that the record was saved")
+        # Records in a batch usually share field names; reuse their skeleton
+        field_lines = _field_lines_template(tuple(record.data)).format(
+            *record.data.values()
+        )
 
-        return "\n".join(parts)
+        return ENTRY_INSTRUCTION_TEMPLATE.format(
+            record_num=record_num,
+            total_records=total_records,
+            start_line=start_line,
+            field_lines=field_lines,
+            submit_button=submit_button
+        )
 
     async def enter_from_csv(
         self,
@@ -196,16 +276,24 @@ class BulkDataEntry:
         records = []
 
         try:
-            with open(csv_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Map CSV columns to form fields
-                    data = {
-                        form_field: row[csv_col]
-                        for csv_col, form_field in field_mapping.items()
-                        if csv_col in row
-                    }
-                    records.append(EntryRecord(data=data))
+            with open(csv_path, 'r', newline='') as f:
+                reader = csv.reader(f)
+                # Resolve the mapped columns to indices once from the header
+                header = next(reader, [])
+                columns = [
+                    (header.index(csv_col), form_field)
+                    for csv_col, form_field in field_mapping.items()
+                    if csv_col in header
+                ]
+                # Short rows (missing trailing cells) get empty values
+                records = [
+                    EntryRecord(data={
+                        form_field: row[index] if index < len(row) else ""
+                        for index, form_field in columns
+                    })
+                    for row in reader
+                    if row  # skip blank lines
+                ]
 
         except Exception as e:
             return BulkEntryResult(
@@ -225,7 +313,7 @@ class BulkDataEntry:
     async def update_records(
         self,
         search_url: str,
-        records: list[EntryRecord],
+        records: Iterable[EntryRecord],
         search_field: str,
         update_fields: list[str]
     ) -> BulkEntryResult:
@@ -235,22 +323,39 @@ class BulkDataEntry:
         Args:
             search_url: URL of the search/list page
             records: Records with identifier to search and data to update
+                (any iterable)
             search_field: Name of the field to search by
             update_fields: Fields to update
 
         Returns:
             BulkEntryResult with update details
         """
-        results = []
+        # Results keep a reference to every record, so one list is needed anyway
+        if not isinstance(records, list):
+            records = list(records)
 
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        if not _OAGI_AVAILABLE:
+            return BulkEntryResult(
+                total_records=len(records),
+                successful=0,
+                failed=len(records),
+                results=[],
+                errors=[_OAGI_MISSING]
+            )
 
-            for record in records:
-                agent = AsyncDefaultAgent(
-                    max_steps=self.max_steps_per_record + 10,
-                    model="lux-thinker-1"  # Use Thinker for search+edit
-                )
+        sessions = self._agent_pool(
+            len(records),
+            max_steps=self.max_steps_per_record + 10,
+            model="lux-thinker-1"  # Use Thinker for search+edit
+        )
+        limiter = self._record_limiter()
+
+        async def update_one(record: EntryRecord) -> EntryResult:
+            session = await sessions.get()
+            agent, action_handler, image_provider = session
+            try:
+                if limiter is not None:
+                    await limiter.acquire()
 
                 search_value = record.identifier or record.data.get(search_field, "")
 
@@ -268,28 +373,31 @@ class BulkDataEntry:
                 try:
                     completed = await agent.execute(
                         instruction,
-                        action_handler=AsyncPyautoguiActionHandler(),
-                        image_provider=AsyncScreenshotMaker(),
+                        action_handler=action_handler,
+                        image_provider=image_provider,
                     )
 
-                    results.append(EntryResult(
+                    result = EntryResult(
                         record=record,
                         success=completed
-                    ))
+                    )
 
                 except Exception as e:
-                    results.append(EntryResult(
+                    result = EntryResult(
                         record=record,
                         success=False,
                         error_message=str(e)
-                    ))
+                    )
 
-                await asyncio.sleep(self.delay_between_records)
+                return result
+            finally:
+                sessions.put_nowait(session)
 
-        except ImportError:
-            pass
+        results = list(await asyncio.gather(
+            *(update_one(record) for record in records)
+        ))
 
-        successful = sum(1 for r in results if r.success)
+        successful = sum(r.success for r in results)
 
         return BulkEntryResult(
             total_records=len(records),
@@ -304,8 +412,6 @@ class BulkDataEntry:
         update_fields: list[str]
     ) -> str:
         """Format update fields for instruction."""
-        lines = []
-        for field in update_fields:
-            if field in data:
-                lines.append(f"   - {field}: {data[field]}")
-        return "\n".join(lines)
+        return "\n".join(
+            f"   - {field}: {data[field]}" for field in update_fields if field in data
+        )
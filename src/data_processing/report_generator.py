@@ -3,8 +3,47 @@ Report Generator - Extract and compile reports from data sources.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Sequence
 from enum import Enum
+import asyncio
+import functools
+import json
+import os
+import tempfile
+
+from ..cache import ResultCache
+
+try:
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+    _OAGI_AVAILABLE = True
+except ImportError:
+    AsyncDefaultAgent = AsyncPyautoguiActionHandler = AsyncScreenshotMaker = None
+    _OAGI_AVAILABLE = False
+
+_OAGI_MISSING = "oagi package not installed. Run: pip install oagi"
+
+# Agent instruction for a full report; see build_report_instruction
+REPORT_INSTRUCTION_TEMPLATE = """Generate Report: {title}
+
+{date_range}PHASE 1 - DATA COLLECTION:
+
+{source_blocks}PHASE 2 - REPORT ASSEMBLY:
+
+{assembly_steps}
+
+PHASE 3 - FINALIZATION:
+
+1. Format the report as {output_format}
+2. Save to: {output_path}
+3. Verify the file was saved successfully"""
+
+# Agent instruction for one source when sources are extracted concurrently
+SOURCE_EXTRACTION_TEMPLATE = """Extract Data: {name}
+
+{date_range}1. Navigate to {url}
+2. Wait for the page to fully load
+3. Extract: {extraction_instructions}
+4. Save the extracted data as plain text to: {notes_path}{screenshot_step}"""
 
 
 class ReportFormat(Enum):
@@ -16,7 +55,7 @@ class ReportFormat(Enum):
     JSON = "json"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataSource:
     """A data source for the report."""
     name: str
@@ -24,18 +63,26 @@ class DataSource:
     extraction_instructions: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReportConfig:
-    """Configuration for report generation."""
+    """
+    Configuration for report generation.
+
+    Configs are immutable and hashable so the instruction built from one
+    can be reused across scheduled runs; `sources` is stored as a tuple.
+    """
     title: str
-    sources: list[DataSource]
+    sources: Sequence[DataSource]
     output_format: ReportFormat = ReportFormat.MARKDOWN
     template_path: Optional[str] = None
     include_screenshots: bool = False
     date_range: Optional[str] = None
 
+    def __post_init__(self):
+        object.__setattr__(self, "sources", tuple(self.sources))
+
 
-@dataclass
+@dataclass(slots=True)
 class ReportResult:
     """Result of report generation."""
     success: bool
@@ -44,6 +91,89 @@ class ReportResult:
     errors: list[str] = field(default_factory=list)
 
 
+def _format_report_instruction(
+    config: ReportConfig,
+    output_path: str,
+    source_blocks: str
+) -> str:
+    """Fill REPORT_INSTRUCTION_TEMPLATE around the given source blocks."""
+    if config.template_path:
+        assembly_steps = (
+            f"1. Open the template at: {config.template_path}\n"
+            "2. Fill in the extracted data in appropriate sections"
+        )
+    else:
+        assembly_steps = (
+            "1. Create a new document\n"
+            f"2. Add title: {config.title}\n"
+            "3. For each data source, create a section with the extracted data"
+        )
+
+    return REPORT_INSTRUCTION_TEMPLATE.format(
+        title=config.title,
+        date_range=f"Date Range: {config.date_range}\n\n" if config.date_range else "",
+        source_blocks=source_blocks,
+        assembly_steps=assembly_steps,
+        output_format=config.output_format.value,
+        output_path=output_path
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def build_report_instruction(config: ReportConfig, output_path: str) -> str:
+    """Build the report instruction, memoized per (config, output_path)."""
+    screenshot_line = "  Take a screenshot of the data\n" if config.include_screenshots else ""
+    source_blocks = "".join(
+        f"Source {i}: {source.name}\n"
+        f"  URL: {source.url}\n"
+        f"  Extract: {source.extraction_instructions}\n"
+        f"{screenshot_line}\n"
+        for i, source in enumerate(config.sources, 1)
+    )
+    return _format_report_instruction(config, output_path, source_blocks)
+
+
+def build_extraction_instruction(
+    config: ReportConfig,
+    source: DataSource,
+    notes_path: str
+) -> str:
+    """Build the instruction for extracting one source into a notes file."""
+    return SOURCE_EXTRACTION_TEMPLATE.format(
+        name=source.name,
+        date_range=f"Date Range: {config.date_range}\n\n" if config.date_range else "",
+        url=source.url,
+        extraction_instructions=source.extraction_instructions,
+        notes_path=notes_path,
+        screenshot_step="\n5. Take a screenshot of the data" if config.include_screenshots else ""
+    )
+
+
+def build_assembly_instruction(
+    config: ReportConfig,
+    notes: list[tuple[DataSource, str]],
+    output_path: str
+) -> str:
+    """Build the report instruction from already-extracted notes files."""
+    source_blocks = "".join(
+        f"Source {i}: {source.name}\n"
+        f"  Read the extracted data from: {notes_path}\n\n"
+        for i, (source, notes_path) in enumerate(notes, 1)
+    )
+    return _format_report_instruction(config, output_path, source_blocks)
+
+
+# Extracted source notes, reused across scheduled runs when cache_ttl is set
+_notes_cache = ResultCache("report_sources")
+
+
+def _source_cache_key(source: DataSource, date_range: Optional[str]) -> str:
+    """Cache key for one source's extracted notes."""
+    return json.dumps(
+        [source.name, source.url, source.extraction_instructions, date_range]
+    )
+
+
 class ReportGenerator:
     """
     Generate reports from multiple data sources using Lux.
@@ -69,17 +199,31 @@ class ReportGenerator:
         )
 
         result = await generator.generate(config, output_path="reports/monthly.md")
+
+    By default one agent visits every source and assembles the report.
+    `max_concurrency` above 1 extracts each source with its own agent into a
+    temporary notes file, then runs a final agent to assemble them; like
+    BulkDataEntry, this requires isolated desktop sessions.
+
+    With `cache_ttl` set, notes extracted per source are kept on disk for
+    that many seconds. A later report whose sources and date range are all
+    cached skips extraction and goes straight to assembly, whatever the
+    concurrency.
     """
 
     def __init__(
         self,
         max_steps: int = 100,
         model: str = "lux-thinker-1",
-        verbose: bool = False
+        verbose: bool = False,
+        max_concurrency: int = 1,
+        cache_ttl: Optional[float] = None
     ):
         self.max_steps = max_steps
         self.model = model
         self.verbose = verbose
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache_ttl = cache_ttl
 
     async def generate(
         self,
@@ -96,9 +240,20 @@ class ReportGenerator:
         Returns:
             ReportResult with generation details
         """
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        if not _OAGI_AVAILABLE:
+            return ReportResult(
+                success=False,
+                output_path=None,
+                sources_processed=0,
+                errors=[_OAGI_MISSING]
+            )
+
+        if (
+            self.max_concurrency > 1 and len(config.sources) > 1
+        ) or self._all_notes_cached(config):
+            return await self._generate_per_source(config, output_path)
 
+        try:
             agent = AsyncDefaultAgent(max_steps=self.max_steps, model=self.model)
 
             # Build comprehensive instruction
@@ -116,20 +271,114 @@ class ReportGenerator:
                 sources_processed=len(config.sources)
             )
 
-        except ImportError:
+        except Exception as e:
             return ReportResult(
                 success=False,
                 output_path=None,
                 sources_processed=0,
-                errors=["oagi package not installed. Run: pip install oagi"]
+                errors=[str(e)]
             )
-        except Exception as e:
+
+    def _all_notes_cached(self, config: ReportConfig) -> bool:
+        """Whether every source has fresh cached notes for this date range."""
+        if self.cache_ttl is None:
+            return False
+        return all(
+            _notes_cache.get(
+                _source_cache_key(source, config.date_range), ttl=self.cache_ttl
+            ) is not None
+            for source in config.sources
+        )
+
+    async def _generate_per_source(
+        self,
+        config: ReportConfig,
+        output_path: str
+    ) -> ReportResult:
+        """Extract (or reuse cached) notes per source, then assemble the report."""
+        # Notes only need to live until assembly has read them
+        with tempfile.TemporaryDirectory() as workdir:
+            return await self._extract_and_assemble(config, output_path, workdir)
+
+    async def _extract_and_assemble(
+        self,
+        config: ReportConfig,
+        output_path: str,
+        workdir: str
+    ) -> ReportResult:
+        """Write each source's notes into workdir, then assemble the report."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        notes_paths = [
+            os.path.join(workdir, f"source{i}.txt")
+            for i in range(1, len(config.sources) + 1)
+        ]
+
+        async def extract_one(source: DataSource, notes_path: str) -> bool:
+            cache_key = _source_cache_key(source, config.date_range)
+            if self.cache_ttl is not None:
+                cached = _notes_cache.get(cache_key, ttl=self.cache_ttl)
+                if cached is not None:
+                    with open(notes_path, "w") as f:
+                        f.write(cached)
+                    return True
+
+            async with semaphore:
+                agent = AsyncDefaultAgent(max_steps=self.max_steps, model=self.model)
+                completed = await agent.execute(
+                    build_extraction_instruction(config, source, notes_path),
+                    action_handler=AsyncPyautoguiActionHandler(),
+                    image_provider=AsyncScreenshotMaker(),
+                )
+
+            if completed and self.cache_ttl is not None:
+                try:
+                    with open(notes_path, "r") as f:
+                        _notes_cache.set(cache_key, f.read())
+                except OSError:
+                    pass  # Agent reported success but saved nothing to reuse
+
+            return completed
+
+        outcomes = await asyncio.gather(
+            *(extract_one(s, p) for s, p in zip(config.sources, notes_paths)),
+            return_exceptions=True
+        )
+
+        notes = []
+        errors = []
+        for source, notes_path, outcome in zip(config.sources, notes_paths, outcomes):
+            if outcome is True:
+                notes.append((source, notes_path))
+            elif isinstance(outcome, BaseException):
+                errors.append(f"{source.name}: {outcome}")
+            else:
+                errors.append(f"{source.name}: extraction did not complete")
+
+        if not notes:
             return ReportResult(
                 success=False,
                 output_path=None,
                 sources_processed=0,
-                errors=[str(e)]
+                errors=errors
+            )
+
+        try:
+            agent = AsyncDefaultAgent(max_steps=self.max_steps, model=self.model)
+            completed = await agent.execute(
+                build_assembly_instruction(config, notes, output_path),
+                action_handler=AsyncPyautoguiActionHandler(),
+                image_provider=AsyncScreenshotMaker(),
             )
+        except Exception as e:
+            errors.append(str(e))
+            completed = False
+
+        return ReportResult(
+            success=completed,
+            output_path=output_path if completed else None,
+            sources_processed=len(notes),
+            errors=errors
+        )
 
     def _build_report_instruction(
         self,
@@ -137,49 +386,7 @@ class ReportGenerator:
         output_path: str
     ) -> str:
         """Build comprehensive report generation instruction."""
-        parts = [
-            f"Generate Report: {config.title}",
-            ""
-        ]
-
-        if config.date_range:
-            parts.append(f"Date Range: {config.date_range}")
-            parts.append("")
-
-        # Phase 1: Data Collection
-        parts.append("PHASE 1 - DATA COLLECTION:")
-        parts.append("")
-
-        for i, source in enumerate(config.sources, 1):
-            parts.append(f"Source {i}: {source.name}")
-            parts.append(f"  URL: {source.url}")
-            parts.append(f"  Extract: {source.extraction_instructions}")
-            if config.include_screenshots:
-                parts.append(f"  Take a screenshot of the data")
-            parts.append("")
-
-        # Phase 2: Report Assembly
-        parts.append("PHASE 2 - REPORT ASSEMBLY:")
-        parts.append("")
-
-        if config.template_path:
-            parts.append(f"1. Open the template at: {config.template_path}")
-            parts.append("2. Fill in the extracted data in appropriate sections")
-        else:
-            parts.append("1. Create a new document")
-            parts.append(f"2. Add title: {config.title}")
-            parts.append("3. For each data source, create a section with the extracted data")
-
-        parts.append("")
-
-        # Phase 3: Finalization
-        parts.append("PHASE 3 - FINALIZATION:")
-        parts.append("")
-        parts.append(f"1. Format the report as {config.output_format.value}")
-        parts.append(f"2. Save to: {output_path}")
-        parts.append("3. Verify the file was saved successfully")
-
-        return "\n".join(parts)
+        return build_report_instruction(config, output_path)
 
     async def extract_dashboard_metrics(
         self,
@@ -198,9 +405,14 @@ class ReportGenerator:
         Returns:
             Dictionary of extracted metrics
         """
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        if not _OAGI_AVAILABLE:
+            return {
+                "success": False,
+                "error": _OAGI_MISSING,
+                "metrics": {}
+            }
 
+        try:
             agent = AsyncDefaultAgent(max_steps=30, model="lux-actor-1")
 
             metrics_list = "\n".join(f"- {m}" for m in metrics)
@@ -278,9 +490,13 @@ class ReportGenerator:
         Returns:
             Comparison results
         """
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        if not _OAGI_AVAILABLE:
+            return {
+                "success": False,
+                "error": _OAGI_MISSING
+            }
 
+        try:
             agent = AsyncDefaultAgent(max_steps=50, model="lux-thinker-1")
 
             paths_list = "\n".join(f"- {p}" for p in report_paths)
@@ -2,33 +2,65 @@
 Test Runner - Execute UI test sequences with Lux.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Callable, Optional
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Sequence
 from datetime import datetime
 import asyncio
+import hashlib
+import html
+import json
 
+from ..cache import ResultCache
 
-@dataclass
+try:
+    import orjson  # Optional: faster JSON reports
+except ImportError:
+    orjson = None
+
+try:
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker, ImageConfig
+    _OAGI_AVAILABLE = True
+except ImportError:
+    AsyncDefaultAgent = AsyncPyautoguiActionHandler = AsyncScreenshotMaker = ImageConfig = None
+    _OAGI_AVAILABLE = False
+
+_OAGI_MISSING = "oagi package not installed. Run: pip install oagi"
+
+# Agent instruction for one test case; see _build_test_instruction
+TEST_INSTRUCTION_TEMPLATE = """Test: {name}
+Description: {description}
+
+{navigate}{setup}Test Steps:{steps}{teardown}"""
+
+STEP_INSTRUCTION_TEMPLATE = "\n{num}. {description}\n   Action: {action}{verify}"
+
+# Distinct instructions remembered per run_suite call, oldest dropped first
+SUITE_MEMO_SIZE = 256
+
+
+@dataclass(slots=True, frozen=True)
 class TestStep:
     """A single step in a test case."""
     description: str
     action: str
     expected_result: Optional[str] = None
     timeout: int = 30
+    tags: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCase:
     """A complete test case with multiple steps."""
     name: str
     description: str
-    steps: list[TestStep]
+    steps: Sequence[TestStep]
     setup: Optional[str] = None
     teardown: Optional[str] = None
     tags: list[str] = field(default_factory=list)
+    only_tags: frozenset[str] = frozenset()  # Run only steps with one of these tags
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Result of a test execution."""
     test_name: str
@@ -38,6 +70,7 @@ class TestResult:
     duration_seconds: float
     errors: list[str]
     screenshots: list[str] = field(default_factory=list)
+    instruction_hash: Optional[str] = None  # BLAKE2b of the agent instruction
 
 
 class TestRunner:
@@ -58,6 +91,10 @@ class TestRunner:
         )
 
         result = await runner.run_test(test)
+
+    With `cache_ttl` set, passing results are stored on disk keyed by the
+    model and test instruction, and re-running an unchanged test within
+    that many seconds returns the stored result without an agent session.
     """
 
     def __init__(
@@ -65,12 +102,44 @@ class TestRunner:
         max_steps_per_test: int = 50,
         model: str = "lux-tasker-1",
         verbose: bool = False,
-        screenshot_on_failure: bool = True
+        screenshot_on_failure: bool = True,
+        cache_ttl: Optional[float] = None
     ):
         self.max_steps_per_test = max_steps_per_test
         self.model = model
         self.verbose = verbose
         self.screenshot_on_failure = screenshot_on_failure
+        self.cache_ttl = cache_ttl
+        self._cache = ResultCache("test_runner")
+        self._agents: dict[tuple[str, int], Any] = {}
+        self._handlers: Optional[tuple[Any, Any]] = None
+
+    def _get_agent(self, max_steps: int) -> Any:
+        """Return the agent for this model and step budget, created on first use."""
+        key = (self.model, max_steps)
+        agent = self._agents.get(key)
+        if agent is None:
+            agent = self._agents[key] = AsyncDefaultAgent(max_steps=max_steps, model=self.model)
+        return agent
+
+    def _get_handlers(self) -> tuple[Any, Any]:
+        """Return the action handler and screenshot maker shared by all calls."""
+        if self._handlers is None:
+            self._handlers = self._new_handlers()
+        return self._handlers
+
+    @staticmethod
+    def _new_handlers() -> tuple[Any, Any]:
+        """Create an action handler and screenshot maker for one session."""
+        # Downscaled JPEG frames are much cheaper to capture, encode and
+        # upload than full-resolution PNG on every step
+        screenshot_config = ImageConfig(
+            max_width=1280, max_height=720, quality=75, format="jpeg"
+        )
+        return (
+            AsyncPyautoguiActionHandler(),
+            AsyncScreenshotMaker(config=screenshot_config),
+        )
 
     async def run_test(
         self,
@@ -87,43 +156,99 @@ class TestRunner:
         Returns:
             TestResult with execution details
         """
+        # Drop untagged steps up front, e.g. for smoke-only runs
+        test = self._select_steps(test)
+        instruction = self._build_test_instruction(test, base_url)
+        return await self._execute_test(test, instruction)
+
+    @staticmethod
+    def _select_steps(test: TestCase) -> TestCase:
+        """Return the test restricted to its `only_tags` steps, if any."""
+        if not test.only_tags:
+            return test
+        return replace(test, steps=[
+            step for step in test.steps if test.only_tags.intersection(step.tags)
+        ])
+
+    async def _execute_test(
+        self,
+        test: TestCase,
+        instruction: str,
+        isolated: bool = False
+    ) -> TestResult:
+        """
+        Run one prepared test instruction, consulting the result cache.
+
+        Tests running concurrently pass `isolated=True` to get their own
+        agent and handlers instead of the shared ones.
+        """
         start_time = datetime.now()
         errors = []
 
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        # One digest identifies the instruction for the cache and in reports
+        instruction_hash = hashlib.blake2b(
+            instruction.encode("utf-8"), digest_size=16
+        ).hexdigest()
+        cache_key = f"{self.model}:{self.max_steps_per_test}:{instruction_hash}"
 
-            agent = AsyncDefaultAgent(max_steps=self.max_steps_per_test, model=self.model)
+        # A tag filter that matches nothing would otherwise "pass" vacuously
+        if test.only_tags and not test.steps:
+            return TestResult(
+                test_name=test.name,
+                success=False,
+                steps_passed=0,
+                steps_total=0,
+                duration_seconds=0,
+                errors=[f"No steps match only_tags: {', '.join(sorted(test.only_tags))}"],
+                instruction_hash=instruction_hash
+            )
 
-            # Build test instruction
-            instruction = self._build_test_instruction(test, base_url)
+        if self.cache_ttl is not None:
+            cached = self._cache.get(cache_key, ttl=self.cache_ttl)
+            if cached is not None:
+                return TestResult(**cached)
+
+        if not _OAGI_AVAILABLE:
+            return TestResult(
+                test_name=test.name,
+                success=False,
+                steps_passed=0,
+                steps_total=len(test.steps),
+                duration_seconds=0,
+                errors=[_OAGI_MISSING],
+                instruction_hash=instruction_hash
+            )
+
+        try:
+            if isolated:
+                agent = AsyncDefaultAgent(max_steps=self.max_steps_per_test, model=self.model)
+                action_handler, image_provider = self._new_handlers()
+            else:
+                agent = self._get_agent(self.max_steps_per_test)
+                action_handler, image_provider = self._get_handlers()
 
             completed = await agent.execute(
                 instruction,
-                action_handler=AsyncPyautoguiActionHandler(),
-                image_provider=AsyncScreenshotMaker(),
+                action_handler=action_handler,
+                image_provider=image_provider,
             )
 
             duration = (datetime.now() - start_time).total_seconds()
 
-            return TestResult(
+            result = TestResult(
                 test_name=test.name,
                 success=completed,
                 steps_passed=len(test.steps) if completed else 0,
                 steps_total=len(test.steps),
                 duration_seconds=duration,
-                errors=errors
+                errors=errors,
+                instruction_hash=instruction_hash
             )
+            # Only passing results are reused; failures always re-run
+            if completed and self.cache_ttl is not None:
+                self._cache.set(cache_key, asdict(result))
+            return result
 
-        except ImportError:
-            return TestResult(
-                test_name=test.name,
-                success=False,
-                steps_passed=0,
-                steps_total=len(test.steps),
-                duration_seconds=0,
-                errors=["oagi package not installed. Run: pip install oagi"]
-            )
         except Exception as e:
             duration = (datetime.now() - start_time).total_seconds()
             return TestResult(
@@ -132,73 +257,170 @@ class TestRunner:
                 steps_passed=0,
                 steps_total=len(test.steps),
                 duration_seconds=duration,
-                errors=[str(e)]
+                errors=[str(e)],
+                instruction_hash=instruction_hash
             )
 
+    def invalidate_cache(self) -> None:
+        """Forget all cached test results."""
+        self._cache.clear()
+
     def _build_test_instruction(
         self,
         test: TestCase,
         base_url: Optional[str]
     ) -> str:
         """Build the test instruction from a TestCase."""
-        parts = [f"Test: {test.name}", f"Description: {test.description}", ""]
+        navigate = f"Navigate to: {base_url}\n\n" if base_url else ""
+        setup = f"Setup:\n{test.setup}\n\n" if test.setup else ""
+        steps = "".join(
+            STEP_INSTRUCTION_TEMPLATE.format(
+                num=i,
+                description=step.description,
+                action=step.action,
+                verify=f"\n   Verify: {step.expected_result}" if step.expected_result else ""
+            )
+            for i, step in enumerate(test.steps, 1)
+        )
+        teardown = f"\n\nTeardown:\n{test.teardown}" if test.teardown else ""
+
+        return TEST_INSTRUCTION_TEMPLATE.format(
+            name=test.name,
+            description=test.description,
+            navigate=navigate,
+            setup=setup,
+            steps=steps,
+            teardown=teardown
+        )
 
-        if base_url:
-            parts.append(f"Navigate to: {base_url}")
-            parts.append("")
+    def _suite_runner(
+        self,
+        isolated: bool = False,
+        dedupe: bool = False
+    ) -> Callable[[TestCase], Awaitable[TestResult]]:
+        """
+        Return a test runner scoped to one suite.
 
-        if test.setup:
-            parts.append("Setup:")
-            parts.append(test.setup)
-            parts.append("")
+        With `dedupe`, tests that render to the same instruction (e.g.
+        shared login flows) run once per suite and later ones reuse the
+        first result. Parallel suites pass `isolated=True` so every test
+        gets its own agent.
+        """
+        memo: dict[str, asyncio.Task] = {}
+
+        async def run_memoized(test: TestCase) -> TestResult:
+            test = self._select_steps(test)
+            instruction = self._build_test_instruction(test, None)
+            if not dedupe:
+                return await self._execute_test(test, instruction, isolated)
+
+            task = memo.get(instruction)
+            if task is None:
+                task = asyncio.ensure_future(self._execute_test(test, instruction, isolated))
+                memo[instruction] = task
+                if len(memo) > SUITE_MEMO_SIZE:
+                    memo.pop(next(iter(memo)))
+                return await task
+            return replace(await task, test_name=test.name)
+
+        return run_memoized
+
+    async def iter_suite(
+        self,
+        tests: list[TestCase],
+        stop_on_failure: bool = False,
+        parallel: bool = False,
+        max_parallel: int = 4,
+        dedupe: bool = False
+    ) -> AsyncIterator[TestResult]:
+        """
+        Run a suite of tests, yielding each result as soon as it is ready.
 
-        parts.append("Test Steps:")
-        for i, step in enumerate(test.steps, 1):
-            parts.append(f"{i}. {step.description}")
-            parts.append(f"   Action: {step.action}")
-            if step.expected_result:
-                parts.append(f"   Verify: {step.expected_result}")
+        Sequential runs yield in test order; parallel runs yield in
+        completion order. With `stop_on_failure`, the first failing result
+        is yielded and any tests still pending are cancelled.
 
-        if test.teardown:
-            parts.append("")
-            parts.append("Teardown:")
-            parts.append(test.teardown)
+        Args:
+            tests: List of TestCase objects to run
+            stop_on_failure: Stop running if a test fails
+            parallel: Run tests in parallel (requires multiple sessions)
+            max_parallel: Maximum tests running at once when parallel
+            dedupe: Run tests with identical instructions only once. Leave
+                off when repeating a stateful test on purpose.
 
-        return "\n".join(parts)
+        Yields:
+            TestResult for each test that ran
+        """
+        run = self._suite_runner(isolated=parallel, dedupe=dedupe)
+
+        if not parallel:
+            for test in tests:
+                result = await run(test)
+                yield result
+
+                if stop_on_failure and not result.success:
+                    return
+            return
+
+        # Run tests concurrently, at most max_parallel agent sessions at once
+        semaphore = asyncio.Semaphore(max(1, max_parallel))
+
+        async def run_bounded(test: TestCase) -> TestResult:
+            async with semaphore:
+                return await run(test)
+
+        tasks = [asyncio.ensure_future(run_bounded(test)) for test in tests]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                yield result
+
+                if stop_on_failure and not result.success:
+                    return
+        finally:
+            for task in tasks:
+                task.cancel()
 
     async def run_suite(
         self,
         tests: list[TestCase],
         stop_on_failure: bool = False,
-        parallel: bool = False
+        parallel: bool = False,
+        max_parallel: int = 4,
+        dedupe: bool = False
     ) -> list[TestResult]:
         """
         Run a suite of tests.
 
+        Use `iter_suite` to receive results as they complete instead.
+
         Args:
             tests: List of TestCase objects to run
             stop_on_failure: Stop running if a test fails
             parallel: Run tests in parallel (requires multiple sessions)
+            max_parallel: Maximum tests running at once when parallel
+            dedupe: Run tests with identical instructions only once. Leave
+                off when repeating a stateful test on purpose.
 
         Returns:
-            List of TestResult for each test
+            List of TestResult for each test, in test order
         """
-        results = []
-
         if parallel:
-            # Run tests concurrently
-            tasks = [self.run_test(test) for test in tests]
-            results = await asyncio.gather(*tasks)
-        else:
-            # Run tests sequentially
-            for test in tests:
-                result = await self.run_test(test)
-                results.append(result)
+            # Keep test order rather than completion order
+            run = self._suite_runner(isolated=True, dedupe=dedupe)
+            semaphore = asyncio.Semaphore(max(1, max_parallel))
 
-                if stop_on_failure and not result.success:
-                    break
+            async def run_bounded(test: TestCase) -> TestResult:
+                async with semaphore:
+                    return await run(test)
 
-        return results
+            return list(await asyncio.gather(*(run_bounded(test) for test in tests)))
+
+        return [
+            result async for result in self.iter_suite(
+                tests, stop_on_failure=stop_on_failure, dedupe=dedupe
+            )
+        ]
 
     def generate_report(
         self,
@@ -221,6 +443,7 @@ class TestRunner:
         total_duration = sum(r.duration_seconds for r in results)
 
         if format == "markdown":
+            pass_rate = f"{passed / total * 100:.1f}%" if total else "N/A"
             lines = [
                 "# Test Report",
                 "",
@@ -228,22 +451,46 @@ class TestRunner:
                 f"- **Total Tests:** {total}",
                 f"- **Passed:** {passed}",
                 f"- **Failed:** {failed}",
-                f"- **Pass Rate:** {passed/total*100:.1f}%" if total > 0 else "N/A",
+                f"- **Pass Rate:** {pass_rate}",
                 f"- **Total Duration:** {total_duration:.2f}s",
                 "",
                 "## Results",
                 "",
             ]
 
-            for result in results:
-                status = "PASS" if result.success else "FAIL"
-                lines.append(f"### {result.test_name} - {status}")
-                lines.append(f"- Steps: {result.steps_passed}/{result.steps_total}")
-                lines.append(f"- Duration: {result.duration_seconds:.2f}s")
-                if result.errors:
-                    lines.append(f"- Errors: {', '.join(result.errors)}")
-                lines.append("")
+            # One formatted block per result, joined once
+            lines.extend(
+                f"### {result.test_name} - {'PASS' if result.success else 'FAIL'}\n"
+                f"- Steps: {result.steps_passed}/{result.steps_total}\n"
+                f"- Duration: {result.duration_seconds:.2f}s\n"
+                + (f"- Errors: {', '.join(result.errors)}\n" if result.errors else "")
+                for result in results
+            )
 
             return "\n".join(lines)
 
+        if format == "json":
+            if orjson is not None:
+                return orjson.dumps(results, option=orjson.OPT_INDENT_2).decode("utf-8")
+            return json.dumps([asdict(r) for r in results], indent=2)
+
+        if format == "html":
+            rows = "".join(
+                f"<tr><td>{html.escape(r.test_name)}</td>"
+                f"<td>{'PASS' if r.success else 'FAIL'}</td>"
+                f"<td>{r.steps_passed}/{r.steps_total}</td>"
+                f"<td>{r.duration_seconds:.2f}s</td>"
+                f"<td>{html.escape(', '.join(r.errors))}</td></tr>\n"
+                for r in results
+            )
+            return (
+                "<h1>Test Report</h1>\n"
+                f"<p>Total: {total} | Passed: {passed} | Failed: {failed} | "
+                f"Duration: {total_duration:.2f}s</p>\n"
+                "<table>\n"
+                "<tr><th>Test</th><th>Status</th><th>Steps</th>"
+                "<th>Duration</th><th>Errors</th></tr>\n"
+                f"{rows}</table>"
+            )
+
         return str(results)
@@ -2,9 +2,35 @@
 UI Validator - Verify UI elements and states.
 """
 
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, AsyncIterator, Optional
 from enum import Enum
+import asyncio
+import re
+
+try:
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker, ImageConfig
+    _OAGI_AVAILABLE = True
+except ImportError:
+    AsyncDefaultAgent = AsyncPyautoguiActionHandler = AsyncScreenshotMaker = ImageConfig = None
+    _OAGI_AVAILABLE = False
+
+_OAGI_MISSING = "oagi package not installed. Run: pip install oagi"
+
+# Most recent check_element_exists results kept per validator
+ELEMENT_CHECK_CACHE_SIZE = 256
+
+
+# Agent instruction for a batch of rules; see _build_validation_instruction
+VALIDATION_INSTRUCTION_TEMPLATE = """Navigate to {url}
+Wait for page to fully load.
+
+Perform the following validations and report results:
+
+{checks}
+Report which validations passed and which failed."""
 
 
 class ValidationType(Enum):
@@ -19,7 +45,7 @@ class ValidationType(Enum):
     URL_CONTAINS = "url_contains"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationRule:
     """A validation rule to check."""
     validation_type: ValidationType
@@ -28,7 +54,7 @@ class ValidationRule:
     timeout: int = 10
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of a validation check."""
     rule: ValidationRule
@@ -38,6 +64,83 @@ class ValidationResult:
     screenshot_path: Optional[str] = None
 
 
+# Instruction text per validation type; see UIValidator._get_validation_text
+_VALIDATION_TEXT = {
+    ValidationType.ELEMENT_EXISTS: "Verify that '{target}' exists on the page",
+    ValidationType.ELEMENT_VISIBLE: "Verify that '{target}' is visible on the page",
+    ValidationType.ELEMENT_ENABLED: "Verify that '{target}' is enabled (not disabled)",
+    ValidationType.TEXT_CONTAINS: "Verify that '{target}' contains text '{expected}'",
+    ValidationType.TEXT_EQUALS: "Verify that '{target}' has exact text '{expected}'",
+    ValidationType.ELEMENT_COUNT: "Verify that there are {expected} instances of '{target}'",
+    ValidationType.PAGE_TITLE: "Verify that page title contains '{expected}'",
+    ValidationType.URL_CONTAINS: "Verify that URL contains '{expected}'",
+}
+
+
+# Checks that only read the loaded page, so any session can answer them
+_STATELESS_TYPES = frozenset({
+    ValidationType.ELEMENT_EXISTS,
+    ValidationType.ELEMENT_COUNT,
+    ValidationType.PAGE_TITLE,
+    ValidationType.URL_CONTAINS,
+})
+
+
+def _normalize_description(description: str) -> str:
+    """Collapse case and whitespace so equivalent descriptions share a key."""
+    return re.sub(r"\s+", " ", description.strip().lower())
+
+
+class ValidationBatch:
+    """
+    Rules queued against one page and validated in a single agent session.
+
+    Created by `UIValidator.batched`. Each check returns a future that
+    resolves to its ValidationResult once the batch is flushed.
+    """
+
+    def __init__(self, validator: "UIValidator", url: str):
+        self.validator = validator
+        self.url = url
+        self._pending: list[tuple[ValidationRule, asyncio.Future]] = []
+
+    def add(self, rule: ValidationRule) -> asyncio.Future:
+        """Queue a rule for the next flush."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((rule, future))
+        return future
+
+    def check_element_exists(self, element_description: str) -> asyncio.Future:
+        """Queue a check that an element exists."""
+        return self.add(ValidationRule(ValidationType.ELEMENT_EXISTS, element_description))
+
+    def check_text_content(
+        self,
+        element_description: str,
+        expected_text: str,
+        exact_match: bool = False
+    ) -> asyncio.Future:
+        """Queue a check that an element contains specific text."""
+        validation_type = ValidationType.TEXT_EQUALS if exact_match else ValidationType.TEXT_CONTAINS
+        return self.add(ValidationRule(validation_type, element_description, expected_text))
+
+    async def flush(self) -> list[ValidationResult]:
+        """Validate all queued rules in one session and resolve their futures."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return []
+        results = await self.validator.validate(self.url, [rule for rule, _ in pending])
+        for (_, future), result in zip(pending, results):
+            future.set_result(result)
+        return results
+
+    def cancel(self) -> None:
+        """Drop queued rules without validating them."""
+        for _, future in self._pending:
+            future.cancel()
+        self._pending = []
+
+
 class UIValidator:
     """
     Validate UI elements and states using Lux.
@@ -52,17 +155,55 @@ class UIValidator:
                 ValidationRule(ValidationType.TEXT_CONTAINS, "Welcome header", "Welcome"),
             ]
         )
+
+    Rules are checked in one agent session by default. With
+    `max_concurrency` above 1, read-only checks (existence, count, title,
+    URL) are spread over extra sessions, each with its own agent and
+    handlers. This still requires isolated desktop sessions, since every
+    agent drives the mouse and keyboard of the display it runs on.
     """
 
     def __init__(
         self,
         max_steps: int = 20,
         model: str = "lux-actor-1",
-        verbose: bool = False
+        verbose: bool = False,
+        max_concurrency: int = 1
     ):
         self.max_steps = max_steps
         self.model = model
         self.verbose = verbose
+        self.max_concurrency = max(1, max_concurrency)
+        self._element_checks: OrderedDict[tuple[str, str], asyncio.Task] = OrderedDict()
+        self._agents: dict[tuple[str, int], Any] = {}
+        self._handlers: Optional[tuple[Any, Any]] = None
+
+    def _get_agent(self, max_steps: int) -> Any:
+        """Return the agent for this model and step budget, created on first use."""
+        key = (self.model, max_steps)
+        agent = self._agents.get(key)
+        if agent is None:
+            agent = self._agents[key] = AsyncDefaultAgent(max_steps=max_steps, model=self.model)
+        return agent
+
+    def _get_handlers(self) -> tuple[Any, Any]:
+        """Return the action handler and screenshot maker shared by all calls."""
+        if self._handlers is None:
+            self._handlers = self._new_handlers()
+        return self._handlers
+
+    @staticmethod
+    def _new_handlers() -> tuple[Any, Any]:
+        """Create an action handler and screenshot maker for one session."""
+        # Downscaled JPEG frames are much cheaper to capture, encode and
+        # upload than full-resolution PNG on every step
+        screenshot_config = ImageConfig(
+            max_width=1280, max_height=720, quality=75, format="jpeg"
+        )
+        return (
+            AsyncPyautoguiActionHandler(),
+            AsyncScreenshotMaker(config=screenshot_config),
+        )
 
     async def validate(
         self,
@@ -79,20 +220,108 @@ class UIValidator:
         Returns:
             List of ValidationResult for each rule
         """
+        if not _OAGI_AVAILABLE:
+            return [
+                ValidationResult(rule=rule, passed=False, error_message=_OAGI_MISSING)
+                for rule in rules
+            ]
+
+        if self.max_concurrency == 1 or len(rules) < 2:
+            return await self._validate_session(
+                self._get_agent(self.max_steps), url, rules
+            )
+
+        # Stateless checks are split across sessions; the rest share one
+        # session so they keep seeing the same page state
+        stateless = [i for i, rule in enumerate(rules) if rule.validation_type in _STATELESS_TYPES]
+        stateful = [i for i, rule in enumerate(rules) if rule.validation_type not in _STATELESS_TYPES]
+        sessions = self.max_concurrency - 1 if stateful else self.max_concurrency
+        groups = [stateless[k::sessions] for k in range(sessions)] + [stateful]
+        groups = [group for group in groups if group]
+
+        group_results = await asyncio.gather(*(
+            self._validate_session(
+                AsyncDefaultAgent(max_steps=self.max_steps, model=self.model),
+                url,
+                [rules[i] for i in group],
+                handlers=self._new_handlers()
+            )
+            for group in groups
+        ))
+
+        # Merge back into rule order
+        results: list[Optional[ValidationResult]] = [None] * len(rules)
+        for group, session_results in zip(groups, group_results):
+            for i, result in zip(group, session_results):
+                results[i] = result
+        return results
+
+    async def validate_many(
+        self,
+        urls: list[str],
+        rules: list[ValidationRule]
+    ) -> list[list[ValidationResult]]:
+        """
+        Validate the same rules on several pages.
+
+        The check list is built once and reused for every URL. Pages are
+        validated one at a time, or up to `max_concurrency` at once.
+
+        Args:
+            urls: URLs to validate
+            rules: ValidationRules to check on each page
+
+        Returns:
+            List of ValidationResult lists, one per URL in input order
+        """
+        if not _OAGI_AVAILABLE:
+            return [await self.validate(url, rules) for url in urls]
+
+        checks = self._build_checks(rules)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def validate_one(url: str) -> list[ValidationResult]:
+            async with semaphore:
+                if self.max_concurrency == 1:
+                    return await self._validate_session(
+                        self._get_agent(self.max_steps), url, rules, checks
+                    )
+                return await self._validate_session(
+                    AsyncDefaultAgent(max_steps=self.max_steps, model=self.model),
+                    url,
+                    rules,
+                    checks,
+                    handlers=self._new_handlers()
+                )
+
+        return list(await asyncio.gather(*(validate_one(url) for url in urls)))
+
+    async def _validate_session(
+        self,
+        agent: Any,
+        url: str,
+        rules: list[ValidationRule],
+        checks: Optional[str] = None,
+        handlers: Optional[tuple[Any, Any]] = None
+    ) -> list[ValidationResult]:
+        """
+        Validate rules in a single agent session.
+
+        Concurrent sessions pass their own `handlers`; otherwise the shared
+        pair from `_get_handlers()` is used.
+        """
         results = []
 
         try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
-
-            agent = AsyncDefaultAgent(max_steps=self.max_steps, model=self.model)
+            action_handler, image_provider = handlers or self._get_handlers()
 
             # Build validation instruction
-            instruction = self._build_validation_instruction(url, rules)
+            instruction = self._build_validation_instruction(url, rules, checks)
 
             completed = await agent.execute(
                 instruction,
-                action_handler=AsyncPyautoguiActionHandler(),
-                image_provider=AsyncScreenshotMaker(),
+                action_handler=action_handler,
+                image_provider=image_provider,
             )
 
             # In a real implementation, you would parse the results
@@ -105,13 +334,6 @@ class UIValidator:
                     error_message=None if completed else "Validation could not be completed"
                 ))
 
-        except ImportError:
-            for rule in rules:
-                results.append(ValidationResult(
-                    rule=rule,
-                    passed=False,
-                    error_message="oagi package not installed. Run: pip install oagi"
-                ))
         except Exception as e:
             for rule in rules:
                 results.append(ValidationResult(
@@ -125,57 +347,83 @@ class UIValidator:
     def _build_validation_instruction(
         self,
         url: str,
-        rules: list[ValidationRule]
+        rules: list[ValidationRule],
+        checks: Optional[str] = None
     ) -> str:
-        """Build validation instruction from rules."""
-        parts = [
-            f"Navigate to {url}",
-            "Wait for page to fully load.",
-            "",
-            "Perform the following validations and report results:",
-            ""
-        ]
-
-        for i, rule in enumerate(rules, 1):
-            validation_text = self._get_validation_text(rule)
-            parts.append(f"{i}. {validation_text}")
-
-        parts.append("")
-        parts.append("Report which validations passed and which failed.")
-
-        return "\n".join(parts)
+        """Build validation instruction from rules, or from prebuilt `checks`."""
+        if checks is None:
+            checks = self._build_checks(rules)
+        return VALIDATION_INSTRUCTION_TEMPLATE.format(url=url, checks=checks)
+
+    def _build_checks(self, rules: list[ValidationRule]) -> str:
+        """Numbered check list for the rules; independent of the URL."""
+        return "".join(
+            f"{i}. {self._get_validation_text(rule)}\n"
+            for i, rule in enumerate(rules, 1)
+        )
 
     def _get_validation_text(self, rule: ValidationRule) -> str:
         """Convert a validation rule to instruction text."""
-        if rule.validation_type == ValidationType.ELEMENT_EXISTS:
-            return f"Verify that '{rule.target}' exists on the page"
-        elif rule.validation_type == ValidationType.ELEMENT_VISIBLE:
-            return f"Verify that '{rule.target}' is visible on the page"
-        elif rule.validation_type == ValidationType.ELEMENT_ENABLED:
-            return f"Verify that '{rule.target}' is enabled (not disabled)"
-        elif rule.validation_type == ValidationType.TEXT_CONTAINS:
-            return f"Verify that '{rule.target}' contains text '{rule.expected_value}'"
-        elif rule.validation_type == ValidationType.TEXT_EQUALS:
-            return f"Verify that '{rule.target}' has exact text '{rule.expected_value}'"
-        elif rule.validation_type == ValidationType.ELEMENT_COUNT:
-            return f"Verify that there are {rule.expected_value} instances of '{rule.target}'"
-        elif rule.validation_type == ValidationType.PAGE_TITLE:
-            return f"Verify that page title contains '{rule.expected_value}'"
-        elif rule.validation_type == ValidationType.URL_CONTAINS:
-            return f"Verify that URL contains '{rule.expected_value}'"
-        else:
-            return f"Validate {rule.target}"
+        template = _VALIDATION_TEXT.get(rule.validation_type, "Validate {target}")
+        return template.format(target=rule.target, expected=rule.expected_value)
+
+    @asynccontextmanager
+    async def batched(self, url: str) -> AsyncIterator[ValidationBatch]:
+        """
+        Collect checks for one page and validate them together on exit.
+
+        Example:
+            async with validator.batched("https://example.com") as batch:
+                login = batch.check_element_exists("Login button")
+                header = batch.check_text_content("Page header", "Welcome")
+            print(login.result().passed, header.result().passed)
+        """
+        batch = ValidationBatch(self, url)
+        try:
+            yield batch
+        except BaseException:
+            batch.cancel()
+            raise
+        await batch.flush()
 
     async def check_element_exists(
         self,
         url: str,
         element_description: str
     ) -> ValidationResult:
-        """Quick check if an element exists."""
-        rule = ValidationRule(ValidationType.ELEMENT_EXISTS, element_description)
-        results = await self.validate(url, [rule])
+        """
+        Quick check if an element exists.
+
+        Passing results are memoized per validator by URL and normalized
+        description (the most recent ELEMENT_CHECK_CACHE_SIZE of them), and
+        concurrent checks for the same element share one agent run. Failed
+        checks are retried on the next call. Call `clear_cache()` when the
+        page may have changed.
+        """
+        key = (url, _normalize_description(element_description))
+        task = self._element_checks.get(key)
+        if task is None:
+            rule = ValidationRule(ValidationType.ELEMENT_EXISTS, element_description)
+            task = asyncio.ensure_future(self.validate(url, [rule]))
+            task.add_done_callback(lambda done: self._forget_failed_check(key, done))
+            self._element_checks[key] = task
+            if len(self._element_checks) > ELEMENT_CHECK_CACHE_SIZE:
+                self._element_checks.popitem(last=False)
+        else:
+            self._element_checks.move_to_end(key)
+        results = await task
         return results[0]
 
+    def _forget_failed_check(self, key: tuple[str, str], task: asyncio.Task) -> None:
+        """Drop a finished element check from the memo unless it passed."""
+        if task.cancelled() or task.exception() is not None or not task.result()[0].passed:
+            if self._element_checks.get(key) is task:
+                del self._element_checks[key]
+
+    def clear_cache(self) -> None:
+        """Forget memoized element checks."""
+        self._element_checks.clear()
+
     async def check_text_content(
         self,
         url: str,
@@ -206,10 +454,16 @@ class UIValidator:
         Returns:
             ValidationResult with comparison details
         """
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        if not _OAGI_AVAILABLE:
+            return ValidationResult(
+                rule=ValidationRule(ValidationType.ELEMENT_EXISTS, "visual_regression"),
+                passed=False,
+                error_message=_OAGI_MISSING
+            )
 
-            agent = AsyncDefaultAgent(max_steps=10, model=self.model)
+        try:
+            agent = self._get_agent(10)
+            action_handler, image_provider = self._get_handlers()
 
             instruction = f"""
             Navigate to {url}
@@ -221,8 +475,8 @@ class UIValidator:
 
             completed = await agent.execute(
                 instruction,
-                action_handler=AsyncPyautoguiActionHandler(),
-                image_provider=AsyncScreenshotMaker(),
+                action_handler=action_handler,
+                image_provider=image_provider,
             )
 
             return ValidationResult(
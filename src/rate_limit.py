@@ -0,0 +1,124 @@
+"""
+Rate limiting - Pace agent sessions against upstream sites.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for asyncio code.
+
+    Allows bursts of up to `max_rate` acquisitions, with tokens refilled
+    continuously at `max_rate` per `time_period` seconds. Callers only wait
+    when the bucket is empty, unlike a fixed sleep between requests.
+
+    Example:
+        limiter = AsyncRateLimiter(max_rate=6, time_period=60)
+
+        async with limiter:
+            await agent.execute(...)
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0):
+        if max_rate <= 0 or time_period <= 0:
+            raise ValueError("max_rate and time_period must be positive")
+
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(
+            self.max_rate,
+            self._tokens + elapsed * self.max_rate / self.time_period
+        )
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep(
+                    (1 - self._tokens) * self.time_period / self.max_rate
+                )
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limiter that adapts its limit to overload signals.
+
+    The limit grows additively (by one slot per full window of successes)
+    and is halved whenever a caller reports an overload, in the style of
+    TCP congestion control. This keeps the number of in-flight agent
+    sessions near what the model backend and local handlers can sustain
+    without hand-tuning a fixed concurrency.
+
+    Example:
+        limiter = AdaptiveConcurrencyLimiter(max_concurrency=8, initial_concurrency=2)
+
+        await limiter.acquire()
+        try:
+            result = await tasker.execute(...)
+        finally:
+            await limiter.release(overloaded=timed_out)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        min_concurrency: int = 1,
+        initial_concurrency: Optional[int] = None
+    ):
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError("require 1 <= min_concurrency <= max_concurrency")
+
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        initial = initial_concurrency or min_concurrency
+        self._limit = float(min(max(initial, min_concurrency), max_concurrency))
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of sessions allowed to run at once."""
+        return int(self._limit)
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free under the current limit and take it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def release(self, overloaded: bool = False) -> None:
+        """
+        Return a slot and adjust the limit.
+
+        Args:
+            overloaded: The call failed due to overload (timeout, 429, ...)
+        """
+        async with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                self._limit = max(self.min_concurrency, self._limit / 2)
+            else:
+                self._limit = min(self.max_concurrency, self._limit + 1 / self._limit)
+            self._condition.notify_all()
@@ -3,11 +3,28 @@ Data Scraper - Extract structured data from web pages.
 """
 
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Optional, Union
+import asyncio
 import json
+import os
+import tempfile
 
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker, ImageConfig
+    _OAGI_AVAILABLE = True
+except ImportError:
+    AsyncDefaultAgent = AsyncPyautoguiActionHandler = AsyncScreenshotMaker = ImageConfig = None
+    _OAGI_AVAILABLE = False
+
+_OAGI_MISSING = "oagi package not installed. Run: pip install oagi"
+
+
+@dataclass(slots=True)
 class ScrapeTarget:
     """Defines what data to scrape from a page."""
     name: str
@@ -15,7 +32,7 @@ class ScrapeTarget:
     expected_type: str = "text"  # text, number, list, table
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeResult:
     """Result of a scraping operation."""
     success: bool
@@ -25,6 +42,30 @@ class ScrapeResult:
     screenshot_path: Optional[str] = None
 
 
+# Extraction hint appended per ScrapeTarget.expected_type ("text" has none)
+_TYPE_HINTS = {
+    "number": " (extract as a number)",
+    "list": " (extract as a list of items)",
+    "table": " (extract as tabular data)",
+}
+
+
+def parse_scraped_data(raw: Union[str, bytes], targets: list[ScrapeTarget]) -> dict[str, Any]:
+    """
+    Parse the JSON object the agent produces for `DataScraper.scrape`.
+
+    The text is parsed once; every target name is present in the result,
+    with None for keys the agent left out.
+
+    Raises:
+        ValueError: If the text is not a JSON object
+    """
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a JSON object, got {type(data).__name__}")
+    return {t.name: data.get(t.name) for t in targets}
+
+
 class DataScraper:
     """
     Extract data from web pages using Lux.
@@ -50,6 +91,35 @@ class DataScraper:
         self.max_steps = max_steps
         self.model = model
         self.verbose = verbose
+        self._agents: dict[tuple[str, int], Any] = {}
+        self._handlers: Optional[tuple[Any, Any]] = None
+
+    def _get_agent(self, max_steps: int) -> Any:
+        """Return the agent for this model and step budget, created on first use."""
+        key = (self.model, max_steps)
+        agent = self._agents.get(key)
+        if agent is None:
+            agent = self._agents[key] = AsyncDefaultAgent(max_steps=max_steps, model=self.model)
+        return agent
+
+    def _get_handlers(self) -> tuple[Any, Any]:
+        """Return the action handler and screenshot maker shared by all calls."""
+        if self._handlers is None:
+            self._handlers = self._new_handlers()
+        return self._handlers
+
+    @staticmethod
+    def _new_handlers() -> tuple[Any, Any]:
+        """Create an action handler and screenshot maker for one session."""
+        # Downscaled JPEG frames are much cheaper to capture, encode and
+        # upload than full-resolution PNG on every step
+        screenshot_config = ImageConfig(
+            max_width=1280, max_height=720, quality=75, format="jpeg"
+        )
+        return (
+            AsyncPyautoguiActionHandler(),
+            AsyncScreenshotMaker(config=screenshot_config),
+        )
 
     async def scrape(
         self,
@@ -68,46 +138,74 @@ class DataScraper:
         Returns:
             ScrapeResult with extracted data
         """
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        if not _OAGI_AVAILABLE:
+            return ScrapeResult(
+                success=False,
+                url=url,
+                data={},
+                errors=[_OAGI_MISSING]
+            )
 
-            agent = AsyncDefaultAgent(max_steps=self.max_steps, model=self.model)
+        return await self._scrape_prebuilt(
+            url, targets, self._build_extraction_block(targets), wait_for_load
+        )
 
-            # Build extraction instructions
-            target_instructions = self._build_target_instructions(targets)
+    async def _scrape_prebuilt(
+        self,
+        url: str,
+        targets: list[ScrapeTarget],
+        extraction: str,
+        wait_for_load: bool = True,
+        isolated: bool = False
+    ) -> ScrapeResult:
+        """
+        Scrape one URL using an extraction block from _build_extraction_block.
+
+        Scrapes running concurrently pass `isolated=True` to get their own
+        agent and handlers instead of the shared ones.
+        """
+        # The agent saves its JSON here; read back and parsed below
+        fd, data_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+
+        try:
+            if isolated:
+                agent = AsyncDefaultAgent(max_steps=self.max_steps, model=self.model)
+                action_handler, image_provider = self._new_handlers()
+            else:
+                agent = self._get_agent(self.max_steps)
+                action_handler, image_provider = self._get_handlers()
 
             instruction = f"""
             Navigate to {url}
             {"Wait for the page to fully load." if wait_for_load else ""}
 
-            Extract the following information:
-            {target_instructions}
-
-            After extracting all data, copy it to clipboard in JSON format.
-            """
+            {extraction}
+            Save the JSON object to: {data_path}"""
 
             completed = await agent.execute(
                 instruction,
-                action_handler=AsyncPyautoguiActionHandler(),
-                image_provider=AsyncScreenshotMaker(),
+                action_handler=action_handler,
+                image_provider=image_provider,
             )
+            if not completed:
+                return ScrapeResult(
+                    success=False,
+                    url=url,
+                    data={t.name: None for t in targets},
+                    errors=["Scrape could not be completed"]
+                )
+
+            with open(data_path, "rb") as f:
+                data = parse_scraped_data(f.read(), targets)
 
-            # Note: In a real implementation, you would retrieve the clipboard content
-            # This is a simplified example
             return ScrapeResult(
-                success=completed,
+                success=True,
                 url=url,
-                data={t.name: None for t in targets},  # Placeholder
+                data=data,
                 errors=[]
             )
 
-        except ImportError:
-            return ScrapeResult(
-                success=False,
-                url=url,
-                data={},
-                errors=["oagi package not installed. Run: pip install oagi"]
-            )
         except Exception as e:
             return ScrapeResult(
                 success=False,
@@ -115,27 +213,39 @@ class DataScraper:
                 data={},
                 errors=[str(e)]
             )
+        finally:
+            try:
+                os.unlink(data_path)
+            except OSError:
+                pass
+
+    def _build_extraction_block(self, targets: list[ScrapeTarget]) -> str:
+        """URL-independent part of the scrape instruction for these targets."""
+        return f"""Extract the following information:
+            {self._build_target_instructions(targets)}
+
+            After extracting all data, write it as a single JSON object with
+            exactly these keys: {", ".join(t.name for t in targets)}.
+            Use null for anything that could not be found.
+            """
 
     def _build_target_instructions(self, targets: list[ScrapeTarget]) -> str:
         """Build instruction text for each scrape target."""
-        instructions = []
-        for i, target in enumerate(targets, 1):
-            type_hint = ""
-            if target.expected_type == "number":
-                type_hint = " (extract as a number)"
-            elif target.expected_type == "list":
-                type_hint = " (extract as a list of items)"
-            elif target.expected_type == "table":
-                type_hint = " (extract as tabular data)"
-
-            instructions.append(f"{i}. {target.name}: {target.description}{type_hint}")
+        return "\n".join(
+            self._target_line(i, target) for i, target in enumerate(targets, 1)
+        )
 
-        return "\n".join(instructions)
+    @staticmethod
+    def _target_line(i: int, target: ScrapeTarget) -> str:
+        """Instruction line for one scrape target."""
+        type_hint = _TYPE_HINTS.get(target.expected_type, "")
+        return f"{i}. {target.name}: {target.description}{type_hint}"
 
     async def scrape_multiple(
         self,
         urls: list[str],
-        targets: list[ScrapeTarget]
+        targets: list[ScrapeTarget],
+        max_concurrency: int = 1
     ) -> list[ScrapeResult]:
         """
         Scrape the same data from multiple URLs.
@@ -143,16 +253,28 @@ class DataScraper:
         Args:
             urls: List of URLs to scrape
             targets: Data targets to extract from each URL
+            max_concurrency: Maximum URLs scraped at once. Values above 1
+                require isolated desktop sessions, since each scrape drives
+                the mouse and keyboard.
 
         Returns:
-            List of ScrapeResult for each URL
+            List of ScrapeResult for each URL, in input order
         """
-        results = []
-        for url in urls:
-            result = await self.scrape(url=url, targets=targets)
-            results.append(result)
+        if not _OAGI_AVAILABLE:
+            return [await self.scrape(url=url, targets=targets) for url in urls]
 
-        return results
+        # Every URL shares the same targets, so build their block once
+        extraction = self._build_extraction_block(targets)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        isolated = max_concurrency > 1
+
+        async def scrape_one(url: str) -> ScrapeResult:
+            async with semaphore:
+                return await self._scrape_prebuilt(
+                    url, targets, extraction, isolated=isolated
+                )
+
+        return list(await asyncio.gather(*(scrape_one(url) for url in urls)))
 
     async def scrape_table(
         self,
@@ -171,10 +293,17 @@ class DataScraper:
         Returns:
             ScrapeResult with table data
         """
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        if not _OAGI_AVAILABLE:
+            return ScrapeResult(
+                success=False,
+                url=url,
+                data={},
+                errors=[_OAGI_MISSING]
+            )
 
-            agent = AsyncDefaultAgent(max_steps=self.max_steps, model=self.model)
+        try:
+            agent = self._get_agent(self.max_steps)
+            action_handler, image_provider = self._get_handlers()
 
             instruction = f"""
             Navigate to {url}
@@ -191,8 +320,8 @@ class DataScraper:
 
             completed = await agent.execute(
                 instruction,
-                action_handler=AsyncPyautoguiActionHandler(),
-                image_provider=AsyncScreenshotMaker(),
+                action_handler=action_handler,
+                image_provider=image_provider,
             )
 
             return ScrapeResult(
@@ -2,12 +2,23 @@
 Form Filler - Automate form completion across websites.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any, Optional
+from urllib.parse import urlparse
 import asyncio
 
+try:
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker, ImageConfig
+    _OAGI_AVAILABLE = True
+except ImportError:
+    AsyncDefaultAgent = AsyncPyautoguiActionHandler = AsyncScreenshotMaker = ImageConfig = None
+    _OAGI_AVAILABLE = False
 
-@dataclass
+_OAGI_MISSING = "oagi package not installed. Run: pip install oagi"
+
+
+@dataclass(slots=True)
 class FormField:
     """Represents a form field to fill."""
     name: str
@@ -15,7 +26,7 @@ class FormField:
     field_type: str = "text"  # text, dropdown, checkbox, radio, textarea
 
 
-@dataclass
+@dataclass(slots=True)
 class FormResult:
     """Result of a form fill operation."""
     success: bool
@@ -24,6 +35,15 @@ class FormResult:
     screenshot_path: Optional[str] = None
 
 
+# Instruction line per FormField.field_type; text-like fields use the default
+_FIELD_TEMPLATES = {
+    "checkbox": "{i}. {check} the '{name}' checkbox",
+    "dropdown": "{i}. Select '{value}' from the '{name}' dropdown",
+    "radio": "{i}. Select the '{value}' radio option for '{name}'",
+}
+_DEFAULT_FIELD_TEMPLATE = "{i}. Enter '{value}' in the '{name}' field"
+
+
 class FormFiller:
     """
     Automate form filling using Lux.
@@ -49,6 +69,35 @@ class FormFiller:
         self.max_steps = max_steps
         self.model = model
         self.verbose = verbose
+        self._agents: dict[tuple[str, int], Any] = {}
+        self._handlers: Optional[tuple[Any, Any]] = None
+
+    def _get_agent(self, max_steps: int) -> Any:
+        """Return the agent for this model and step budget, created on first use."""
+        key = (self.model, max_steps)
+        agent = self._agents.get(key)
+        if agent is None:
+            agent = self._agents[key] = AsyncDefaultAgent(max_steps=max_steps, model=self.model)
+        return agent
+
+    def _get_handlers(self) -> tuple[Any, Any]:
+        """Return the action handler and screenshot maker shared by all calls."""
+        if self._handlers is None:
+            self._handlers = self._new_handlers()
+        return self._handlers
+
+    @staticmethod
+    def _new_handlers() -> tuple[Any, Any]:
+        """Create an action handler and screenshot maker for one session."""
+        # Downscaled JPEG frames are much cheaper to capture, encode and
+        # upload than full-resolution PNG on every step
+        screenshot_config = ImageConfig(
+            max_width=1280, max_height=720, quality=75, format="jpeg"
+        )
+        return (
+            AsyncPyautoguiActionHandler(),
+            AsyncScreenshotMaker(config=screenshot_config),
+        )
 
     async def fill_form(
         self,
@@ -69,11 +118,35 @@ class FormFiller:
         Returns:
             FormResult with success status and details
         """
-        try:
-            # Import here to avoid circular imports
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        return await self._fill_form(url, fields, submit, submit_button_text)
+
+    async def _fill_form(
+        self,
+        url: str,
+        fields: list[FormField],
+        submit: bool = True,
+        submit_button_text: str = "Submit",
+        session: Optional[tuple[Any, Any, Any]] = None
+    ) -> FormResult:
+        """
+        Fill one form with the shared agent and handlers, or with `session`.
+
+        Forms filled concurrently pass their own (agent, action handler,
+        screenshot maker) as `session` instead of sharing one.
+        """
+        if not _OAGI_AVAILABLE:
+            return FormResult(
+                success=False,
+                fields_filled=0,
+                errors=[_OAGI_MISSING]
+            )
 
-            agent = AsyncDefaultAgent(max_steps=self.max_steps, model=self.model)
+        try:
+            if session is not None:
+                agent, action_handler, image_provider = session
+            else:
+                agent = self._get_agent(self.max_steps)
+                action_handler, image_provider = self._get_handlers()
 
             # Build field instructions
             field_instructions = self._build_field_instructions(fields)
@@ -88,8 +161,8 @@ class FormFiller:
 
             completed = await agent.execute(
                 instruction,
-                action_handler=AsyncPyautoguiActionHandler(),
-                image_provider=AsyncScreenshotMaker(),
+                action_handler=action_handler,
+                image_provider=image_provider,
             )
 
             return FormResult(
@@ -98,12 +171,6 @@ class FormFiller:
                 errors=[]
             )
 
-        except ImportError:
-            return FormResult(
-                success=False,
-                fields_filled=0,
-                errors=["oagi package not installed. Run: pip install oagi"]
-            )
         except Exception as e:
             return FormResult(
                 success=False,
@@ -113,44 +180,86 @@ class FormFiller:
 
     def _build_field_instructions(self, fields: list[FormField]) -> str:
         """Build instruction text for each field."""
-        instructions = []
-        for i, field in enumerate(fields, 1):
-            if field.field_type == "checkbox":
-                action = "check" if field.value else "uncheck"
-                instructions.append(f"{i}. {action.capitalize()} the '{field.name}' checkbox")
-            elif field.field_type == "dropdown":
-                instructions.append(f"{i}. Select '{field.value}' from the '{field.name}' dropdown")
-            elif field.field_type == "radio":
-                instructions.append(f"{i}. Select the '{field.value}' radio option for '{field.name}'")
-            else:
-                instructions.append(f"{i}. Enter '{field.value}' in the '{field.name}' field")
+        return "\n".join(
+            self._field_line(i, field) for i, field in enumerate(fields, 1)
+        )
 
-        return "\n".join(instructions)
+    @staticmethod
+    def _field_line(i: int, field: FormField) -> str:
+        """Instruction line for one form field."""
+        template = _FIELD_TEMPLATES.get(field.field_type, _DEFAULT_FIELD_TEMPLATE)
+        return template.format(
+            i=i,
+            name=field.name,
+            value=field.value,
+            check="Check" if field.value else "Uncheck"
+        )
 
     async def fill_multiple_forms(
         self,
         form_configs: list[dict],
-        delay_between: float = 1.0
+        delay_between: float = 1.0,
+        max_concurrency: int = 1
     ) -> list[FormResult]:
         """
-        Fill multiple forms sequentially.
+        Fill multiple forms.
+
+        By default forms are filled one at a time in input order, with
+        `delay_between` seconds between them. With `max_concurrency` above
+        1, forms are grouped by host: forms on the same host are still
+        filled in order with the delay, while different hosts run
+        concurrently. That requires isolated desktop sessions, since each
+        form drives the mouse and keyboard.
 
         Args:
             form_configs: List of dicts with 'url' and 'fields' keys
-            delay_between: Seconds to wait between forms
+            delay_between: Seconds to wait between forms (on the same host
+                when running concurrently)
+            max_concurrency: Maximum hosts filled at once
 
         Returns:
-            List of FormResult for each form
+            List of FormResult for each form, in input order
         """
-        results = []
+        if max_concurrency <= 1:
+            results = []
+            for n, config in enumerate(form_configs):
+                if n:
+                    await asyncio.sleep(delay_between)
+                results.append(await self.fill_form(
+                    url=config["url"],
+                    fields=config["fields"],
+                    submit=config.get("submit", True)
+                ))
+            return results
 
-        for config in form_configs:
-            result = await self.fill_form(
-                url=config["url"],
-                fields=config["fields"],
-                submit=config.get("submit", True)
-            )
-            results.append(result)
-            await asyncio.sleep(delay_between)
+        results: list[Optional[FormResult]] = [None] * len(form_configs)
+
+        by_host: dict[str, list[int]] = defaultdict(list)
+        for i, config in enumerate(form_configs):
+            by_host[urlparse(config["url"]).netloc].append(i)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fill_host(indices: list[int]) -> None:
+            async with semaphore:
+                # Each host group runs as its own session
+                session = None
+                if _OAGI_AVAILABLE:
+                    session = (
+                        AsyncDefaultAgent(max_steps=self.max_steps, model=self.model),
+                        *self._new_handlers()
+                    )
+                for n, i in enumerate(indices):
+                    if n:
+                        await asyncio.sleep(delay_between)
+                    config = form_configs[i]
+                    results[i] = await self._fill_form(
+                        url=config["url"],
+                        fields=config["fields"],
+                        submit=config.get("submit", True),
+                        session=session
+                    )
+
+        await asyncio.gather(*(fill_host(indices) for indices in by_host.values()))
 
         return results
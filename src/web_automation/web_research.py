@@ -2,20 +2,214 @@
 Web Research - Conduct multi-step research across websites.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from ..cache import ResultCache
+
+try:
+    import orjson  # Optional: faster cache-key serialization
+except ImportError:
+    orjson = None
+
+try:
+    from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+    _OAGI_AVAILABLE = True
+except ImportError:
+    AsyncDefaultAgent = AsyncPyautoguiActionHandler = AsyncScreenshotMaker = None
+    _OAGI_AVAILABLE = False
+
+_OAGI_MISSING = "oagi package not installed. Run: pip install oagi"
 
+# Agent instructions for single-session research; see WebResearcher
+RESEARCH_INSTRUCTION_TEMPLATE = """Research Topic: "{topic}"
 
-@dataclass
+Steps:
+1. Go to {search_engine}.com and search for "{topic}"
+2. Visit {num_sources} reputable sources from the search results
+3. For each source, as soon as you have read it:
+   - Read the main content and note key points and findings
+   - Append them to {notes_path} as "## Source <n>: <source URL>"
+     followed by the notes
+4. After the last source, read back {notes_path} and add a summary of all
+   findings at the top, formatted as {output_format}"""
+
+COMPARE_INSTRUCTION_TEMPLATE = """Compare information about "{topic}" across these sources:
+{sources_list}
+
+For each source, extract information about:
+{criteria_list}
+
+Then create a comparison table showing how each source differs."""
+
+FACT_CHECK_INSTRUCTION_TEMPLATE = """Fact-check the following claim: "{claim}"
+
+Steps:
+1. Search for information related to this claim
+2. Visit {num_sources} reputable sources
+3. For each source, note:
+   - Whether it supports, refutes, or is neutral on the claim
+   - Key evidence provided
+4. Compile a summary indicating the overall verdict"""
+
+# Agent instruction for checking several claims in one session; see
+# WebResearcher.fact_check_many
+FACT_CHECK_BATCH_TEMPLATE = """Fact-check each of the following claims:
+{claims_block}
+
+For each claim, in order:
+1. Search for information related to the claim
+2. Visit {num_sources} reputable sources
+3. Note whether each source supports, refutes, or is neutral on the claim,
+   and the key evidence it provides
+
+Save the results to {verdicts_path} as a JSON array with one object per
+claim, in the same order:
+{{"claim": "...", "verdict": "supported" | "refuted" | "inconclusive", "evidence": ["..."]}}"""
+
+# Compact variants for num_sources == 1: one page, nothing to compile
+SINGLE_SOURCE_RESEARCH_TEMPLATE = """Research Topic: "{topic}"
+
+1. Search {search_engine}.com for "{topic}" and open the single most authoritative result
+2. Read the main content and save a summary of its key points, formatted as
+   {output_format}, to: {notes_path}"""
+
+SINGLE_SOURCE_FACT_CHECK_TEMPLATE = """Fact-check the following claim: "{claim}"
+
+Find one reputable source on this claim and report whether it supports,
+refutes, or is neutral on the claim, with the key evidence it provides."""
+
+# Agent instructions used when sources are visited concurrently: one agent
+# lists the sources, then one agent per source saves its notes to a file
+SOURCE_LIST_TEMPLATE = """Go to {search_engine}.com and search for "{topic}"
+
+Save the URLs of the top {num_sources} reputable results to: {urls_path}
+Write one URL per line and nothing else."""
+
+SOURCE_NOTES_TEMPLATE = """Research Topic: "{topic}"
+
+1. Navigate to {url}
+2. Read the main content
+3. Note the key points and findings{criteria}
+4. Save the notes as plain text to: {notes_path}"""
+
+# Seconds a search's result listing is reused; rankings drift slowly
+SOURCE_LIST_TTL = 3600
+
+# Most result listings a WebResearcher keeps; oldest go first
+SOURCE_LIST_CACHE_SIZE = 128
+
+# Step budget per task: fixed overhead (search, summary) plus roughly one
+# navigate/read/extract/back cycle per source; max_steps is the ceiling
+BASE_STEPS = 8
+STEPS_PER_SOURCE = 6
+
+# Most results a WebResearcher keeps in memory; least recently used go first
+RESULT_CACHE_SIZE = 128
+
+
+def _canonical_json(value: Any) -> bytes:
+    """Serialize with sorted keys, so equal arguments give equal bytes."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def _cache_key(method: str, **args: Any) -> str:
+    """Digest of a method name and its normalized arguments."""
+    return hashlib.blake2b(_canonical_json([method, args]), digest_size=16).hexdigest()
+
+
+@dataclass(slots=True, frozen=True)
 class ResearchResult:
     """Result of a research operation."""
     success: bool
     topic: str
     sources_visited: int
     summary: Optional[str]
-    errors: list[str]
+    errors: tuple[str, ...] = ()
     output_path: Optional[str] = None
 
+    def __post_init__(self):
+        # Accept any sequence, e.g. the list a cached JSON result loads as
+        object.__setattr__(self, "errors", tuple(self.errors))
+
+
+# Query parameters that only track the visitor and never change the page
+_TRACKING_PARAMS = frozenset({"gclid", "fbclid", "ref"})
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _canonicalize(url: str) -> str:
+    """
+    Normalize a URL so links to the same page compare equal.
+
+    Lowercases the scheme and host, drops default ports, fragments and
+    tracking parameters (utm_*, gclid, fbclid, ref), and sorts the rest
+    of the query string.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.lower().startswith("utm_") and name.lower() not in _TRACKING_PARAMS
+    ))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def _unique_urls(urls: list[str]) -> list[str]:
+    """Drop URLs that canonicalize to one already seen, keeping order."""
+    seen: set[str] = set()
+    unique = []
+    for url in urls:
+        canonical = _canonicalize(url)
+        if canonical not in seen:
+            seen.add(canonical)
+            unique.append(url)
+    return unique
+
+
+def _read_urls(path: str) -> list[str]:
+    """URLs saved one per line by the source-listing agent."""
+    try:
+        with open(path, "r") as f:
+            return [line.strip() for line in f if line.strip()]
+    except OSError:
+        return []
+
+
+# Summary formats _merge_notes can produce from per-source notes
+_MERGE_FORMATS = frozenset({"markdown", "text", "json"})
+
+
+def _merge_notes(notes: list[tuple[str, str]], output_format: str = "markdown") -> str:
+    """Combine per-source notes into one summary in one of _MERGE_FORMATS."""
+    output_format = output_format.lower()
+    if output_format == "json":
+        return json.dumps(
+            [{"source": url, "notes": text.strip()} for url, text in notes],
+            indent=2,
+            ensure_ascii=False
+        )
+    heading = "## " if output_format == "markdown" else ""
+    return "\n\n".join(
+        f"{heading}Source {i}: {url}\n\n{text.strip()}" for i, (url, text) in enumerate(notes, 1)
+    )
+
 
 class WebResearcher:
     """
@@ -28,17 +222,87 @@ class WebResearcher:
             num_sources=5,
             output_format="markdown"
         )
+
+    By default one agent visits every source in turn. `max_concurrency`
+    above 1 gives each source its own agent and merges their notes into the
+    result summary (for markdown, text or json output); like BulkDataEntry,
+    this requires isolated desktop sessions.
+
+    With `cache_ttl` set, successful results are kept in memory and
+    repeating a call with the same arguments within that many seconds
+    returns a copy without running the agent; pass `force_refresh=True`
+    to bypass it. With `cache_dir` set, successful results are also stored
+    on disk there and survive restarts (expiring after `cache_ttl`, or
+    never if it is None), so recurring research skips the agent entirely.
     """
 
     def __init__(
         self,
         max_steps: int = 50,
         model: str = "lux-thinker-1",
-        verbose: bool = False
+        verbose: bool = False,
+        max_concurrency: int = 1,
+        cache_ttl: Optional[float] = None,
+        cache_dir: Optional[str] = None
     ):
         self.max_steps = max_steps
         self.model = model
         self.verbose = verbose
+        self.max_concurrency = max(1, max_concurrency)
+        self.cache_ttl = cache_ttl
+        self._results: OrderedDict[str, tuple[float, ResearchResult]] = OrderedDict()
+        self._disk_cache = ResultCache("research", cache_dir) if cache_dir else None
+        self._agents: dict[tuple[str, int], Any] = {}
+        self._source_lists: OrderedDict[tuple[str, str], tuple[float, list[str]]] = OrderedDict()
+        self._handlers: Optional[tuple[Any, Any]] = None
+
+    def _step_budget(self, num_sources: int) -> int:
+        """Agent steps for a task visiting num_sources pages, capped at max_steps."""
+        return min(self.max_steps, BASE_STEPS + STEPS_PER_SOURCE * max(0, num_sources))
+
+    def _get_agent(self, max_steps: int) -> Any:
+        """Return the agent for this model and step budget, created on first use."""
+        key = (self.model, max_steps)
+        agent = self._agents.get(key)
+        if agent is None:
+            agent = self._agents[key] = AsyncDefaultAgent(max_steps=max_steps, model=self.model)
+        return agent
+
+    def _get_handlers(self) -> tuple[Any, Any]:
+        """Return the action handler and screenshot maker shared by sequential calls."""
+        if self._handlers is None:
+            self._handlers = (AsyncPyautoguiActionHandler(), AsyncScreenshotMaker())
+        return self._handlers
+
+    def _cached_result(self, key: str) -> Optional[ResearchResult]:
+        """Return a copy of the cached result for key, if still fresh."""
+        if self.cache_ttl is not None:
+            entry = self._results.get(key)
+            if entry is not None:
+                stored_at, result = entry
+                if time.monotonic() - stored_at <= self.cache_ttl:
+                    self._results.move_to_end(key)
+                    return result  # Frozen, so safe to share
+                del self._results[key]
+
+        if self._disk_cache is not None:
+            data = self._disk_cache.get(key, ttl=self.cache_ttl)
+            if data is not None:
+                return ResearchResult(**data)
+
+        return None
+
+    def _remember(self, key: str, result: ResearchResult) -> None:
+        """Cache a successful result under key."""
+        if not result.success:
+            return
+        if self.cache_ttl is not None:
+            self._results[key] = (time.monotonic(), result)
+            self._results.move_to_end(key)
+            if len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        if self._disk_cache is not None:
+            self._disk_cache.set(key, asdict(result))
 
     async def research(
         self,
@@ -46,7 +310,8 @@ class WebResearcher:
         num_sources: int = 3,
         search_engine: str = "google",
         output_format: str = "markdown",
-        save_to_file: Optional[str] = None
+        save_to_file: Optional[str] = None,
+        force_refresh: bool = False
     ) -> ResearchResult:
         """
         Conduct research on a topic across multiple sources.
@@ -57,113 +322,364 @@ class WebResearcher:
             search_engine: Search engine to use (google, bing, duckduckgo)
             output_format: Format for the summary (markdown, text, json)
             save_to_file: Optional file path to save results
+            force_refresh: Ignore any cached result and run the agent
 
         Returns:
             ResearchResult with findings
         """
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        if num_sources < 1:
+            return ResearchResult(
+                success=False,
+                topic=topic,
+                sources_visited=0,
+                summary=None,
+                errors=("num_sources must be at least 1",)
+            )
+
+        if not _OAGI_AVAILABLE:
+            return ResearchResult(
+                success=False,
+                topic=topic,
+                sources_visited=0,
+                summary=None,
+                errors=(_OAGI_MISSING,)
+            )
+
+        key = _cache_key(
+            "research",
+            topic=topic.strip(),
+            num_sources=num_sources,
+            search_engine=search_engine.lower(),
+            output_format=output_format.lower(),
+            save_to_file=save_to_file
+        )
+        if not force_refresh:
+            cached = self._cached_result(key)
+            if cached is not None:
+                # A restored result may outlive the file it was saved to
+                if save_to_file and cached.summary and not os.path.exists(save_to_file):
+                    with open(save_to_file, "w") as f:
+                        f.write(cached.summary)
+                return cached
+
+        # Per-source notes are merged locally, so only formats the merge
+        # can produce go that way; others are left to a single agent
+        if (
+            self.max_concurrency > 1
+            and num_sources > 1
+            and output_format.lower() in _MERGE_FORMATS
+        ):
+            result = await self._research_per_source(
+                topic, num_sources, search_engine, output_format, save_to_file
+            )
+            self._remember(key, result)
+            return result
 
-            agent = AsyncDefaultAgent(max_steps=self.max_steps, model=self.model)
+        # Notes go to the requested file, or a scratch file read back below;
+        # either way the agent appends to an empty file
+        if save_to_file:
+            notes_path = save_to_file
+        else:
+            fd, notes_path = tempfile.mkstemp(suffix=".md")
+            os.close(fd)
 
-            save_instruction = ""
+        try:
             if save_to_file:
-                save_instruction = f"\n6. Save the compiled research to: {save_to_file}"
-
-            instruction = f"""
-            Research Topic: "{topic}"
-
-            Steps:
-            1. Go to {search_engine}.com and search for "{topic}"
-            2. Visit {num_sources} reputable sources from the search results
-            3. For each source:
-               - Read the main content
-               - Note key points and findings
-               - Record the source URL
-            4. Compile all findings into a comprehensive summary
-            5. Format the summary as {output_format}{save_instruction}
-            """
+                open(notes_path, "w").close()
+
+            agent = self._get_agent(self._step_budget(num_sources))
+            action_handler, image_provider = self._get_handlers()
+
+            if num_sources == 1:
+                # No per-source notes to merge; a plain-text summary is
+                # enough unless the caller keeps the file
+                instruction = SINGLE_SOURCE_RESEARCH_TEMPLATE.format(
+                    topic=topic,
+                    search_engine=search_engine,
+                    output_format=output_format if save_to_file else "plain text",
+                    notes_path=notes_path
+                )
+            else:
+                instruction = RESEARCH_INSTRUCTION_TEMPLATE.format(
+                    topic=topic,
+                    search_engine=search_engine,
+                    num_sources=num_sources,
+                    output_format=output_format,
+                    notes_path=notes_path
+                )
 
             completed = await agent.execute(
                 instruction,
-                action_handler=AsyncPyautoguiActionHandler(),
-                image_provider=AsyncScreenshotMaker(),
+                action_handler=action_handler,
+                image_provider=image_provider,
             )
 
-            return ResearchResult(
+            try:
+                with open(notes_path, "r") as f:
+                    summary = f.read() or None
+            except OSError:
+                summary = None
+
+            result = ResearchResult(
                 success=completed,
                 topic=topic,
                 sources_visited=num_sources,
-                summary=None,  # Would be populated from actual execution
-                errors=[],
+                summary=summary,
                 output_path=save_to_file
             )
+            self._remember(key, result)
+            return result
 
-        except ImportError:
+        except Exception as e:
             return ResearchResult(
                 success=False,
                 topic=topic,
                 sources_visited=0,
                 summary=None,
-                errors=["oagi package not installed. Run: pip install oagi"]
+                errors=(str(e),)
             )
+        finally:
+            if not save_to_file:
+                try:
+                    os.unlink(notes_path)
+                except OSError:
+                    pass
+
+    async def _research_per_source(
+        self,
+        topic: str,
+        num_sources: int,
+        search_engine: str,
+        output_format: str,
+        save_to_file: Optional[str]
+    ) -> ResearchResult:
+        """List the top sources, then visit them concurrently and merge notes."""
+        try:
+            with tempfile.TemporaryDirectory() as workdir:
+                urls = await self._list_sources(topic, num_sources, search_engine, workdir)
+                if not urls:
+                    return ResearchResult(
+                        success=False,
+                        topic=topic,
+                        sources_visited=0,
+                        summary=None,
+                        errors=("No sources found",)
+                    )
+
+                notes, errors = await self._visit_sources(topic, urls, workdir)
+
+            summary = _merge_notes(notes, output_format) if notes else None
+            if summary is not None and save_to_file:
+                with open(save_to_file, "w") as f:
+                    f.write(summary)
+
+            return ResearchResult(
+                success=bool(notes),
+                topic=topic,
+                sources_visited=len(notes),
+                summary=summary,
+                errors=tuple(errors),
+                output_path=save_to_file if summary is not None else None
+            )
+
         except Exception as e:
             return ResearchResult(
                 success=False,
                 topic=topic,
                 sources_visited=0,
                 summary=None,
-                errors=[str(e)]
+                errors=(str(e),)
             )
 
+    async def _list_sources(
+        self,
+        topic: str,
+        num_sources: int,
+        search_engine: str,
+        workdir: str
+    ) -> list[str]:
+        """
+        Top result URLs for a search, reusing a recent listing when possible.
+
+        Listings are cached per (search engine, topic) for SOURCE_LIST_TTL
+        seconds, so related research on one topic searches only once. At
+        most SOURCE_LIST_CACHE_SIZE listings are kept.
+        """
+        key = (search_engine.lower(), topic.strip().lower())
+        entry = self._source_lists.get(key)
+        if entry is not None:
+            stored_at, urls = entry
+            if time.monotonic() - stored_at > SOURCE_LIST_TTL:
+                del self._source_lists[key]
+            elif len(urls) >= num_sources:
+                return urls[:num_sources]
+
+        urls_path = os.path.join(workdir, "sources.txt")
+        agent = self._get_agent(self._step_budget(1))
+        action_handler, image_provider = self._get_handlers()
+        completed = await agent.execute(
+            SOURCE_LIST_TEMPLATE.format(
+                search_engine=search_engine,
+                topic=topic,
+                num_sources=num_sources,
+                urls_path=urls_path
+            ),
+            action_handler=action_handler,
+            image_provider=image_provider,
+        )
+        urls = _read_urls(urls_path) if completed else []
+        if urls:
+            self._source_lists[key] = (time.monotonic(), urls)
+            self._source_lists.move_to_end(key)
+            if len(self._source_lists) > SOURCE_LIST_CACHE_SIZE:
+                self._source_lists.popitem(last=False)
+        return urls[:num_sources]
+
+    async def _visit_sources(
+        self,
+        topic: str,
+        urls: list[str],
+        workdir: str,
+        criteria: str = ""
+    ) -> tuple[list[tuple[str, str]], list[str]]:
+        """
+        Visit each URL with its own agent, at most max_concurrency at once.
+
+        Returns:
+            (url, notes) for each source that completed, in URL order, and
+            an error message for each that did not
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def visit_one(i: int, url: str) -> str:
+            notes_path = os.path.join(workdir, f"source{i}.txt")
+            async with semaphore:
+                # Concurrent visits get their own agent and handlers
+                agent = AsyncDefaultAgent(max_steps=self._step_budget(1), model=self.model)
+                action_handler = AsyncPyautoguiActionHandler()
+                image_provider = AsyncScreenshotMaker()
+                completed = await agent.execute(
+                    SOURCE_NOTES_TEMPLATE.format(
+                        topic=topic, url=url, criteria=criteria, notes_path=notes_path
+                    ),
+                    action_handler=action_handler,
+                    image_provider=image_provider,
+                )
+            if not completed:
+                raise RuntimeError("visit did not complete")
+            with open(notes_path, "r") as f:
+                return f.read()
+
+        outcomes = await asyncio.gather(
+            *(visit_one(i, url) for i, url in enumerate(urls, 1)),
+            return_exceptions=True
+        )
+
+        notes = []
+        errors = []
+        for url, outcome in zip(urls, outcomes):
+            if isinstance(outcome, BaseException):
+                errors.append(f"{url}: {outcome}")
+            else:
+                notes.append((url, outcome))
+        return notes, errors
+
     async def compare_sources(
         self,
         topic: str,
         sources: list[str],
-        comparison_criteria: list[str]
+        comparison_criteria: list[str],
+        force_refresh: bool = False
     ) -> ResearchResult:
         """
         Compare information across specific sources.
 
         Args:
             topic: The topic to compare
-            sources: List of URLs to compare
+            sources: List of URLs to compare; URLs for the same page (e.g.
+                differing only in tracking parameters) are visited once
             comparison_criteria: Aspects to compare
+            force_refresh: Ignore any cached result and run the agent
 
         Returns:
             ResearchResult with comparison
         """
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        if not sources or not comparison_criteria:
+            return ResearchResult(
+                success=False,
+                topic=topic,
+                sources_visited=0,
+                summary=None,
+                errors=("sources and comparison_criteria must be non-empty",)
+            )
 
-            agent = AsyncDefaultAgent(max_steps=self.max_steps, model=self.model)
+        if not _OAGI_AVAILABLE:
+            return ResearchResult(
+                success=False,
+                topic=topic,
+                sources_visited=0,
+                summary=None,
+                errors=(_OAGI_MISSING,)
+            )
+
+        # Skip repeat visits to the same page under a different URL
+        sources = _unique_urls(sources)
 
-            sources_list = "\n".join(f"   - {url}" for url in sources)
-            criteria_list = "\n".join(f"   - {c}" for c in comparison_criteria)
+        key = _cache_key(
+            "compare_sources",
+            topic=topic.strip(),
+            sources=[_canonicalize(url) for url in sources],
+            comparison_criteria=comparison_criteria
+        )
+        if not force_refresh:
+            cached = self._cached_result(key)
+            if cached is not None:
+                return cached
+
+        # Shared by both the per-source and single-session prompts
+        criteria_list = "\n".join(["   - " + c for c in comparison_criteria])
+
+        if self.max_concurrency > 1 and len(sources) > 1:
+            with tempfile.TemporaryDirectory() as workdir:
+                notes, errors = await self._visit_sources(
+                    topic, sources, workdir, criteria=", covering:\n" + criteria_list
+                )
+            result = ResearchResult(
+                success=bool(notes),
+                topic=topic,
+                sources_visited=len(notes),
+                summary=_merge_notes(notes) if notes else None,
+                errors=tuple(errors)
+            )
+            self._remember(key, result)
+            return result
 
-            instruction = f"""
-            Compare information about "{topic}" across these sources:
-            {sources_list}
+        try:
+            agent = self._get_agent(self._step_budget(len(sources)))
+            action_handler, image_provider = self._get_handlers()
 
-            For each source, extract information about:
-            {criteria_list}
+            sources_list = "\n".join(["   - " + url for url in sources])
 
-            Then create a comparison table showing how each source differs.
-            """
+            instruction = COMPARE_INSTRUCTION_TEMPLATE.format(
+                topic=topic,
+                sources_list=sources_list,
+                criteria_list=criteria_list
+            )
 
             completed = await agent.execute(
                 instruction,
-                action_handler=AsyncPyautoguiActionHandler(),
-                image_provider=AsyncScreenshotMaker(),
+                action_handler=action_handler,
+                image_provider=image_provider,
             )
 
-            return ResearchResult(
+            result = ResearchResult(
                 success=completed,
                 topic=topic,
                 sources_visited=len(sources),
-                summary=None,
-                errors=[]
+                summary=None
             )
+            self._remember(key, result)
+            return result
 
         except Exception as e:
             return ResearchResult(
@@ -171,13 +687,14 @@ class WebResearcher:
                 topic=topic,
                 sources_visited=0,
                 summary=None,
-                errors=[str(e)]
+                errors=(str(e),)
             )
 
     async def fact_check(
         self,
         claim: str,
-        num_sources: int = 3
+        num_sources: int = 3,
+        force_refresh: bool = False
     ) -> ResearchResult:
         """
         Fact-check a claim using multiple sources.
@@ -185,40 +702,61 @@ class WebResearcher:
         Args:
             claim: The claim to verify
             num_sources: Number of sources to check
+            force_refresh: Ignore any cached result and run the agent
 
         Returns:
             ResearchResult with fact-check findings
         """
-        try:
-            from oagi import AsyncDefaultAgent, AsyncPyautoguiActionHandler, AsyncScreenshotMaker
+        if not claim or not claim.strip() or num_sources < 1:
+            return ResearchResult(
+                success=False,
+                topic=f"Fact-check: {claim}",
+                sources_visited=0,
+                summary=None,
+                errors=("claim must be non-empty and num_sources at least 1",)
+            )
 
-            agent = AsyncDefaultAgent(max_steps=self.max_steps, model=self.model)
+        if not _OAGI_AVAILABLE:
+            return ResearchResult(
+                success=False,
+                topic=f"Fact-check: {claim}",
+                sources_visited=0,
+                summary=None,
+                errors=(_OAGI_MISSING,)
+            )
 
-            instruction = f"""
-            Fact-check the following claim: "{claim}"
+        key = _cache_key("fact_check", claim=claim.strip(), num_sources=num_sources)
+        if not force_refresh:
+            cached = self._cached_result(key)
+            if cached is not None:
+                return cached
 
-            Steps:
-            1. Search for information related to this claim
-            2. Visit {num_sources} reputable sources
-            3. For each source, note:
-               - Whether it supports, refutes, or is neutral on the claim
-               - Key evidence provided
-            4. Compile a summary indicating the overall verdict
-            """
+        try:
+            agent = self._get_agent(self._step_budget(num_sources))
+            action_handler, image_provider = self._get_handlers()
+
+            if num_sources == 1:
+                instruction = SINGLE_SOURCE_FACT_CHECK_TEMPLATE.format(claim=claim)
+            else:
+                instruction = FACT_CHECK_INSTRUCTION_TEMPLATE.format(
+                    claim=claim,
+                    num_sources=num_sources
+                )
 
             completed = await agent.execute(
                 instruction,
-                action_handler=AsyncPyautoguiActionHandler(),
-                image_provider=AsyncScreenshotMaker(),
+                action_handler=action_handler,
+                image_provider=image_provider,
             )
 
-            return ResearchResult(
+            result = ResearchResult(
                 success=completed,
                 topic=f"Fact-check: {claim}",
                 sources_visited=num_sources,
-                summary=None,
-                errors=[]
+                summary=None
             )
+            self._remember(key, result)
+            return result
 
         except Exception as e:
             return ResearchResult(
@@ -226,5 +764,114 @@ class WebResearcher:
                 topic=f"Fact-check: {claim}",
                 sources_visited=0,
                 summary=None,
-                errors=[str(e)]
+                errors=(str(e),)
+            )
+
+    async def fact_check_many(
+        self,
+        claims: list[str],
+        num_sources: int = 3,
+        force_refresh: bool = False
+    ) -> list[ResearchResult]:
+        """
+        Fact-check several claims in one agent session.
+
+        Claims with a cached result are answered from the cache; the rest
+        are checked together and the agent saves a verdict per claim to a
+        JSON file. If that file is missing or malformed, each remaining
+        claim falls back to its own fact_check call.
+
+        Args:
+            claims: The claims to verify
+            num_sources: Number of sources to check per claim
+            force_refresh: Ignore any cached results and run the agent
+
+        Returns:
+            ResearchResult for each claim, in input order
+        """
+        if len(claims) < 2 or not _OAGI_AVAILABLE or num_sources < 1:
+            return [
+                await self.fact_check(claim, num_sources, force_refresh=force_refresh)
+                for claim in claims
+            ]
+
+        results: list[Optional[ResearchResult]] = [None] * len(claims)
+        keys = [
+            _cache_key("fact_check", claim=claim.strip(), num_sources=num_sources)
+            for claim in claims
+        ]
+        pending = []
+        for i, (claim, key) in enumerate(zip(claims, keys)):
+            cached = None if force_refresh else self._cached_result(key)
+            if cached is not None:
+                results[i] = cached
+            elif claim and claim.strip():
+                pending.append(i)
+
+        verdicts = None
+        if len(pending) > 1:
+            verdicts = await self._fact_check_batch(
+                [claims[i] for i in pending], num_sources
             )
+
+        if verdicts is not None:
+            for i, verdict in zip(pending, verdicts):
+                evidence = verdict.get("evidence") or ()
+                if isinstance(evidence, str):
+                    evidence = (evidence,)
+                evidence = "".join(f"\n- {item}" for item in evidence)
+                result = ResearchResult(
+                    success=bool(verdict.get("verdict")),
+                    topic=f"Fact-check: {claims[i]}",
+                    sources_visited=num_sources,
+                    summary=f"Verdict: {verdict.get('verdict')}{evidence}"
+                )
+                self._remember(keys[i], result)
+                results[i] = result
+
+        # Anything still unanswered (no usable batch, or an invalid claim)
+        # goes through fact_check one at a time
+        for i, claim in enumerate(claims):
+            if results[i] is None:
+                results[i] = await self.fact_check(
+                    claim, num_sources, force_refresh=force_refresh
+                )
+        return results
+
+    async def _fact_check_batch(
+        self,
+        claims: list[str],
+        num_sources: int
+    ) -> Optional[list[dict[str, Any]]]:
+        """Run one session over all claims; None if no usable verdicts came back."""
+        claims_block = "\n".join([f"{i}. {claim}" for i, claim in enumerate(claims, 1)])
+
+        with tempfile.TemporaryDirectory() as workdir:
+            verdicts_path = os.path.join(workdir, "verdicts.json")
+            try:
+                agent = self._get_agent(self._step_budget(num_sources * len(claims)))
+                action_handler, image_provider = self._get_handlers()
+                completed = await agent.execute(
+                    FACT_CHECK_BATCH_TEMPLATE.format(
+                        claims_block=claims_block,
+                        num_sources=num_sources,
+                        verdicts_path=verdicts_path
+                    ),
+                    action_handler=action_handler,
+                    image_provider=image_provider,
+                )
+                if not completed:
+                    return None
+                with open(verdicts_path, "rb") as f:
+                    data = f.read()
+                verdicts = orjson.loads(data) if orjson is not None else json.loads(data)
+            except Exception:
+                return None
+
+        if (
+            not isinstance(verdicts, list)
+            or len(verdicts) != len(claims)
+            or not all(isinstance(v, dict) for v in verdicts)
+        ):
+            return None
+        return verdicts
@@ -0,0 +1,81 @@
+"""
+Tests for src.cache.
+"""
+
+import os
+import time
+
+import pytest
+
+from src.cache import ResultCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache("test", cache_dir=str(tmp_path))
+
+
+def _age(cache: ResultCache, key: str, seconds: float) -> None:
+    """Backdate the entry for key by `seconds`."""
+    path = cache._path(key)
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_cache_miss_returns_none(cache):
+    assert cache.get("missing") is None
+    assert cache.get("missing", ttl=60) is None
+
+
+def test_cache_hit_returns_stored_value(cache):
+    value = {"symbol": "AAPL", "transactions": [{"shares": 100, "price": 1.5}]}
+    cache.set("AAPL:2025-01-15", value)
+    assert cache.get("AAPL:2025-01-15") == value
+    assert cache.get("AAPL:2025-01-15", ttl=60) == value
+
+
+def test_cache_keys_are_independent(cache):
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    assert cache.get("b") == 2
+
+
+def test_cache_set_overwrites_entry(cache):
+    cache.set("key", "old")
+    cache.set("key", "new")
+    assert cache.get("key") == "new"
+
+
+def test_cache_entry_expires_after_ttl(cache):
+    cache.set("key", [1, 2, 3])
+    _age(cache, "key", 120)
+    assert cache.get("key", ttl=60) is None
+    # Without a ttl the entry never expires
+    assert cache.get("key") == [1, 2, 3]
+
+
+def test_cache_namespaces_are_separate(tmp_path):
+    first = ResultCache("first", cache_dir=str(tmp_path))
+    second = ResultCache("second", cache_dir=str(tmp_path))
+    first.set("key", "value")
+    assert second.get("key") is None
+
+
+def test_cache_unreadable_entry_is_a_miss(cache):
+    cache.set("key", "value")
+    with open(cache._path("key"), "w") as f:
+        f.write("{not json")
+    assert cache.get("key") is None
+
+
+def test_cache_clear_removes_entries(cache):
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.clear()
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+
+
+def test_cache_clear_without_entries(tmp_path):
+    ResultCache("empty", cache_dir=str(tmp_path)).clear()
@@ -0,0 +1,66 @@
+"""
+Tests for src.web_automation.data_scraper.
+"""
+
+import pytest
+
+from src.web_automation import data_scraper
+from src.web_automation.data_scraper import ScrapeTarget, parse_scraped_data
+
+
+TARGETS = [
+    ScrapeTarget("product_name", "The main product title"),
+    ScrapeTarget("price", "The product price", expected_type="number"),
+    ScrapeTarget("features", "List of product features", expected_type="list"),
+]
+
+
+@pytest.fixture(params=["orjson", "json"])
+def parser(request, monkeypatch):
+    """Run each test with orjson (when installed) and the stdlib fallback."""
+    if request.param == "orjson":
+        if data_scraper.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(data_scraper, "orjson", None)
+    return parse_scraped_data
+
+
+def test_parses_json_object(parser):
+    raw = '{"product_name": "Mouse", "price": 19.99, "features": ["wireless", "usb-c"]}'
+    assert parser(raw, TARGETS) == {
+        "product_name": "Mouse",
+        "price": 19.99,
+        "features": ["wireless", "usb-c"],
+    }
+
+
+def test_accepts_bytes(parser):
+    raw = b'{"product_name": "Mouse", "price": 19.99, "features": []}'
+    assert parser(raw, TARGETS)["product_name"] == "Mouse"
+
+
+def test_missing_keys_are_none(parser):
+    assert parser('{"price": null}', TARGETS) == {
+        "product_name": None,
+        "price": None,
+        "features": None,
+    }
+
+
+def test_extra_keys_are_dropped(parser):
+    raw = '{"product_name": "Mouse", "rating": 4.5}'
+    assert "rating" not in parser(raw, TARGETS)
+
+
+@pytest.mark.parametrize("raw", ["[1, 2, 3]", '"text"', "42", "null"])
+def test_non_object_json_raises(parser, raw):
+    with pytest.raises(ValueError, match="Expected a JSON object"):
+        parser(raw, TARGETS)
+
+
+@pytest.mark.parametrize("raw", ["", "{not json", '{"price": 1'])
+def test_invalid_json_raises(parser, raw):
+    # orjson.JSONDecodeError and json.JSONDecodeError both subclass ValueError
+    with pytest.raises(ValueError):
+        parser(raw, TARGETS)
@@ -0,0 +1,106 @@
+"""
+Tests for the row parsers in the AAPL insider and Amazon search examples.
+"""
+
+import pytest
+
+# The example scripts exit at import time without the oagi SDK
+pytest.importorskip("oagi")
+
+from examples.aapl_insider_activity import parse_transactions, split_symbol_sections
+from examples.amazon_product_search import parse_products
+
+
+class TestParseTransactions:
+    def test_parses_row(self):
+        [txn] = parse_transactions("Tim Cook | CEO | Sell | 1,000 | $185.50 | 2025-01-10")
+        assert txn.insider_name == "Tim Cook"
+        assert txn.title == "CEO"
+        assert txn.transaction_type == "Sell"
+        assert txn.shares == 1000
+        assert txn.price == 185.5
+        assert txn.date == "2025-01-10"
+        assert txn.value == 185500.0
+
+    def test_keeps_multi_word_types(self):
+        text = (
+            "Jeff Williams | COO | Option Exercise | 50,000 | 0.00 | 2025-01-08\n"
+            "Luca Maestri | CFO | Automatic Sell | 12,345 | $1,185.25 | 2025-01-09\n"
+        )
+        txns = parse_transactions(text)
+        assert [t.transaction_type for t in txns] == ["Option Exercise", "Automatic Sell"]
+        assert txns[1].shares == 12345
+        assert txns[1].price == 1185.25
+
+    def test_skips_header_and_blank_lines(self):
+        text = (
+            "Name | Title | Type | Shares | Price | Date\n"
+            "\n"
+            "=== AAPL ===\n"
+            "Tim Cook | CEO | Sell | 1,000 | $185.50 | 2025-01-10\n"
+        )
+        assert [t.insider_name for t in parse_transactions(text)] == ["Tim Cook"]
+
+    @pytest.mark.parametrize("row", [
+        "Tim Cook | CEO | Sell | 1,000 | $185.50",
+        "Tim Cook | CEO | Sell | 1,000",
+        "Tim Cook",
+        "Tim Cook | CEO | Sell | 1,000 | $185.50 | 2025-01-10 | extra",
+        "Tim Cook | CEO | Sell | many | $185.50 | 2025-01-10",
+    ])
+    def test_skips_rows_with_wrong_columns(self, row):
+        assert parse_transactions(row) == []
+
+    def test_empty_title_is_allowed(self):
+        [txn] = parse_transactions("Jane Doe |  | Buy | 10 | 5 | 2025-01-02")
+        assert txn.title == ""
+
+
+class TestSplitSymbolSections:
+    def test_splits_by_header(self):
+        text = (
+            "=== AAPL ===\n"
+            "Tim Cook | CEO | Sell | 1,000 | $185.50 | 2025-01-10\n"
+            "=== msft ===\n"
+            "Satya Nadella | CEO | Sell | 500 | $400.00 | 2025-01-11\n"
+        )
+        sections = split_symbol_sections(text)
+        assert list(sections) == ["AAPL", "MSFT"]
+        assert [t.insider_name for t in parse_transactions(sections["AAPL"])] == ["Tim Cook"]
+        assert [t.insider_name for t in parse_transactions(sections["MSFT"])] == ["Satya Nadella"]
+
+    def test_no_headers(self):
+        assert split_symbol_sections("Tim Cook | CEO | Sell | 1 | 1 | 2025-01-10") == {}
+
+
+class TestParseProducts:
+    def test_parses_rows(self):
+        text = (
+            "Logitech MX Master 3S | $99.99 | 4.7 | 12,345 | yes | no\n"
+            "Basic Mouse | $9.99 |  |  | No | YES\n"
+        )
+        first, second = parse_products(text)
+        assert first.name == "Logitech MX Master 3S"
+        assert first.price == "$99.99"
+        assert first.rating == "4.7"
+        assert first.review_count == "12,345"
+        assert first.is_prime and not first.is_bestseller
+        assert second.rating is None
+        assert second.review_count is None
+        assert not second.is_prime and second.is_bestseller
+
+    def test_skips_header_row(self):
+        text = (
+            "Name | Price | Rating | Reviews | Prime (yes/no) | Best Seller (yes/no)\n"
+            "Mouse | $9.99 | 4.0 | 10 | yes | no\n"
+        )
+        assert [p.name for p in parse_products(text)] == ["Mouse"]
+
+    @pytest.mark.parametrize("row", [
+        "Mouse | $9.99 | 4.0 | 10 | yes",
+        "Mouse | $9.99",
+        "Mouse | $9.99 | 4.0 | 10 | maybe | no",
+        "Mouse | $9.99 | 4.0 | 10 | yes | no | extra",
+    ])
+    def test_skips_rows_with_wrong_columns(self, row):
+        assert parse_products(row) == []
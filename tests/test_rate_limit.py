@@ -0,0 +1,126 @@
+"""
+Tests for src.rate_limit.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.rate_limit import AdaptiveConcurrencyLimiter, AsyncRateLimiter
+
+
+async def _time_acquires(limiter: AsyncRateLimiter, count: int) -> float:
+    """Seconds taken to acquire `count` tokens one after another."""
+    start = time.monotonic()
+    for _ in range(count):
+        await limiter.acquire()
+    return time.monotonic() - start
+
+
+def test_rate_limiter_allows_initial_burst():
+    limiter = AsyncRateLimiter(max_rate=5, time_period=1)
+    assert asyncio.run(_time_acquires(limiter, 5)) < 0.1
+
+
+def test_rate_limiter_paces_once_bucket_is_empty():
+    # 5 tokens per 0.5s: 5 from the burst, then 3 more at ~0.1s each
+    limiter = AsyncRateLimiter(max_rate=5, time_period=0.5)
+    elapsed = asyncio.run(_time_acquires(limiter, 8))
+    assert 0.25 <= elapsed < 1.0
+
+
+def test_rate_limiter_paces_concurrent_callers():
+    limiter = AsyncRateLimiter(max_rate=2, time_period=0.2)
+
+    async def run() -> float:
+        start = time.monotonic()
+
+        async def one() -> None:
+            async with limiter:
+                pass
+
+        await asyncio.gather(*(one() for _ in range(4)))
+        return time.monotonic() - start
+
+    # Burst of 2, then 2 more tokens at 0.1s each
+    assert 0.18 <= asyncio.run(run()) < 0.6
+
+
+@pytest.mark.parametrize("max_rate, time_period", [(0, 1), (-1, 1), (1, 0)])
+def test_rate_limiter_rejects_non_positive_arguments(max_rate, time_period):
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(max_rate=max_rate, time_period=time_period)
+
+
+async def _complete(limiter: AdaptiveConcurrencyLimiter, count: int, overloaded: bool = False) -> None:
+    """Run `count` calls through the limiter one after another."""
+    for _ in range(count):
+        await limiter.acquire()
+        await limiter.release(overloaded=overloaded)
+
+
+def test_adaptive_limiter_grows_about_one_slot_per_window_of_successes():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=8, initial_concurrency=2)
+    # Each success adds 1/limit: 2 -> 2.5 -> 2.9 -> 3.24
+    asyncio.run(_complete(limiter, 2))
+    assert limiter.limit == 2
+    asyncio.run(_complete(limiter, 1))
+    assert limiter.limit == 3
+
+
+def test_adaptive_limiter_growth_is_capped_at_max():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=3, initial_concurrency=2)
+    asyncio.run(_complete(limiter, 50))
+    assert limiter.limit == 3
+
+
+def test_adaptive_limiter_halves_on_overload():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=16, initial_concurrency=8)
+    asyncio.run(_complete(limiter, 1, overloaded=True))
+    assert limiter.limit == 4
+    asyncio.run(_complete(limiter, 1, overloaded=True))
+    assert limiter.limit == 2
+
+
+def test_adaptive_limiter_decrease_is_floored_at_min():
+    limiter = AdaptiveConcurrencyLimiter(
+        max_concurrency=8, min_concurrency=2, initial_concurrency=4
+    )
+    asyncio.run(_complete(limiter, 5, overloaded=True))
+    assert limiter.limit == 2
+
+
+def test_adaptive_limiter_clamps_initial_concurrency():
+    assert AdaptiveConcurrencyLimiter(max_concurrency=4, initial_concurrency=10).limit == 4
+    assert AdaptiveConcurrencyLimiter(max_concurrency=4, min_concurrency=2).limit == 2
+
+
+def test_adaptive_limiter_caps_in_flight_calls():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=2, initial_concurrency=2)
+    in_flight = peak = 0
+
+    async def one() -> None:
+        nonlocal in_flight, peak
+        await limiter.acquire()
+        try:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+        finally:
+            await limiter.release()
+
+    async def run() -> None:
+        await asyncio.gather(*(one() for _ in range(6)))
+
+    asyncio.run(run())
+    assert peak == 2
+
+
+@pytest.mark.parametrize("max_concurrency, min_concurrency", [(4, 0), (1, 2)])
+def test_adaptive_limiter_rejects_invalid_bounds(max_concurrency, min_concurrency):
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(
+            max_concurrency=max_concurrency, min_concurrency=min_concurrency
+        )